@@ -0,0 +1,148 @@
+"""
+Casos de benchmark: cada função de core, de standardizer e dates.convert_to_iso_date, com entradas
+representativas de quatro distribuições:
+    clean: valores já padronizados;
+    dirty: valores com entidades HTML, pontuação, espaços extras e caracteres non printable;
+    non_ascii: valores com acentos e caracteres de outros alfabetos;
+    long: valores longos (títulos e listas extensas).
+"""
+from scielo_scholarly_data import core, standardizer
+from scielo_scholarly_data.dates import convert_to_iso_date
+
+
+DISTRIBUTIONS = ('clean', 'dirty', 'non_ascii', 'long')
+
+_LONG_TITLE = (
+    'Avaliação da qualidade da água em reservatórios do semiárido brasileiro durante o período de seca prolongada '
+    'entre 2012 e 2017: efeitos sobre a comunidade fitoplanctônica, a concentração de nutrientes e a saúde pública '
+    'das populações ribeirinhas'
+)
+
+TITLES = {
+    'clean': ['innovacion tecnologica en la resolucion de problematicas', 'zoology of the amazon basin'],
+    'dirty': [' INNOVACIÓN &amp; TECNOLÓGICA  en la resolución\t de problemáticas... ', 'Zoology (of) the  Amazon!! '],
+    'non_ascii': ['Avaliação da saúde pública no Brasil', 'Исследование здоровья населения'],
+    'long': [_LONG_TITLE, _LONG_TITLE.upper() + ' &amp; (online).'],
+}
+
+JOURNAL_TITLES = {
+    'clean': ['agrociencia uruguay', 'revista de saude publica'],
+    'dirty': ['Agrociencia &amp;   (Uruguay)', ' Rev. Saúde Pública (Online).. '],
+    'non_ascii': ['Revista de Saúde Pública', 'Ciência & Saúde Coletiva'],
+    'long': ['Revista Brasileira de Medicina Veterinária e Zootecnia e Ciências Agrárias do Semiárido (Online) '
+             'Publicação Oficial da Sociedade Brasileira de Medicina Veterinária'] * 2,
+}
+
+AUTHORS = {
+    'clean': ['silva joao', 'souza maria'],
+    'dirty': [' Silva,  João&nbsp;A. ', 'SOUZA, Maria-José.'],
+    'non_ascii': ['Gonçalves, José', 'Müller, Jürgen'],
+    'long': ['Albuquerque de Vasconcellos Cavalcanti, Maria Fernanda Rodrigues Gonçalves'] * 2,
+}
+
+ISSNS = {
+    'clean': ['1387-666X', '0034-8910'],
+    'dirty': ['1387666x', '0034 8910'],
+    'non_ascii': ['1387–666X', '００３４-８９１０'],
+    'long': ['ISSN 1387-666X (print) 1678-4464 (online)'] * 2,
+}
+
+VOLUMES = {
+    'clean': ['15', '2021'],
+    'dirty': [' .15,b ', 'v. 12'],
+    'non_ascii': ['٣', 'XIV'],
+    'long': ['Volume 15, supplement 2, part B'] * 2,
+}
+
+PAGES = {
+    'clean': ['120', '35'],
+    'dirty': ['120-10', ' p.35;40 '],
+    'non_ascii': ['１２０', 'e120'],
+    'long': ['120-130, 135-140, 145-150'] * 2,
+}
+
+DOIS = {
+    'clean': ['10.1590/1678-4766E2016006', '10.1038/nphys1170'],
+    'dirty': ['&referrer=google*url=10.1590/1678-4766E2016006', ' https://doi.org/10.1038/nphys1170. '],
+    'non_ascii': ['10.1590/São-Paulo.2020', 'doi:10.1590/ação'],
+    'long': ['https://dx.doi.org/10.1590/1678-4766E2016006?utm_source=newsletter&utm_medium=email&utm_campaign=x'] * 2,
+}
+
+DATES = {
+    'clean': ['2021-03-15', '2021'],
+    'dirty': ['15/03/2021', ' March  15, 2021 '],
+    'non_ascii': ['15 de março de 2021', 'março 2021'],
+    'long': ['15 de março de 2021, publicado originalmente em 10 de janeiro'] * 2,
+}
+
+ORCIDS = {
+    'clean': ['0000-0002-1694-233X', '0000-0002-1825-0097'],
+    'dirty': ['https://orcid.org/0000-0002-1694-233X', ' 0000-0002-1825-0097 '],
+    'non_ascii': ['０000-0002-1825-0097', 'https://orcid.org/0000-0002-1825-009７'],
+    'long': ['https://orcid.org/0000-0002-1825-0097?lang=en&source=profile&from=search'] * 2,
+}
+
+ORCID_NUMBERS = {
+    'clean': ['000000021694233X', '0000000218250097'],
+    'dirty': ['0000000218250098', '0000000218250090'],
+    'non_ascii': ['000000021694233X', '0000000218250097'],
+    'long': ['000000021694233X', '0000000218250097'],
+}
+
+ROMAN_NUMERALS = {
+    'clean': ['XIV', 'IX'],
+    'dirty': ['xiv', 'MCMXCIV'],
+    'non_ascii': ['Ⅻ', 'XIV'],
+    'long': ['MMMDCCCLXXXVIII', 'MMMCMXCIX'],
+}
+
+SPONSORS = {
+    'clean': ['conselho nacional de desenvolvimento cientifico e tecnologico', 'fapesp'],
+    'dirty': [' CNPq; FAPESP &amp; CAPES. ', 'Fundação  de Amparo à Pesquisa (FAPESP)!'],
+    'non_ascii': ['Fundação de Amparo à Pesquisa do Estado de São Paulo', 'Coordenação de Aperfeiçoamento'],
+    'long': ['; '.join(['Conselho Nacional de Desenvolvimento Científico e Tecnológico (CNPq)'] * 5)] * 2,
+}
+
+CASES = [
+    # core
+    ('core.keep_alpha_num_space', core.keep_alpha_num_space, {}, TITLES),
+    ('core.keep_alpha_space', core.keep_alpha_space, {}, TITLES),
+    ('core.remove_accents', core.remove_accents, {}, TITLES),
+    ('core.remove_double_spaces', core.remove_double_spaces, {}, TITLES),
+    ('core.remove_non_printable_chars', core.remove_non_printable_chars, {}, TITLES),
+    ('core.remove_end_punctuation_chars', core.remove_end_punctuation_chars, {}, TITLES),
+    ('core.unescape', core.unescape, {}, TITLES),
+    ('core.remove_parenthesis', core.remove_parenthesis, {}, JOURNAL_TITLES),
+    ('core.remove_chars', core.remove_chars, {'chars_to_remove': ['&', '.', '!']}, TITLES),
+    ('core.remove_words', core.remove_words, {'words_to_remove': ['de', 'of', 'the']}, TITLES),
+    ('core.order_name_and_surname', core.order_name_and_surname, {}, AUTHORS),
+    ('core.check_sum_orcid', core.check_sum_orcid, {}, ORCID_NUMBERS),
+    ('core.roman_to_int', core.roman_to_int, {}, ROMAN_NUMERALS),
+    # dates
+    ('dates.convert_to_iso_date', convert_to_iso_date, {}, DATES),
+    # standardizer
+    ('standardizer.journal_title_for_deduplication', standardizer.journal_title_for_deduplication, {}, JOURNAL_TITLES),
+    ('standardizer.journal_title_for_visualization', standardizer.journal_title_for_visualization, {}, JOURNAL_TITLES),
+    ('standardizer.journal_issn', standardizer.journal_issn, {}, ISSNS),
+    ('standardizer.journal_issn_validator', standardizer.journal_issn, {'use_issn_validator': True}, ISSNS),
+    ('standardizer.issue_volume', standardizer.issue_volume, {}, VOLUMES),
+    ('standardizer.issue_number', standardizer.issue_number, {}, VOLUMES),
+    ('standardizer.document_doi', standardizer.document_doi, {}, DOIS),
+    ('standardizer.document_title_for_deduplication', standardizer.document_title_for_deduplication, {}, TITLES),
+    ('standardizer.document_title_for_visualization', standardizer.document_title_for_visualization, {}, TITLES),
+    ('standardizer.document_first_page', standardizer.document_first_page, {}, PAGES),
+    ('standardizer.document_last_page', standardizer.document_last_page, {}, PAGES),
+    ('standardizer.document_elocation', standardizer.document_elocation, {}, PAGES),
+    ('standardizer.document_publication_date', standardizer.document_publication_date, {}, DATES),
+    ('standardizer.document_author_for_visualization', standardizer.document_author_for_visualization, {}, AUTHORS),
+    ('standardizer.document_author_for_deduplication', standardizer.document_author_for_deduplication, {}, AUTHORS),
+    ('standardizer.book_title_for_deduplication', standardizer.book_title_for_deduplication, {}, TITLES),
+    ('standardizer.book_title_for_visualization', standardizer.book_title_for_visualization, {}, TITLES),
+    ('standardizer.book_editor_name_for_visualization', standardizer.book_editor_name_for_visualization, {}, JOURNAL_TITLES),
+    ('standardizer.book_editor_name_for_deduplication', standardizer.book_editor_name_for_deduplication, {}, JOURNAL_TITLES),
+    ('standardizer.orcid_validator', standardizer.orcid_validator, {}, ORCIDS),
+    ('standardizer.document_sponsors', standardizer.document_sponsors, {}, SPONSORS),
+    ('standardizer.book_title', standardizer.book_title, {}, TITLES),
+    ('standardizer.book_editor_address', standardizer.book_editor_address, {}, JOURNAL_TITLES),
+    ('standardizer.chapter_title', standardizer.chapter_title, {}, TITLES),
+]
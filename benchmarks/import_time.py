@@ -0,0 +1,94 @@
+"""
+Benchmark do tempo de importação dos módulos do pacote em um interpretador novo, medido com python -X importtime.
+
+O tempo depende da máquina: o orçamento (IMPORT_TIME_BUDGET) serve como referência para execuções manuais e não
+faz parte dos testes unitários.
+"""
+import os
+import subprocess
+import sys
+
+
+# tempo máximo de referência, em segundos, de importação de scielo_scholarly_data.standardizer
+IMPORT_TIME_BUDGET = 0.05
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(output):
+    """
+    Lê a saída de python -X importtime.
+
+    Parameters
+    ----------
+    output : str
+        Saída de erro do interpretador.
+
+    Returns
+    -------
+    dict
+        Tempo cumulativo de importação, em segundos, por módulo.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        try:
+            times[module.strip()] = int(cumulative) / 1e6
+        except ValueError:
+            # linha de cabeçalho
+            continue
+    return times
+
+
+def measure(module='scielo_scholarly_data.standardizer', repeat=3):
+    """
+    Mede o tempo cumulativo de importação de um módulo em interpretadores novos.
+    Os arquivos .pyc são gravados normalmente (sem PYTHONDONTWRITEBYTECODE), como em um cold start real.
+
+    Parameters
+    ----------
+    module : str, default 'scielo_scholarly_data.standardizer'
+        Módulo importado.
+    repeat : int, default 3
+        Quantidade de execuções; a primeira, que pode compilar os arquivos .pyc, é descartada.
+
+    Returns
+    -------
+    dict
+        Menor tempo cumulativo, em segundos, de cada módulo importado, entre as execuções.
+    """
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONDONTWRITEBYTECODE'}
+    best = {}
+    for run in range(repeat + 1):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+        if run == 0:
+            continue
+        for name, seconds in parse_importtime(result.stderr).items():
+            best[name] = min(seconds, best.get(name, seconds))
+    return best
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Tempo de importação dos módulos do pacote.')
+    parser.add_argument('module', nargs='?', default='scielo_scholarly_data.standardizer', help='módulo importado')
+    parser.add_argument('--budget', type=float, default=IMPORT_TIME_BUDGET, help='tempo máximo, em segundos')
+    parser.add_argument('--top', type=int, default=10, help='quantidade de módulos mais lentos listados')
+    args = parser.parse_args(argv)
+
+    times = measure(args.module)
+    for name, seconds in sorted(times.items(), key=lambda item: -item[1])[:args.top]:
+        print(f'{seconds * 1000:>9.2f} ms  {name}')
+    elapsed = times[args.module]
+    print(f'# {args.module}: {elapsed * 1000:.2f} ms (orçamento: {args.budget * 1000:.0f} ms)')
+    return 0 if elapsed <= args.budget else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
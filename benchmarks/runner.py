@@ -0,0 +1,278 @@
+import json
+import os
+import platform
+import re
+import sys
+import time
+
+from benchmarks.cases import CASES
+
+
+RESULTS_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def machine_info():
+    """
+    Obtém a identificação da máquina e do interpretador em que os benchmarks são executados.
+
+    Returns
+    -------
+    dict
+        Nome da máquina, arquitetura, processador, sistema operacional e versão do Python.
+    """
+    return {
+        'node': platform.node(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'system': f'{platform.system()} {platform.release()}',
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def machine_tag(info=None):
+    """
+    Gera o identificador da máquina usado no nome do arquivo de baseline.
+
+    Parameters
+    ----------
+    info : dict, default None
+        Saída de machine_info; quando não informada, é obtida da máquina atual.
+
+    Returns
+    -------
+    str
+        Identificador no formato nome-arquitetura-pyX.Y.
+    """
+    info = info or machine_info()
+    python = '.'.join(info['python'].split('.')[:2])
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', f"{info['node']}-{info['machine']}-py{python}")
+
+
+def _call_all(function, kwargs, inputs):
+    errors = 0
+    for value in inputs:
+        try:
+            function(value, **kwargs)
+        except Exception:
+            errors += 1
+    return errors
+
+
+def _error_types(function, kwargs, inputs):
+    types = {}
+    for value in inputs:
+        try:
+            function(value, **kwargs)
+        except Exception as exc:
+            types[type(exc).__name__] = types.get(type(exc).__name__, 0) + 1
+    return types
+
+
+def time_case(function, kwargs, inputs, min_time=0.2, repeat=5):
+    """
+    Mede a latência por chamada de uma função sobre um conjunto de entradas.
+    A quantidade de iterações é calibrada para que cada medida dure ao menos min_time segundos e a melhor
+    de repeat medidas é utilizada. Exceções lançadas pela função são consideradas parte da chamada e são
+    contadas por tipo, de modo que um caso em que todas as entradas falham não passe por um caso rápido.
+
+    Parameters
+    ----------
+    function : callable
+        Função avaliada.
+    kwargs : dict
+        Argumentos nomeados da função.
+    inputs : list
+        Entradas; cada uma é passada como primeiro argumento.
+    min_time : float, default 0.2
+        Duração mínima de cada medida, em segundos.
+    repeat : int, default 5
+        Quantidade de medidas.
+
+    Returns
+    -------
+    dict
+        Latência por chamada (latency_ns), registros por segundo (records_per_second), quantidade de entradas
+        (inputs), quantidade de entradas que lançam exceção (errors) e quantidade por tipo de exceção
+        (error_types).
+    """
+    error_types = _error_types(function, kwargs, inputs)
+    errors = sum(error_types.values())
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            if _call_all(function, kwargs, inputs) != errors:
+                raise RuntimeError(f'{function.__name__}: quantidade de exceções variou entre execuções')
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed < min_time / 10 else max(2, int(min_time / max(elapsed, 1e-9)) + 1)
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            _call_all(function, kwargs, inputs)
+        best = min(best, time.perf_counter() - start)
+
+    latency = best / (number * len(inputs))
+    return {
+        'latency_ns': latency * 1e9,
+        'records_per_second': 1 / latency,
+        'inputs': len(inputs),
+        'errors': errors,
+        'error_types': error_types,
+    }
+
+
+def run(pattern=None, min_time=0.2, repeat=5, cases=CASES):
+    """
+    Executa os benchmarks.
+
+    Parameters
+    ----------
+    pattern : str, default None
+        Expressão regular aplicada ao nome dos casos; apenas os casos correspondentes são executados.
+    min_time : float, default 0.2
+        Duração mínima de cada medida, em segundos.
+    repeat : int, default 5
+        Quantidade de medidas por caso e distribuição.
+    cases : list, default CASES
+        Casos de benchmark (nome, função, argumentos nomeados, entradas por distribuição).
+
+    Returns
+    -------
+    dict
+        Identificação da máquina e resultados por caso e distribuição.
+    """
+    results = {}
+    for name, function, kwargs, inputs in cases:
+        if pattern and not re.search(pattern, name):
+            continue
+        results[name] = {
+            distribution: time_case(function, kwargs, values, min_time, repeat)
+            for distribution, values in inputs.items()
+        }
+    return {'machine': machine_info(), 'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results}
+
+
+def baseline_path(tag=None, directory=RESULTS_DIRECTORY):
+    return os.path.join(directory, f'{tag or machine_tag()}.json')
+
+
+def save(report, path=None):
+    """
+    Grava um relatório como baseline da máquina.
+
+    Parameters
+    ----------
+    report : dict
+        Saída de run.
+    path : str, default None
+        Caminho do arquivo; por padrão, results/<machine_tag>.json.
+
+    Returns
+    -------
+    str
+        Caminho do arquivo gravado.
+    """
+    path = path or baseline_path(machine_tag(report['machine']))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as fp:
+        json.dump(report, fp, indent=2, sort_keys=True)
+    return path
+
+
+def load(path):
+    with open(path, encoding='utf-8') as fp:
+        return json.load(fp)
+
+
+def compare(report, baseline):
+    """
+    Compara um relatório com uma baseline.
+
+    Parameters
+    ----------
+    report : dict
+        Saída de run.
+    baseline : dict
+        Relatório de referência.
+
+    Returns
+    -------
+    list of tuple
+        Triplas (caso, distribuição, razão entre a latência atual e a da baseline).
+    """
+    ratios = []
+    for name, distributions in report['results'].items():
+        for distribution, result in distributions.items():
+            reference = baseline['results'].get(name, {}).get(distribution)
+            if reference:
+                ratios.append((name, distribution, result['latency_ns'] / reference['latency_ns']))
+    return ratios
+
+
+def format_report(report, baseline=None):
+    """
+    Formata um relatório como tabela de texto.
+
+    Parameters
+    ----------
+    report : dict
+        Saída de run.
+    baseline : dict, default None
+        Relatório de referência; quando informado, a tabela inclui a razão de latência.
+
+    Returns
+    -------
+    str
+        Tabela com latência por chamada, registros por segundo e entradas que lançam exceção (com os tipos das
+        exceções).
+    """
+    ratios = {(n, d): r for n, d, r in compare(report, baseline)} if baseline else {}
+    lines = [f"# {machine_tag(report['machine'])} {report['created_at']}"]
+    lines.append(
+        f"{'case':<52} {'distribution':<10} {'latency (us)':>13} {'records/s':>13} {'errors':>9}"
+        + ('  vs baseline' if baseline else '')
+    )
+    for name, distributions in report['results'].items():
+        for distribution, result in distributions.items():
+            errors = f"{result.get('errors', 0)}/{result.get('inputs', '?')}"
+            line = (
+                f"{name:<52} {distribution:<10} {result['latency_ns'] / 1000:>13.3f} "
+                f"{result['records_per_second']:>13,.0f} {errors:>9}"
+            )
+            if (name, distribution) in ratios:
+                line += f'  {ratios[(name, distribution)]:>10.2f}x'
+            if result.get('error_types'):
+                line += '  ' + ', '.join(f'{t}={c}' for t, c in sorted(result['error_types'].items()))
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmarks das funções de core, standardizer e dates.')
+    parser.add_argument('-k', '--pattern', help='expressão regular para filtrar os casos pelo nome')
+    parser.add_argument('--min-time', type=float, default=0.2, help='duração mínima de cada medida (s)')
+    parser.add_argument('--repeat', type=int, default=5, help='quantidade de medidas')
+    parser.add_argument('--save', action='store_true', help='grava o resultado como baseline da máquina')
+    parser.add_argument('--compare', nargs='?', const='', metavar='PATH',
+                        help='compara com a baseline da máquina ou com o arquivo informado')
+    args = parser.parse_args(argv)
+
+    report = run(args.pattern, args.min_time, args.repeat)
+    baseline = None
+    if args.compare is not None:
+        path = args.compare or baseline_path(machine_tag(report['machine']))
+        if os.path.exists(path):
+            baseline = load(path)
+        else:
+            print(f'Baseline {path} não encontrada', file=sys.stderr)
+    print(format_report(report, baseline))
+    if args.save:
+        print(f'Baseline gravada em {save(report)}')
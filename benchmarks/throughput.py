@@ -0,0 +1,391 @@
+"""
+Benchmark de ponta a ponta: padronização de todos os campos de uma referência seguida de deduplicação, sobre um
+corpus sintético (ver scielo_scholarly_data.synthetic), com 1, 2, 4, ... N processos.
+
+Para cada quantidade de processos são reportados registros por segundo, pico de memória residente (RSS), taxa de
+acerto dos caches de valores padronizados (quando ativados, ver scielo_scholarly_data.frequency_cache) e
+eficiência paralela em relação à execução com menos processos.
+"""
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from scielo_scholarly_data import outcomes, standardizer
+from scielo_scholarly_data.authors import parse_authors
+from scielo_scholarly_data.fingerprint import FingerprintTable, document_fingerprint
+from scielo_scholarly_data.frequency_cache import tinylfu_cache
+from scielo_scholarly_data.synthetic import generate_citations
+
+from benchmarks.runner import load, machine_info, machine_tag
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+_RECORD_FIELDS = (
+    ('title_for_deduplication', 'title', standardizer.document_title_for_deduplication, {}),
+    ('title_for_visualization', 'title', standardizer.document_title_for_visualization, {}),
+    ('authors', 'authors', parse_authors, {'for_deduplication': True}),
+    ('orcid', 'orcid', standardizer.orcid_validator, {'return_mode': 'path'}),
+    ('journal_for_deduplication', 'journal', standardizer.journal_title_for_deduplication, {}),
+    ('journal_for_visualization', 'journal', standardizer.journal_title_for_visualization, {}),
+    ('issn', 'issn', standardizer.journal_issn, {'use_issn_validator': True}),
+    ('volume', 'volume', standardizer.issue_volume, {}),
+    ('number', 'number', standardizer.issue_number, {}),
+    ('first_page', 'pages', standardizer.document_first_page, {}),
+    ('last_page', 'pages', standardizer.document_last_page, {}),
+    ('publication_date', 'publication_date', standardizer.document_publication_date, {}),
+    ('doi', 'doi', standardizer.document_doi, {'return_mode': 'path'}),
+    ('sponsor', 'sponsor', standardizer.document_sponsors, {}),
+)
+
+
+def standardize_record(record, fields=_RECORD_FIELDS):
+    """
+    Padroniza todos os campos de uma referência sintética e calcula a sua impressão digital.
+    Campos ausentes ou que não podem ser padronizados resultam em None.
+
+    Parameters
+    ----------
+    record : dict
+        Registro no formato de scielo_scholarly_data.synthetic.
+    fields : tuple, default _RECORD_FIELDS
+        Quádruplas (campo padronizado, campo de origem, função padronizadora, argumentos nomeados), por exemplo,
+        a saída de cached_fields.
+
+    Returns
+    -------
+    tuple
+        Campos padronizados (dict), impressão digital (int ou None) e quantidade de campos não padronizados.
+    """
+    standardized = {}
+    errors = 0
+    for name, field, function, kwargs in fields:
+        value = record.get(field)
+        if value:
+            try:
+                value = function(value, **kwargs)
+            except Exception:
+                value = None
+            if value is None or isinstance(value, dict):
+                errors += 1
+                value = None
+        standardized[name] = value or None
+    fingerprint = document_fingerprint(
+        doi=record.get('doi'),
+        title=record.get('title'),
+        year=record.get('publication_date'),
+        first_page=record.get('pages'),
+        journal=record.get('journal'),
+    )
+    return standardized, fingerprint, errors
+
+
+def cached_fields(capacity, fields=_RECORD_FIELDS):
+    """
+    Envolve as funções padronizadoras dos campos em caches de valores padronizados com admissão por frequência
+    (ver scielo_scholarly_data.frequency_cache), um por campo.
+
+    Parameters
+    ----------
+    capacity : int
+        Quantidade máxima de valores armazenados em cada cache.
+    fields : tuple, default _RECORD_FIELDS
+        Campos no formato de standardize_record.
+
+    Returns
+    -------
+    tuple
+        Campos no formato de standardize_record, com as funções envolvidas pelos caches.
+    """
+    return tuple(
+        (name, field, tinylfu_cache(capacity, name=f'throughput.{name}')(function), kwargs)
+        for name, field, function, kwargs in fields
+    )
+
+
+def cache_info(fields):
+    """
+    Obtém acertos e falhas acumulados dos caches de valores padronizados dos campos.
+
+    Parameters
+    ----------
+    fields : tuple
+        Campos no formato de standardize_record.
+
+    Returns
+    -------
+    tuple
+        Par (hits, misses), somado entre os campos cujas funções são envolvidas por caches.
+    """
+    caches = [function.cache for _, _, function, _ in fields if hasattr(function, 'cache')]
+    return sum(cache.hits for cache in caches), sum(cache.misses for cache in caches)
+
+
+def peak_rss():
+    """
+    Obtém o pico de memória residente do processo atual, em bytes, ou None quando não disponível.
+    """
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # no macOS ru_maxrss é informado em bytes; nos demais sistemas Unix, em kilobytes
+    return maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+
+_corpus = []
+_fields = _RECORD_FIELDS
+
+
+def _init_worker(corpus, cache_capacity):
+    global _corpus, _fields
+    _corpus = corpus
+    _fields = cached_fields(cache_capacity) if cache_capacity else _RECORD_FIELDS
+    outcomes.reset()
+
+
+def _standardize_chunk(bounds):
+    start, end = bounds
+    fingerprints = []
+    errors = 0
+    for record in _corpus[start:end]:
+        _, fingerprint, record_errors = standardize_record(record, _fields)
+        fingerprints.append(fingerprint)
+        errors += record_errors
+    return os.getpid(), fingerprints, errors, cache_info(_fields), outcomes.drain(), peak_rss()
+
+
+def run_workers(corpus, workers, chunk_size=1000, cache_capacity=None):
+    """
+    Executa a padronização e a deduplicação de um corpus com um pool de processos.
+    Os registros são padronizados nos processos do pool em blocos de chunk_size registros e as impressões
+    digitais são agrupadas no processo principal com FingerprintTable. O tempo medido inclui a distribuição dos
+    blocos, a padronização e a deduplicação, mas não a criação do pool.
+
+    Parameters
+    ----------
+    corpus : list of dict
+        Registros no formato de scielo_scholarly_data.synthetic.
+    workers : int
+        Quantidade de processos.
+    chunk_size : int, default 1000
+        Quantidade de registros por tarefa.
+    cache_capacity : int, default None
+        Capacidade do cache de valores padronizados de cada campo em cada processo (ver cached_fields); quando
+        None, os campos são padronizados sem cache.
+
+    Returns
+    -------
+    dict
+        Registros por segundo, tempo total, pico de RSS (maior processo e soma dos processos), taxa de acerto
+        dos caches de valores padronizados (None sem cache), campos não padronizados, contadores de resultados (ver scielo_scholarly_data.outcomes),
+        registros distintos e grupos de duplicatas.
+    """
+    bounds = [(start, min(start + chunk_size, len(corpus))) for start in range(0, len(corpus), chunk_size)]
+    table = FingerprintTable()
+    errors = 0
+    caches = {}
+    counts = []
+    rss = {}
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(corpus, cache_capacity)) as pool:
+        start = time.perf_counter()
+        for pid, fingerprints, chunk_errors, chunk_caches, chunk_counts, chunk_rss in pool.imap_unordered(
+                _standardize_chunk, bounds):
+            for fingerprint in fingerprints:
+                if fingerprint is not None:
+                    table.add(fingerprint)
+            errors += chunk_errors
+            # os contadores de cada processo são cumulativos: prevalece o último bloco processado
+            caches[pid] = chunk_caches
+            counts.append(chunk_counts)
+            rss[pid] = max(rss.get(pid, 0), chunk_rss or 0)
+        groups = sum(1 for _ in table.duplicate_groups())
+        elapsed = time.perf_counter() - start
+
+    hits = sum(h for h, _ in caches.values())
+    misses = sum(m for _, m in caches.values())
+    return {
+        'workers': workers,
+        'records': len(corpus),
+        'seconds': elapsed,
+        'records_per_second': len(corpus) / elapsed if elapsed else 0.0,
+        'peak_rss_worker_bytes': max(rss.values()) if rss else None,
+        'peak_rss_total_bytes': (sum(rss.values()) + (peak_rss() or 0)) if rss else None,
+        'cache_hits': hits,
+        'cache_misses': misses,
+        'cache_hit_rate': hits / (hits + misses) if hits + misses else None,
+        'field_errors': errors,
+        'outcomes': outcomes.combine(counts),
+        'distinct_records': table.distinct,
+        'duplicate_groups': groups,
+    }
+
+
+def worker_counts(maximum=None):
+    """
+    Gera a sequência 1, 2, 4, ... de quantidades de processos até maximum (incluído).
+
+    Parameters
+    ----------
+    maximum : int, default None
+        Quantidade máxima de processos; por padrão, a quantidade de CPUs.
+
+    Returns
+    -------
+    list of int
+    """
+    maximum = maximum or os.cpu_count() or 1
+    counts = []
+    count = 1
+    while count < maximum:
+        counts.append(count)
+        count *= 2
+    counts.append(maximum)
+    return counts
+
+
+def run(records=20000, workers=None, chunk_size=1000, seed=1, cache_capacity=None):
+    """
+    Executa o benchmark de ponta a ponta para cada quantidade de processos.
+    A eficiência paralela de cada execução é a razão entre o ganho de vazão e o aumento da quantidade de processos
+    em relação à execução com menos processos.
+
+    Parameters
+    ----------
+    records : int, default 20000
+        Quantidade de registros do corpus sintético.
+    workers : list of int, default None
+        Quantidades de processos; por padrão, 1, 2, 4, ... até a quantidade de CPUs.
+    chunk_size : int, default 1000
+        Quantidade de registros por tarefa.
+    seed : int, default 1
+        Semente do gerador do corpus.
+    cache_capacity : int, default None
+        Capacidade do cache de valores padronizados de cada campo (ver run_workers).
+
+    Returns
+    -------
+    dict
+        Identificação da máquina, parâmetros e resultados por quantidade de processos.
+    """
+    corpus = list(generate_citations(records, seed=seed))
+    results = [run_workers(corpus, count, chunk_size, cache_capacity) for count in sorted(set(workers or worker_counts()))]
+    reference = results[0]
+    for result in results:
+        speedup = result['records_per_second'] / reference['records_per_second'] if reference['records_per_second'] else 0.0
+        result['speedup'] = speedup
+        result['parallel_efficiency'] = speedup * reference['workers'] / result['workers']
+    return {
+        'machine': machine_info(),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'parameters': {'records': records, 'chunk_size': chunk_size, 'seed': seed, 'cache_capacity': cache_capacity},
+        'results': results,
+    }
+
+
+def compare(report, baseline):
+    """
+    Compara a vazão de um relatório com a de uma baseline, para as mesmas quantidades de processos.
+
+    Parameters
+    ----------
+    report : dict
+        Saída de run.
+    baseline : dict
+        Relatório de referência.
+
+    Returns
+    -------
+    dict
+        Razão entre a vazão atual e a da baseline, por quantidade de processos.
+    """
+    reference = {result['workers']: result['records_per_second'] for result in baseline['results']}
+    return {
+        result['workers']: result['records_per_second'] / reference[result['workers']]
+        for result in report['results']
+        if reference.get(result['workers'])
+    }
+
+
+def _megabytes(value):
+    return f'{value / 2 ** 20:>10.1f}' if value is not None else f'{"-":>10}'
+
+
+def format_report(report, baseline=None):
+    """
+    Formata um relatório como tabela de texto.
+
+    Parameters
+    ----------
+    report : dict
+        Saída de run.
+    baseline : dict, default None
+        Relatório de referência; quando informado, a tabela inclui a razão de vazão.
+
+    Returns
+    -------
+    str
+        Tabela com vazão, pico de RSS, taxa de acerto dos caches e eficiência paralela por quantidade de processos.
+    """
+    ratios = compare(report, baseline) if baseline else {}
+    parameters = report['parameters']
+    lines = [
+        f"# {machine_tag(report['machine'])} {report['created_at']} "
+        f"records={parameters['records']} chunk_size={parameters['chunk_size']} seed={parameters['seed']} "
+        f"cache_capacity={parameters.get('cache_capacity')}",
+        f"{'workers':>7} {'records/s':>12} {'speedup':>8} {'efficiency':>10} {'rss max MB':>10} {'rss sum MB':>10} "
+        f"{'cache hits':>10}" + ('  vs baseline' if baseline else ''),
+    ]
+    for result in report['results']:
+        hit_rate = result.get('cache_hit_rate')
+        line = (
+            f"{result['workers']:>7} {result['records_per_second']:>12,.0f} {result['speedup']:>7.2f}x "
+            f"{result['parallel_efficiency']:>10.1%} {_megabytes(result['peak_rss_worker_bytes'])} "
+            f"{_megabytes(result['peak_rss_total_bytes'])} "
+            + (f'{hit_rate:>10.2%}' if hit_rate is not None else f'{"-":>10}')
+        )
+        if result['workers'] in ratios:
+            line += f"  {ratios[result['workers']]:>10.2f}x"
+        lines.append(line)
+    if report['results']:
+        last = report['results'][-1]
+        lines.append(f"# distinct records: {last['distinct_records']:,}, duplicate groups: {last['duplicate_groups']:,}, "
+                     f"fields not standardized: {last['field_errors']:,}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark de ponta a ponta de padronização e deduplicação.')
+    parser.add_argument('-n', '--records', type=int, default=20000, help='quantidade de registros do corpus')
+    parser.add_argument('-w', '--workers', help='quantidades de processos separadas por vírgula (padrão: 1, 2, 4, ... CPUs)')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='quantidade de registros por tarefa')
+    parser.add_argument('--seed', type=int, default=1, help='semente do gerador do corpus')
+    parser.add_argument('--cache-capacity', type=int, help='capacidade do cache TinyLFU de valores padronizados de '
+                                                           'cada campo (padrão: sem cache)')
+    parser.add_argument('--json', metavar='PATH', help='grava o relatório em JSON no arquivo informado')
+    parser.add_argument('--compare', metavar='PATH', help='compara com um relatório JSON gravado anteriormente')
+    args = parser.parse_args(argv)
+
+    workers = [int(count) for count in args.workers.split(',')] if args.workers else None
+    report = run(args.records, workers, args.chunk_size, args.seed, args.cache_capacity)
+    baseline = None
+    if args.compare:
+        if os.path.exists(args.compare):
+            baseline = load(args.compare)
+        else:
+            print(f'Baseline {args.compare} não encontrada', file=sys.stderr)
+    print(format_report(report, baseline))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as fp:
+            json.dump(report, fp, indent=2, sort_keys=True)
+        print(f'Relatório gravado em {args.json}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+"""
+Padronização de registros em serviços asyncio.
+
+As funções padronizadoras são síncronas e consomem CPU: chamadas diretamente em uma corrotina, bloqueiam o
+laço de eventos durante todo o lote. standardize_stream consome um iterador assíncrono de registros, agrupa-os em
+lotes, executa cada lote em um executor (threads ou processos) e devolve os resultados como um iterador
+assíncrono, na ordem dos registros:
+
+    async for result in standardize_stream(records_from_queue(), standardize_record, executor=pool):
+        await publish(result)
+
+A quantidade de lotes em execução é limitada por max_in_flight: enquanto o limite está atingido, nenhum registro
+novo é lido da origem, de modo que a pressão é repassada ao produtor (por exemplo, uma asyncio.Queue com maxsize
+bloqueia em put). Cada lote é devolvido assim que termina e todos os anteriores foram devolvidos, e um lote
+incompleto é enviado ao executor depois de flush_interval segundos, de modo que os resultados de uma origem que
+nunca termina (por exemplo, uma fila de mensagens com pouco tráfego) não ficam retidos.
+"""
+import asyncio
+
+from collections import deque
+
+
+ASYNC_CHUNK_SIZE = 500
+
+ASYNC_MAX_IN_FLIGHT = 4
+
+ASYNC_FLUSH_INTERVAL = 0.1
+
+
+def _standardize_chunk(function, chunk):
+    return [function(record) for record in chunk]
+
+
+async def standardize_stream(records, function, executor=None, chunk_size=ASYNC_CHUNK_SIZE,
+                             max_in_flight=ASYNC_MAX_IN_FLIGHT, flush_interval=ASYNC_FLUSH_INTERVAL):
+    """
+    Padroniza um fluxo assíncrono de registros em um executor, sem bloquear o laço de eventos.
+
+    Parameters
+    ----------
+    records : async iterable
+        Registros de entrada.
+    function : callable
+        Função que recebe um registro e devolve o resultado padronizado. Com um ProcessPoolExecutor, a função
+        e os registros devem ser serializáveis com pickle (a função deve ser definida no nível de um módulo).
+    executor : concurrent.futures.Executor, default None
+        Executor dos lotes; quando não informado, o executor padrão do laço de eventos (threads).
+    chunk_size : int, default ASYNC_CHUNK_SIZE
+        Quantidade de registros por lote.
+    max_in_flight : int, default ASYNC_MAX_IN_FLIGHT
+        Quantidade máxima de lotes enviados ao executor e ainda não consumidos.
+    flush_interval : float, default ASYNC_FLUSH_INTERVAL
+        Tempo máximo, em segundos, entre a leitura do primeiro registro de um lote e o seu envio ao executor,
+        mesmo incompleto. O último lote é enviado quando a origem termina.
+
+    Returns
+    -------
+    async generator
+        Resultados padronizados, na ordem de records. Uma exceção lançada pela função é propagada quando o
+        resultado do seu lote é consumido; os lotes pendentes são então cancelados.
+
+    Exemplo:
+        async for issn in standardize_stream(issns(), journal_issn, chunk_size=100):
+            print(issn)
+    """
+    if chunk_size < 1 or max_in_flight < 1:
+        raise ValueError('chunk_size e max_in_flight devem ser maiores que zero')
+    if flush_interval <= 0:
+        raise ValueError('flush_interval deve ser maior que zero')
+    loop = asyncio.get_running_loop()
+    iterator = records.__aiter__()
+    pending = deque()
+    chunk = []
+    deadline = None
+    # a leitura do próximo registro é uma tarefa mantida entre as esperas: cancelá-la ao fim do prazo de um lote
+    # encerraria a origem quando ela é um gerador assíncrono
+    next_record = None
+    exhausted = False
+    try:
+        while True:
+            while pending and pending[0].done():
+                for result in pending.popleft().result():
+                    yield result
+            if exhausted:
+                if chunk:
+                    pending.append(loop.run_in_executor(executor, _standardize_chunk, function, chunk))
+                    chunk = []
+                if not pending:
+                    return
+                for result in await pending.popleft():
+                    yield result
+                continue
+            if len(pending) >= max_in_flight:
+                for result in await pending.popleft():
+                    yield result
+                continue
+
+            if next_record is None:
+                next_record = asyncio.ensure_future(iterator.__anext__())
+            waiting = {next_record, pending[0]} if pending else {next_record}
+            timeout = max(0.0, deadline - loop.time()) if chunk else None
+            done, _ = await asyncio.wait(waiting, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if next_record in done:
+                task, next_record = next_record, None
+                try:
+                    record = task.result()
+                except StopAsyncIteration:
+                    exhausted = True
+                    continue
+                if not chunk:
+                    deadline = loop.time() + flush_interval
+                chunk.append(record)
+                if len(chunk) < chunk_size:
+                    continue
+            elif not chunk or loop.time() < deadline:
+                continue
+            pending.append(loop.run_in_executor(executor, _standardize_chunk, function, chunk))
+            chunk = []
+    finally:
+        if next_record is not None:
+            next_record.cancel()
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,387 @@
+import bisect
+import csv
+import mmap
+
+from array import array
+from collections import Counter
+
+from scielo_scholarly_data.core import remove_accents
+from scielo_scholarly_data.fingerprint import text_fingerprint
+from scielo_scholarly_data.standardizer import (
+    book_editor_address,
+    book_editor_name_for_deduplication,
+    book_title,
+    chapter_title,
+)
+
+
+AUTHORITY_FORMAT_VERSION = 1
+
+AUTHORITY_MAGIC = b'SSDAUTH\x00'
+
+_HEADER_SIZE = 8
+
+
+class InvalidAuthorityFileError(Exception):
+    ...
+
+
+def _grams(key, q):
+    padded = f' {key} '
+    return {padded[i:i + q] for i in range(max(len(padded) - q + 1, 1))}
+
+
+def _padding(size):
+    return b'\x00' * (-size % 8)
+
+
+def _comparison_key(text):
+    return remove_accents(text).lower() if text else ''
+
+
+def book_title_key(text):
+    """
+    Gera a chave de um título de livro para build_authority_index e AuthorityIndex: título padronizado por
+    book_title, em caixa baixa e sem acentos.
+
+    Parameters
+    ----------
+    text : str
+        Título do livro.
+
+    Returns
+    -------
+    str
+        Chave do título.
+
+    Exemplo:
+        book_title_key('Saúde &amp; Sociedade.') == 'saude & sociedade'
+    """
+    return _comparison_key(book_title(text))
+
+
+def book_editor_address_key(text):
+    """
+    Gera a chave de um local de publicação para build_authority_index e AuthorityIndex: local padronizado por
+    book_editor_address, em caixa baixa e sem acentos.
+
+    Parameters
+    ----------
+    text : str
+        Local de publicação.
+
+    Returns
+    -------
+    str
+        Chave do local de publicação.
+
+    Exemplo:
+        book_editor_address_key('[São Paulo] :') == 'sao paulo'
+    """
+    return _comparison_key(book_editor_address(text))
+
+
+def chapter_title_key(text):
+    """
+    Gera a chave de um título de capítulo para build_authority_index e AuthorityIndex: título padronizado por
+    chapter_title, em caixa baixa e sem acentos.
+
+    Parameters
+    ----------
+    text : str
+        Título do capítulo.
+
+    Returns
+    -------
+    str
+        Chave do título.
+    """
+    return _comparison_key(chapter_title(text))
+
+
+def read_authority_csv(path, delimiter=';'):
+    """
+    Lê uma lista de autoridades em CSV: cada linha contém o nome canônico seguido das suas variantes.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo CSV.
+    delimiter : str, default ';'
+        Separador de colunas do arquivo.
+
+    Returns
+    -------
+    generator of tuple
+        Pares (nome canônico, lista de variantes).
+    """
+    with open(path, encoding='utf-8-sig', newline='') as fp:
+        for row in csv.reader(fp, delimiter=delimiter):
+            row = [c.strip() for c in row if c.strip()]
+            if row:
+                yield row[0], row[1:]
+
+
+def build_authority_index(entries, path, key=book_editor_name_for_deduplication, q=3):
+    """
+    Compila um índice de autoridades (por exemplo, editoras) em um arquivo binário que pode ser mapeado em memória
+    (ver load_authority_index), de modo que vários processos compartilhem uma única cópia do índice.
+    O arquivo contém as chaves padronizadas de todas as variantes, ordenadas pelo seu hash, para a busca exata,
+    e um índice invertido de q-gramas das chaves para a busca aproximada.
+    Para chaves repetidas prevalece a primeira entrada.
+
+    Parameters
+    ----------
+    entries : iterable of tuple
+        Pares (nome canônico, lista de variantes), por exemplo, a saída de read_authority_csv.
+    path : str
+        Caminho do arquivo binário.
+    key : callable, default book_editor_name_for_deduplication
+        Função que gera a chave padronizada de um nome: book_editor_name_for_deduplication para editoras,
+        book_editor_address_key para locais de publicação, book_title_key ou chapter_title_key para títulos.
+    q : int, default 3
+        Tamanho dos q-gramas.
+
+    Returns
+    -------
+    int
+        Quantidade de chaves distintas indexadas.
+    """
+    canonical_names = []
+    key_canonical = {}
+    for canonical, variants in entries:
+        canonical_id = len(canonical_names)
+        canonical_names.append(canonical)
+        for name in [canonical, *variants]:
+            name_key = key(name)
+            if name_key:
+                key_canonical.setdefault(name_key, canonical_id)
+
+    keys = sorted(key_canonical, key=lambda k: (text_fingerprint(k), k))
+    gram_postings = {}
+    gram_counts = array('I')
+    for key_id, name_key in enumerate(keys):
+        grams = _grams(name_key, q)
+        gram_counts.append(len(grams))
+        for gram in grams:
+            gram_postings.setdefault(text_fingerprint(gram), array('I')).append(key_id)
+    gram_hashes = sorted(gram_postings)
+
+    canonical_blob = bytearray()
+    canonical_offsets = array('Q', [0])
+    for name in canonical_names:
+        canonical_blob += name.encode('utf-8')
+        canonical_offsets.append(len(canonical_blob))
+
+    key_blob = bytearray()
+    key_offsets = array('Q', [0])
+    for name_key in keys:
+        key_blob += name_key.encode('utf-8')
+        key_offsets.append(len(key_blob))
+
+    gram_offsets = array('Q', [0])
+    postings = array('I')
+    for gram_hash in gram_hashes:
+        postings.extend(gram_postings[gram_hash])
+        gram_offsets.append(len(postings))
+
+    header = array('Q', [
+        AUTHORITY_FORMAT_VERSION, q, len(canonical_names), len(keys), len(gram_hashes), len(postings),
+        len(canonical_blob), len(key_blob),
+    ])
+    sections = [
+        canonical_offsets.tobytes(),
+        bytes(canonical_blob),
+        array('Q', (text_fingerprint(k) for k in keys)).tobytes(),
+        array('I', (key_canonical[k] for k in keys)).tobytes(),
+        key_offsets.tobytes(),
+        bytes(key_blob),
+        gram_counts.tobytes(),
+        array('Q', gram_hashes).tobytes(),
+        gram_offsets.tobytes(),
+        postings.tobytes(),
+    ]
+    with open(path, 'wb') as fp:
+        fp.write(AUTHORITY_MAGIC)
+        fp.write(header.tobytes())
+        for section in sections:
+            fp.write(section)
+            fp.write(_padding(len(section)))
+    return len(keys)
+
+
+class AuthorityIndex:
+    """
+    Índice de autoridades mapeado em memória (ver build_authority_index e load_authority_index).
+    A busca é feita em duas etapas: busca exata pelo hash da chave padronizada e, quando não há correspondência,
+    busca aproximada pelos q-gramas da chave, com o coeficiente de Dice como similaridade.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        Conteúdo do arquivo compilado (em geral, um mmap).
+    key : callable, default book_editor_name_for_deduplication
+        Função que gera a chave padronizada de um nome. Deve ser a mesma utilizada na compilação do índice.
+    """
+
+    def __init__(self, buffer, key=book_editor_name_for_deduplication):
+        offset = len(AUTHORITY_MAGIC) + 8 * _HEADER_SIZE
+        if len(buffer) < offset or buffer[:len(AUTHORITY_MAGIC)] != AUTHORITY_MAGIC:
+            raise InvalidAuthorityFileError('Conteúdo não é um índice de autoridades compilado')
+        header = array('Q', buffer[len(AUTHORITY_MAGIC):offset])
+        version, self.q, n_canonical, n_keys, n_grams, n_postings, canonical_size, key_size = header
+        if version != AUTHORITY_FORMAT_VERSION:
+            raise InvalidAuthorityFileError(f'Versão {version} de índice de autoridades não suportada')
+        expected_size = offset + sum(size + (-size % 8) for size in (
+            8 * (n_canonical + 1), canonical_size, 8 * n_keys, 4 * n_keys, 8 * (n_keys + 1), key_size,
+            4 * n_keys, 8 * n_grams, 8 * (n_grams + 1), 4 * n_postings,
+        ))
+        if len(buffer) != expected_size:
+            raise InvalidAuthorityFileError('Tamanho do índice de autoridades compilado inválido')
+
+        self.key = key
+        self._buffer = buffer
+        view = memoryview(buffer)
+
+        def section(size, fmt=None):
+            nonlocal offset
+            data = view[offset:offset + size]
+            offset += size + (-size % 8)
+            return data.cast(fmt) if fmt else data
+
+        self._canonical_offsets = section(8 * (n_canonical + 1), 'Q')
+        self._canonical_blob = section(canonical_size)
+        self._key_hashes = section(8 * n_keys, 'Q')
+        self._key_canonical = section(4 * n_keys, 'I')
+        self._key_offsets = section(8 * (n_keys + 1), 'Q')
+        self._key_blob = section(key_size)
+        self._gram_counts = section(4 * n_keys, 'I')
+        self._gram_hashes = section(8 * n_grams, 'Q')
+        self._gram_offsets = section(8 * (n_grams + 1), 'Q')
+        self._postings = section(4 * n_postings, 'I')
+        self._views = [view, self._canonical_offsets, self._canonical_blob, self._key_hashes,
+                       self._key_canonical, self._key_offsets, self._key_blob, self._gram_counts,
+                       self._gram_hashes, self._gram_offsets, self._postings]
+
+    def __len__(self):
+        return len(self._key_hashes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Libera as visões sobre o arquivo e fecha o mapeamento em memória."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def canonical_name(self, canonical_id):
+        """
+        Obtém um nome canônico pelo seu identificador.
+
+        Parameters
+        ----------
+        canonical_id : int
+            Identificador do nome canônico.
+
+        Returns
+        -------
+        str
+            Nome canônico.
+        """
+        start, end = self._canonical_offsets[canonical_id], self._canonical_offsets[canonical_id + 1]
+        return bytes(self._canonical_blob[start:end]).decode('utf-8')
+
+    def _key(self, key_id):
+        start, end = self._key_offsets[key_id], self._key_offsets[key_id + 1]
+        return bytes(self._key_blob[start:end]).decode('utf-8')
+
+    def _exact(self, name_key):
+        key_hash = text_fingerprint(name_key)
+        key_id = bisect.bisect_left(self._key_hashes, key_hash)
+        while key_id < len(self._key_hashes) and self._key_hashes[key_id] == key_hash:
+            if self._key(key_id) == name_key:
+                return key_id
+            key_id += 1
+
+    def _fuzzy(self, name_key, threshold):
+        grams = _grams(name_key, self.q)
+        counts = Counter()
+        for gram in grams:
+            gram_hash = text_fingerprint(gram)
+            position = bisect.bisect_left(self._gram_hashes, gram_hash)
+            if position < len(self._gram_hashes) and self._gram_hashes[position] == gram_hash:
+                counts.update(self._postings[self._gram_offsets[position]:self._gram_offsets[position + 1]])
+        # em caso de empate prevalece a menor chave na ordem do arquivo, que não depende da ordem de iteração
+        best_id, best_score = None, threshold
+        for key_id, shared in counts.items():
+            score = 2 * shared / (len(grams) + self._gram_counts[key_id])
+            if score > best_score or (score == best_score and (best_id is None or key_id < best_id)):
+                best_id, best_score = key_id, score
+        return best_id, best_score
+
+    def lookup(self, text, threshold=0.8):
+        """
+        Obtém o nome canônico correspondente a um nome.
+
+        Parameters
+        ----------
+        text : str
+            Nome a ser resolvido, por exemplo, o nome de uma editora.
+        threshold : float, default 0.8
+            Similaridade mínima da busca aproximada. Quando None, apenas a busca exata é realizada.
+
+        Returns
+        -------
+        tuple or None
+            Par (nome canônico, similaridade), com similaridade 1.0 para correspondências exatas,
+            ou None quando não há correspondência.
+
+        Exemplo:
+            index.lookup('Ed. Fiocruz') == ('Editora Fiocruz', 1.0)
+        """
+        name_key = self.key(text) if text else ''
+        if not name_key:
+            return None
+        key_id = self._exact(name_key)
+        if key_id is not None:
+            return self.canonical_name(self._key_canonical[key_id]), 1.0
+        if threshold is None:
+            return None
+        key_id, score = self._fuzzy(name_key, threshold)
+        if key_id is not None:
+            return self.canonical_name(self._key_canonical[key_id]), score
+
+
+def load_authority_index(path, key=book_editor_name_for_deduplication):
+    """
+    Carrega um índice de autoridades compilado por build_authority_index, mapeando o arquivo em memória
+    em modo somente leitura. As páginas do arquivo são compartilhadas entre os processos que o carregam.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo binário.
+    key : callable, default book_editor_name_for_deduplication
+        Função que gera a chave padronizada de um nome. Deve ser a mesma utilizada na compilação do índice.
+
+    Returns
+    -------
+    AuthorityIndex
+        Índice de autoridades.
+    """
+    with open(path, 'rb') as fp:
+        try:
+            buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:
+            raise InvalidAuthorityFileError(f"{exc}: Arquivo {path} não contém um índice de autoridades compilado")
+    try:
+        return AuthorityIndex(buffer, key)
+    except InvalidAuthorityFileError as exc:
+        buffer.close()
+        raise InvalidAuthorityFileError(f"{exc}: {path}")
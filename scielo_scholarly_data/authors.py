@@ -0,0 +1,167 @@
+import sys
+
+from collections import namedtuple
+
+from scielo_scholarly_data.core import remove_accents
+from scielo_scholarly_data.pipeline import compile_pipeline
+from scielo_scholarly_data.values import (
+    _PATTERN_AUTHOR_SEPARATORS,
+    PERSON_NAME_PARTICLES,
+    PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_PARSING,
+)
+
+
+AuthorName = namedtuple('AuthorName', ['surname', 'given_names', 'initials', 'particle'])
+
+_AUTHOR_NAME = compile_pipeline([
+    'unescape',
+    'remove_non_printable_chars',
+    ('keep_alpha_space', {'keep_chars': PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_PARSING}),
+    'remove_double_spaces',
+])
+
+
+def _tokens(text):
+    tokens = []
+    for token in text.split():
+        token = token.strip("-'")
+        if token:
+            tokens.append(token)
+    return tokens
+
+
+def _is_initials(token):
+    return len(token) <= 3 and token.isupper()
+
+
+def _initials(tokens):
+    initials = []
+    for token in tokens:
+        for part in token.split('-'):
+            if part:
+                initials.append(part[0].upper())
+    return ''.join(initials)
+
+
+def _split_particle(tokens):
+    i = 0
+    while i < len(tokens) - 1 and tokens[i].lower() in PERSON_NAME_PARTICLES:
+        i += 1
+    return tokens[:i], tokens[i:]
+
+
+def parse_author_name(text, for_deduplication=False):
+    """
+    Função para decompor um nome de autor em sobrenome, prenomes, iniciais e partícula.
+    Reconhece as formas "Sobrenome, Prenomes", "Prenomes Sobrenome" e "Sobrenome INICIAIS" (Vancouver),
+    mantendo partículas como "da", "dos" e "van der" separadas do sobrenome.
+
+    Parameters
+    ----------
+    text : str
+        Nome do autor a ser decomposto.
+    for_deduplication : bool, default False
+        Valor lógico que indica se os campos devem ser convertidos para caixa baixa e sem acentos.
+
+    Returns
+    -------
+    AuthorName or None
+        Tupla (surname, given_names, initials, particle) ou None caso o nome seja vazio.
+    """
+    text = _AUTHOR_NAME(text.replace('.', ' '))
+    if not text:
+        return
+
+    initials = None
+    if ',' in text:
+        surname_part, _, given_part = text.partition(',')
+        particle_tokens, surname_tokens = _split_particle(_tokens(surname_part))
+        given_tokens = _tokens(given_part.replace(',', ' '))
+        while given_tokens and given_tokens[-1].lower() in PERSON_NAME_PARTICLES:
+            particle_tokens.insert(0, given_tokens.pop())
+    else:
+        tokens = _tokens(text)
+        last = len(tokens) - 1
+        if last > 0 and _is_initials(tokens[last]) and not _is_initials(tokens[0]):
+            particle_tokens, surname_tokens = _split_particle(tokens[:last])
+            given_tokens = []
+            initials = tokens[last]
+        else:
+            i = last
+            while i > 1 and tokens[i - 1].lower() in PERSON_NAME_PARTICLES:
+                i -= 1
+            if i == 1 and tokens[0].lower() in PERSON_NAME_PARTICLES:
+                i = 0
+            given_tokens, particle_tokens, surname_tokens = tokens[:i], tokens[i:last], tokens[last:]
+
+    if not surname_tokens and not given_tokens:
+        return
+    if not surname_tokens:
+        surname_tokens, given_tokens = given_tokens, []
+    if initials is None:
+        initials = _initials(given_tokens)
+
+    surname = ' '.join(surname_tokens)
+    given_names = ' '.join(given_tokens)
+    particle = ' '.join(particle_tokens)
+    if for_deduplication:
+        surname = remove_accents(surname).lower()
+        given_names = remove_accents(given_names).lower()
+        initials = remove_accents(initials).lower()
+        particle = particle.lower()
+    return AuthorName(sys.intern(surname), given_names, initials, sys.intern(particle))
+
+
+def parse_authors(text, for_deduplication=False):
+    """
+    Função para separar uma lista de autores pelos separadores ';', ' & ', ' and ' e ' e '
+    e decompor cada nome com parse_author_name.
+
+    Parameters
+    ----------
+    text : str
+        Lista de autores.
+    for_deduplication : bool, default False
+        Valor lógico que indica se os campos devem ser convertidos para caixa baixa e sem acentos.
+
+    Returns
+    -------
+    list of AuthorName
+        Nomes decompostos, na ordem em que aparecem em text.
+
+    Exemplo:
+        parse_authors('Silva, João da; Maria van der Berg')
+        [AuthorName(surname='Silva', given_names='João', initials='J', particle='da'),
+         AuthorName(surname='Berg', given_names='Maria', initials='M', particle='van der')]
+    """
+    authors = []
+    for name in _PATTERN_AUTHOR_SEPARATORS.split(text):
+        author = parse_author_name(name, for_deduplication)
+        if author is not None:
+            authors.append(author)
+    return authors
+
+
+def format_author_name(author, surname_first=True):
+    """
+    Função para recompor um nome decomposto por parse_author_name.
+
+    Parameters
+    ----------
+    author : AuthorName
+        Nome decomposto.
+    surname_first : bool, default True
+        Valor lógico que indica a posição do sobrenome na saída.
+
+    Returns
+    -------
+    str
+        Nome completo recomposto, com a partícula junto ao sobrenome.
+    """
+    surname = ' '.join(p for p in (author.particle, author.surname) if p)
+    given_names = author.given_names or author.initials
+    if not given_names:
+        return surname
+    if surname_first:
+        return ''.join([surname, ', ', given_names])
+    return ''.join([given_names, ' ', surname])
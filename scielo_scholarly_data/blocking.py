@@ -0,0 +1,172 @@
+from itertools import combinations
+
+from scielo_scholarly_data.standardizer import (
+    document_author_for_deduplication,
+    orcid_validator,
+)
+from scielo_scholarly_data.values import _PHONETIC_RULES_PT_ES
+
+
+KEY_PREFIX_ORCID = 'o:'
+KEY_PREFIX_NAME = 'n:'
+KEY_PREFIX_PHONETIC = 'p:'
+
+
+def phonetic_code(text):
+    """
+    Função para obter um código fonético de um sobrenome, ajustado à grafia do português e do espanhol.
+    Dígrafos e letras de mesmo som são unificados (por exemplo, "z" e "c" antes de "e" ou "i" tornam-se "s"),
+    letras repetidas são colapsadas e as vogais após a primeira letra são removidas.
+
+    Parameters
+    ----------
+    text : str
+        Sobrenome em caixa baixa e sem acentos.
+
+    Returns
+    -------
+    str
+        Código fonético do sobrenome.
+
+    Exemplo:
+        phonetic_code('rodrigues') == phonetic_code('rodriguez')
+    """
+    text = ''.join(c for c in text if c.isalpha())
+    for pattern, replace_with in _PHONETIC_RULES_PT_ES:
+        text = pattern.sub(replace_with, text)
+    if not text:
+        return text
+
+    code = [text[0]]
+    previous = text[0]
+    for c in text[1:]:
+        if c != previous and c not in 'aeiou':
+            code.append(c)
+        previous = c
+    return ''.join(code)
+
+
+def author_blocking_keys(name, orcid=None):
+    """
+    Função para gerar as chaves de blocagem de um nome de autor, a partir de document_author_for_deduplication:
+        1. ORCID, quando válido segundo orcid_validator;
+        2. Sobrenome e inicial do primeiro prenome;
+        3. Código fonético do sobrenome.
+
+    Parameters
+    ----------
+    name : str
+        Nome do autor.
+    orcid : str, default None
+        Registro ORCID do autor.
+
+    Returns
+    -------
+    tuple of str
+        Chaves de blocagem do autor, sempre na ordem ORCID, nome e código fonético.
+    """
+    keys = []
+    if orcid:
+        orcid_path = orcid_validator(orcid, return_mode='path')
+        if isinstance(orcid_path, str):
+            keys.append(KEY_PREFIX_ORCID + orcid_path.upper())
+
+    surname, _, given_names = document_author_for_deduplication(name).partition(', ')
+    surname = surname.strip()
+    if surname:
+        keys.append(KEY_PREFIX_NAME + ' '.join([surname, given_names[:1]]).strip())
+        code = phonetic_code(surname)
+        if code:
+            keys.append(KEY_PREFIX_PHONETIC + code)
+    return tuple(keys)
+
+
+class BlockingIndex:
+    """
+    Índice invertido em memória de chaves de blocagem para nomes de autores.
+    Cada registro é adicionado aos blocos de suas chaves e os pares candidatos são gerados apenas dentro dos blocos,
+    evitando a comparação de todos os pares de registros.
+
+    Parameters
+    ----------
+    max_block_size : int, default None
+        Tamanho máximo de um bloco. Blocos maiores (por exemplo, sobrenomes muito frequentes) são ignorados
+        na geração de pares candidatos.
+    """
+
+    def __init__(self, max_block_size=None):
+        self.max_block_size = max_block_size
+        self._blocks = {}
+        self._keys = {}
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, record_id, name, orcid=None):
+        """
+        Adiciona um registro ao índice. Um identificador já adicionado é substituído: o registro é removido dos
+        blocos das chaves anteriores e adicionado ao final dos blocos das novas chaves.
+
+        Parameters
+        ----------
+        record_id : hashable
+            Identificador do registro.
+        name : str
+            Nome do autor.
+        orcid : str, default None
+            Registro ORCID do autor.
+
+        Returns
+        -------
+        tuple of str
+            Chaves de blocagem do registro.
+        """
+        keys = author_blocking_keys(name, orcid)
+        for key in self._keys.pop(record_id, ()):
+            block = self._blocks[key]
+            block.remove(record_id)
+            if not block:
+                del self._blocks[key]
+        self._keys[record_id] = keys
+        for key in keys:
+            self._blocks.setdefault(key, []).append(record_id)
+        return keys
+
+    def block(self, key):
+        """
+        Obtém os identificadores dos registros de um bloco.
+
+        Parameters
+        ----------
+        key : str
+            Chave de blocagem.
+
+        Returns
+        -------
+        list
+            Identificadores dos registros, na ordem de inserção.
+        """
+        return self._blocks.get(key, [])
+
+    def candidate_pairs(self):
+        """
+        Gera os pares candidatos, isto é, pares de registros que compartilham ao menos um bloco.
+        Cada par é gerado uma única vez, no bloco da primeira chave que os registros compartilham.
+
+        Returns
+        -------
+        generator of tuple
+            Pares (record_id, record_id) na ordem de inserção dos registros.
+        """
+        keys = self._keys
+        oversized = set()
+        if self.max_block_size is not None:
+            oversized = {k for k, records in self._blocks.items() if len(records) > self.max_block_size}
+
+        for key, records in self._blocks.items():
+            if len(records) < 2 or key in oversized:
+                continue
+            for a, b in combinations(records, 2):
+                keys_b = keys[b]
+                if next(k for k in keys[a] if k in keys_b and k not in oversized) == key:
+                    yield a, b
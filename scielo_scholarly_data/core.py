@@ -1,11 +1,10 @@
-import html
 import unicodedata
-import re
-import roman
 
+from scielo_scholarly_data.helpers import orcid_check_digit
+from scielo_scholarly_data.profiling import profiled
 from scielo_scholarly_data.values import (
     PATTERN_DATE,
-    PATTERN_PARENTHESIS,
+    _PATTERN_PARENTHESIS,
     PUNCTUATION_TO_REMOVE_FROM_TITLE_VISUALIZATION,
 )
 
@@ -168,6 +167,10 @@ def unescape(text):
     str
         Texto sem entidades HTML.
     """
+    if '&' not in text:
+        return text
+    import html
+
     return html.unescape(text)
 
 
@@ -185,10 +188,10 @@ def remove_parenthesis(text):
     str
         Texto sem parênteses e sem o respectivo conteúdo.
     """
-    parenthesis_search = re.search(PATTERN_PARENTHESIS, text)
+    parenthesis_search = _PATTERN_PARENTHESIS.search(text)
     while parenthesis_search is not None:
         text = text[:parenthesis_search.start()] + text[parenthesis_search.end():]
-        parenthesis_search = re.search(PATTERN_PARENTHESIS, text)
+        parenthesis_search = _PATTERN_PARENTHESIS.search(text)
     text = remove_double_spaces(text)
     return text
 
@@ -292,14 +295,10 @@ def check_sum_orcid(orcid_number):
     bool
         Retorna True caso o registro seja válido ou False caso contrário.
     """
-    sub_calculation = 0
-    for number in orcid_number[:-1]:
-        sub_calculation = (sub_calculation + int(number)) * 2
-    verifying_digit = (12 - (sub_calculation % 11)) % 11
-    if verifying_digit == 10: verifying_digit = 'X'
-    return str(verifying_digit) == orcid_number[-1]
+    return orcid_check_digit(orcid_number[:-1]) == orcid_number[-1]
 
 
+@profiled('core.roman_to_int')
 def roman_to_int(roman_number):
     """
     Função para converter um número romano no correspondente indo-arábico.
@@ -313,4 +312,6 @@ def roman_to_int(roman_number):
     int
         Número inteiro.
     """
+    import roman
+
     return roman.fromRoman(roman_number)
\ No newline at end of file
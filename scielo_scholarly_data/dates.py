@@ -1,5 +1,5 @@
-from datetime import datetime
-from scielo_scholarly_data import core
+from scielo_scholarly_data import core, outcomes
+from scielo_scholarly_data.profiling import profiled
 
 TEXT_MONTH_TO_NUMERIC_MONTH = {
     'janeiro':'01',
@@ -104,6 +104,14 @@ class InvalidFormatError(Exception):
     ...
 
 
+_OK = ('dates.convert_to_iso_date', outcomes.OK)
+_INVALID_FORMAT = ('dates.convert_to_iso_date', InvalidFormatError.__name__)
+_ERROR_OUTCOMES = {
+    error: ('dates.convert_to_iso_date', error.__name__)
+    for error in (DateDayError, DateMonthError, InvalidStringError)
+}
+
+
 def _standardizes_date(text, day, month):
     """
     Função para padronizar uma data para uma string com dia, mês e ano separados por '-'.
@@ -181,6 +189,7 @@ def _split_date(text):
     return y, m, d
 
 
+@profiled('dates.convert_to_iso_date')
 def convert_to_iso_date(text, day='01', month='01', only_year=False):
     """
     Função para a padronização de datas no formato ISO YYYY-MM-DD.
@@ -203,22 +212,32 @@ def convert_to_iso_date(text, day='01', month='01', only_year=False):
     """
     text = _standardizes_date(text, day, month)
 
-    y, m, d = _split_date(text)
+    try:
+        y, m, d = _split_date(text)
+    except InvalidFormatError:
+        outcomes.count(_INVALID_FORMAT)
+        raise
 
     try:
         text = '-'.join([y, m, d])
     except TypeError as exc:
+        outcomes.count(_INVALID_FORMAT)
         raise InvalidFormatError(f"{exc}: Não foi possível reconhecer a data")
 
+    import datetime
+
     try:
-        date = datetime.fromisoformat(text)
-        if only_year:
-            return date.year
-        return date.isoformat()[:10]
+        date = datetime.datetime.fromisoformat(text)
     except ValueError as exc:
         if "day" in str(exc):
-            raise DateDayError(f"{exc}: {y}-{m}-{d}")
-        if "month" in str(exc):
-            raise DateMonthError(f"{exc}: {y}-{m}-{d}")
+            error = DateDayError
+        elif "month" in str(exc):
+            error = DateMonthError
         else:
-            raise InvalidStringError(f"{exc}: {y}-{m}-{d}")
+            error = InvalidStringError
+        outcomes.count(_ERROR_OUTCOMES[error])
+        raise error(f"{exc}: {y}-{m}-{d}")
+    outcomes.count(_OK)
+    if only_year:
+        return date.year
+    return date.isoformat()[:10]
@@ -0,0 +1,279 @@
+import hashlib
+
+from array import array
+
+from scielo_scholarly_data.standardizer import (
+    document_doi,
+    document_first_page,
+    document_title_for_deduplication,
+    journal_title_for_deduplication,
+)
+from scielo_scholarly_data.values import _PATTERN_YEAR
+
+
+FINGERPRINT_FIELD_SEPARATOR = '\x1f'
+
+
+def fingerprint_key(doi=None, title=None, year=None, first_page=None, journal=None):
+    """
+    Procedimento para gerar a chave textual de identificação de uma referência, a partir dos padronizadores:
+        1. Se o DOI for válido, a chave é o DOI (path) em caixa baixa;
+        2. Caso contrário, a chave é composta pelo título padronizado, ano, primeira página e título do periódico.
+
+    Parameters
+    ----------
+    doi : str, default None
+        DOI do documento.
+    title : str, default None
+        Título do documento.
+    year : str or int, default None
+        Ano ou data de publicação; apenas o ano é considerado.
+    first_page : str, default None
+        Primeira página.
+    journal : str, default None
+        Título do periódico.
+
+    Returns
+    -------
+    str or None
+        Chave da referência ou None quando não há DOI válido nem título.
+    """
+    if doi:
+        doi = document_doi(doi, return_mode='path')
+        if isinstance(doi, str):
+            return 'doi:' + doi.lower()
+
+    title = document_title_for_deduplication(title) if title else ''
+    if not title:
+        return None
+
+    matched_year = _PATTERN_YEAR.search(str(year)) if year else None
+    first_page = document_first_page(str(first_page)) if first_page else None
+    journal = journal_title_for_deduplication(journal, keep_parenthesis_content=False) if journal else None
+    return FINGERPRINT_FIELD_SEPARATOR.join((
+        'ref',
+        title,
+        matched_year.group() if matched_year else '',
+        first_page or '',
+        journal or '',
+    ))
+
+
+def document_fingerprint(doi=None, title=None, year=None, first_page=None, journal=None, digest_size=8):
+    """
+    Função para obter a impressão digital (hash BLAKE2b) de uma referência, calculada sobre fingerprint_key.
+    O valor é determinístico, isto é, não depende do processo nem da plataforma.
+
+    Parameters
+    ----------
+    doi : str, default None
+        DOI do documento.
+    title : str, default None
+        Título do documento.
+    year : str or int, default None
+        Ano ou data de publicação.
+    first_page : str, default None
+        Primeira página.
+    journal : str, default None
+        Título do periódico.
+    digest_size : int, default 8
+        Tamanho da impressão digital em bytes: 8 (64 bits) ou 16 (128 bits).
+
+    Returns
+    -------
+    int or None
+        Impressão digital ou None quando não há DOI válido nem título.
+
+    Exemplo:
+        document_fingerprint(doi='https://doi.org/10.1590/ABC') == document_fingerprint(doi='10.1590/abc')
+    """
+    key = fingerprint_key(doi, title, year, first_page, journal)
+    if key is None:
+        return None
+    return text_fingerprint(key, digest_size)
+
+
+def text_fingerprint(text, digest_size=8):
+    """
+    Função para obter a impressão digital (hash BLAKE2b) determinística de um texto.
+
+    Parameters
+    ----------
+    text : str
+        Texto, por exemplo, uma chave padronizada.
+    digest_size : int, default 8
+        Tamanho da impressão digital em bytes: 8 (64 bits) ou 16 (128 bits).
+
+    Returns
+    -------
+    int
+        Impressão digital.
+    """
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=digest_size).digest(), 'little')
+
+
+class _Shard:
+    __slots__ = ('keys', 'high_keys', 'heads', 'used', 'mask')
+
+    def __init__(self, capacity, wide):
+        self.keys = array('Q', bytes(8 * capacity))
+        self.high_keys = array('Q', bytes(8 * capacity)) if wide else None
+        self.heads = array('q', [-1]) * capacity
+        self.used = 0
+        self.mask = capacity - 1
+
+
+class FingerprintTable:
+    """
+    Tabela hash de endereçamento aberto (sondagem linear) para deduplicação exata de impressões digitais.
+    A tabela é dividida em shards, cada um armazenado em arrays compactos que crescem de forma independente,
+    o que evita a duplicação de memória de um redimensionamento global. Cada impressão digital distinta ocupa
+    uma posição no shard e cada registro, apenas um apontador para o próximo registro do seu grupo.
+
+    Parameters
+    ----------
+    shard_bits : int, default 6
+        Os shard_bits bits menos significativos da impressão digital escolhem o shard (2 ** shard_bits shards).
+    digest_size : int, default 8
+        Tamanho das impressões digitais em bytes: 8 ou 16 (ver document_fingerprint).
+    initial_capacity : int, default 1024
+        Capacidade inicial de cada shard; deve ser potência de 2.
+    max_load_factor : float, default 0.7
+        Ocupação máxima de um shard antes de dobrar a sua capacidade; deve estar entre 0 e 1 (exclusivos), pois a
+        sondagem linear requer ao menos uma posição livre.
+    """
+
+    def __init__(self, shard_bits=6, digest_size=8, initial_capacity=1024, max_load_factor=0.7):
+        if digest_size not in (8, 16):
+            raise ValueError(f'digest_size ({digest_size}) deve ser 8 ou 16')
+        if initial_capacity < 1 or initial_capacity & (initial_capacity - 1):
+            raise ValueError(f'initial_capacity ({initial_capacity}) deve ser potência de 2')
+        if not 0 < max_load_factor < 1:
+            raise ValueError(f'max_load_factor ({max_load_factor}) deve estar entre 0 e 1 (exclusivos)')
+        self.shard_bits = shard_bits
+        self.digest_size = digest_size
+        self.max_load_factor = max_load_factor
+        self._wide = digest_size == 16
+        self._shards = [_Shard(initial_capacity, self._wide) for _ in range(2 ** shard_bits)]
+        self._next = array('q')
+
+    def __len__(self):
+        return len(self._next)
+
+    @property
+    def distinct(self):
+        """Quantidade de impressões digitais distintas."""
+        return sum(shard.used for shard in self._shards)
+
+    def _split(self, fingerprint):
+        shard = self._shards[fingerprint & ((1 << self.shard_bits) - 1)]
+        low = fingerprint & 0xFFFFFFFFFFFFFFFF
+        high = fingerprint >> 64 if self._wide else 0
+        return shard, low, high
+
+    def _slot(self, shard, low, high):
+        # as posições usam os bits acima dos que escolhem o shard
+        slot = (low >> self.shard_bits) & shard.mask
+        keys, high_keys, heads = shard.keys, shard.high_keys, shard.heads
+        while heads[slot] != -1:
+            if keys[slot] == low and (high_keys is None or high_keys[slot] == high):
+                return slot
+            slot = (slot + 1) & shard.mask
+        return slot
+
+    def _resize(self, shard):
+        old_keys, old_high_keys, old_heads = shard.keys, shard.high_keys, shard.heads
+        capacity = 2 * (shard.mask + 1)
+        shard.keys = array('Q', bytes(8 * capacity))
+        shard.high_keys = array('Q', bytes(8 * capacity)) if self._wide else None
+        shard.heads = array('q', [-1]) * capacity
+        shard.mask = capacity - 1
+        for old_slot, head in enumerate(old_heads):
+            if head == -1:
+                continue
+            low = old_keys[old_slot]
+            high = old_high_keys[old_slot] if self._wide else 0
+            slot = self._slot(shard, low, high)
+            shard.keys[slot] = low
+            if self._wide:
+                shard.high_keys[slot] = high
+            shard.heads[slot] = head
+
+    def add(self, fingerprint):
+        """
+        Adiciona um registro.
+
+        Parameters
+        ----------
+        fingerprint : int or None
+            Impressão digital do registro (ver document_fingerprint). Registros sem impressão digital
+            nunca são considerados duplicados.
+
+        Returns
+        -------
+        int
+            Identificador do primeiro registro com a mesma impressão digital; para um registro novo,
+            o seu próprio identificador sequencial.
+        """
+        record_id = len(self._next)
+        self._next.append(-1)
+        if fingerprint is None:
+            return record_id
+
+        shard, low, high = self._split(fingerprint)
+        slot = self._slot(shard, low, high)
+        head = shard.heads[slot]
+        if head != -1:
+            # o registro é inserido logo após o primeiro do grupo
+            self._next[record_id] = self._next[head]
+            self._next[head] = record_id
+            return head
+
+        shard.keys[slot] = low
+        if self._wide:
+            shard.high_keys[slot] = high
+        shard.heads[slot] = record_id
+        shard.used += 1
+        if shard.used > self.max_load_factor * (shard.mask + 1):
+            self._resize(shard)
+        return record_id
+
+    def get(self, fingerprint):
+        """
+        Obtém o primeiro registro com uma impressão digital.
+
+        Parameters
+        ----------
+        fingerprint : int
+            Impressão digital.
+
+        Returns
+        -------
+        int or None
+            Identificador do primeiro registro ou None quando a impressão digital não foi adicionada.
+        """
+        shard, low, high = self._split(fingerprint)
+        head = shard.heads[self._slot(shard, low, high)]
+        return head if head != -1 else None
+
+    def duplicate_groups(self):
+        """
+        Gera os grupos de registros com a mesma impressão digital.
+
+        Returns
+        -------
+        generator of list
+            Identificadores dos registros de cada grupo com mais de um registro, em ordem crescente.
+        """
+        next_records = self._next
+        for shard in self._shards:
+            for head in shard.heads:
+                if head == -1 or next_records[head] == -1:
+                    continue
+                group = [head]
+                record_id = next_records[head]
+                while record_id != -1:
+                    group.append(record_id)
+                    record_id = next_records[record_id]
+                group.sort()
+                yield group
@@ -0,0 +1,459 @@
+"""
+Cache de valores padronizados com admissão por frequência (TinyLFU).
+
+Em um cache LRU, cada valor novo entra no cache e expulsa o menos recentemente usado; em dados de referência com
+cauda longa, as strings que aparecem uma única vez expulsam títulos de periódicos e ISSNs frequentes. Aqui, a
+frequência de acesso de cada chave é estimada por um Count-Min sketch, e um valor novo só entra no cache cheio
+quando é mais frequente que o valor que seria expulso.
+
+    journal_title = tinylfu_cache(capacity=50000)(standardizer.journal_title_for_deduplication)
+    journal_title('Agrociencia &amp; (Uruguay)')
+    cache_report()
+
+O estado dos caches (valores e frequências) pode ser gravado com save_snapshot e recarregado na inicialização de
+cada processo de um pool:
+
+    multiprocessing.Pool(initializer=load_snapshot, initargs=('caches.pickle',))
+"""
+import os
+import pickle
+import threading
+
+from collections import OrderedDict, namedtuple
+from functools import wraps
+
+from scielo_scholarly_data.normalization_cache import function_name
+from scielo_scholarly_data.values import NORMALIZATION_RULES_VERSION
+
+
+FREQUENCY_CACHE_CAPACITY = 10000
+
+SKETCH_DEPTH = 4
+
+SKETCH_COUNTER_MAX = 15
+
+SKETCH_SAMPLE_FACTOR = 10
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+_HALVE = bytes(value >> 1 for value in range(256))
+
+_MISSING = object()
+
+
+class _KwargsMark:
+    # separa argumentos posicionais e nomeados na chave; preserva a identidade ao ser lida de um snapshot
+    def __reduce__(self):
+        return '_KWARGS_MARK'
+
+
+_KWARGS_MARK = _KwargsMark()
+
+_registry = {}
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class InvalidSnapshotFileError(Exception):
+    ...
+
+
+class CountMinSketch:
+    """
+    Estimador de frequência de acesso (Count-Min sketch) com contadores de 4 bits (até SKETCH_COUNTER_MAX).
+    Quando a quantidade de incrementos atinge sample_size, todos os contadores são divididos por dois, de modo
+    que as frequências antigas perdem peso.
+
+    Parameters
+    ----------
+    width : int
+        Quantidade mínima de contadores por linha; é arredondada para a potência de 2 seguinte.
+    depth : int, default SKETCH_DEPTH
+        Quantidade de linhas (funções de hash).
+    sample_size : int, default None
+        Quantidade de incrementos entre duas reduções; quando não informada, SKETCH_SAMPLE_FACTOR vezes width.
+    """
+
+    def __init__(self, width, depth=SKETCH_DEPTH, sample_size=None):
+        self.width = 1 << max(4, (width - 1).bit_length())
+        self.depth = depth
+        self.sample_size = sample_size or SKETCH_SAMPLE_FACTOR * self.width
+        self.additions = 0
+        self._mask = self.width - 1
+        self._table = bytearray(self.width * depth)
+
+    def _indexes(self, key):
+        # hash duplo: as linhas usam o mesmo hash com deslocamentos diferentes
+        value = hash(key)
+        step = (value >> 17) | 1
+        return [row * self.width + ((value + row * step) & self._mask) for row in range(self.depth)]
+
+    def increment(self, key):
+        """
+        Registra um acesso à chave.
+
+        Parameters
+        ----------
+        key : hashable
+            Chave acessada.
+        """
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < SKETCH_COUNTER_MAX:
+                table[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.halve()
+
+    def estimate(self, key):
+        """
+        Estima a quantidade de acessos à chave (limitada a SKETCH_COUNTER_MAX).
+
+        Parameters
+        ----------
+        key : hashable
+            Chave.
+
+        Returns
+        -------
+        int
+            Frequência estimada.
+        """
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
+    def restore(self, key, frequency):
+        """
+        Garante que a frequência estimada da chave seja de pelo menos frequency, sem contar como incremento.
+        Usada para recarregar o estado de um snapshot.
+
+        Parameters
+        ----------
+        key : hashable
+            Chave.
+        frequency : int
+            Frequência estimada no snapshot.
+        """
+        frequency = min(frequency, SKETCH_COUNTER_MAX)
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < frequency:
+                table[index] = frequency
+
+    def halve(self):
+        """Divide todos os contadores por dois."""
+        self._table = self._table.translate(_HALVE)
+        self.additions //= 2
+
+    def clear(self):
+        """Zera os contadores."""
+        self._table = bytearray(self.width * self.depth)
+        self.additions = 0
+
+
+class TinyLFUCache:
+    """
+    Cache de capacidade limitada com política de admissão TinyLFU: todos os acessos são registrados no sketch
+    e, com o cache cheio, uma chave nova só é admitida quando a sua frequência estimada é maior que a da chave
+    menos recentemente usada, que é então expulsa.
+
+    Os métodos get, put, clear, items e restore podem ser chamados por várias threads: o acesso ao sketch e aos
+    valores armazenados é protegido por um bloqueio.
+
+    Parameters
+    ----------
+    capacity : int, default FREQUENCY_CACHE_CAPACITY
+        Quantidade máxima de valores armazenados.
+
+    Attributes
+    ----------
+    hits : int
+        Quantidade de consultas encontradas.
+    misses : int
+        Quantidade de consultas não encontradas.
+    admitted : int
+        Quantidade de valores admitidos.
+    rejected : int
+        Quantidade de valores recusados pela política de admissão.
+    """
+
+    def __init__(self, capacity=FREQUENCY_CACHE_CAPACITY):
+        if capacity < 1:
+            raise ValueError('Capacidade deve ser maior que zero')
+        self.capacity = capacity
+        self.sketch = CountMinSketch(capacity)
+        self.hits = 0
+        self.misses = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    @property
+    def hit_ratio(self):
+        """Proporção de consultas encontradas no cache (0.0 quando não houve consultas)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key, default=None):
+        """
+        Consulta o valor de uma chave e registra o acesso no sketch.
+
+        Parameters
+        ----------
+        key : hashable
+            Chave.
+        default : any, default None
+            Valor devolvido quando a chave não está no cache.
+
+        Returns
+        -------
+        any
+            Valor armazenado ou default.
+        """
+        with self._lock:
+            self.sketch.increment(key)
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Armazena o valor de uma chave, se admitido.
+
+        Parameters
+        ----------
+        key : hashable
+            Chave.
+        value : any
+            Valor.
+
+        Returns
+        -------
+        bool
+            Valor lógico que indica se o valor foi armazenado.
+        """
+        data = self._data
+        with self._lock:
+            if key in data:
+                data[key] = value
+                data.move_to_end(key)
+                return True
+            if len(data) >= self.capacity:
+                victim = next(iter(data))
+                if self.sketch.estimate(key) <= self.sketch.estimate(victim):
+                    self.rejected += 1
+                    return False
+                del data[victim]
+            data[key] = value
+            self.admitted += 1
+            return True
+
+    def clear(self):
+        """Descarta os valores, as frequências e as estatísticas."""
+        with self._lock:
+            self._data.clear()
+            self.sketch.clear()
+            self.hits = self.misses = self.admitted = self.rejected = 0
+
+    def items(self):
+        """
+        Obtém os valores armazenados com as suas frequências estimadas.
+
+        Returns
+        -------
+        list of tuple
+            Triplas (chave, valor, frequência estimada), da menos para a mais recentemente usada.
+        """
+        with self._lock:
+            return [(key, value, self.sketch.estimate(key)) for key, value in self._data.items()]
+
+    def restore(self, items):
+        """
+        Recarrega valores e frequências obtidos com items, respeitando a capacidade (são mantidos os mais
+        recentemente usados).
+
+        Parameters
+        ----------
+        items : list of tuple
+            Triplas (chave, valor, frequência estimada), da menos para a mais recentemente usada.
+
+        Returns
+        -------
+        int
+            Quantidade de valores recarregados.
+        """
+        items = items[-self.capacity:]
+        with self._lock:
+            for key, value, frequency in items:
+                self.sketch.restore(key, frequency)
+                self._data[key] = value
+                self._data.move_to_end(key)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+        return len(items)
+
+
+def tinylfu_cache(capacity=FREQUENCY_CACHE_CAPACITY, name=None):
+    """
+    Decorador que armazena os resultados de uma função padronizadora em um TinyLFUCache.
+    A função decorada é registrada pelo nome para cache_report, save_snapshot e load_snapshot. Chamadas com
+    argumentos não hashable (por exemplo, chars_to_remove como lista) e chamadas que lançam exceção não são
+    armazenadas. Os valores armazenados são compartilhados entre as chamadas e não devem ser alterados.
+
+    Parameters
+    ----------
+    capacity : int, default FREQUENCY_CACHE_CAPACITY
+        Quantidade máxima de valores armazenados.
+    name : str, default None
+        Nome do cache; quando não informado, o nome qualificado da função (módulo.função).
+
+    Returns
+    -------
+    callable
+        Decorador. A função decorada expõe o cache (cache), cache_info e cache_clear, como functools.lru_cache.
+
+    Exemplo:
+        issn = tinylfu_cache(capacity=1000)(standardizer.journal_issn)
+        issn('1387666x', use_issn_validator=True)
+        '1387-666X'
+    """
+    def decorator(function):
+        cache = TinyLFUCache(capacity)
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            try:
+                value = cache.get(key, _MISSING)
+            except TypeError:
+                return function(*args, **kwargs)
+            if value is _MISSING:
+                value = function(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        def cache_info():
+            return CacheInfo(cache.hits, cache.misses, cache.capacity, len(cache))
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache.clear
+        _registry[name or function_name(function)] = wrapper
+        return wrapper
+
+    return decorator
+
+
+def registered_caches():
+    """
+    Obtém as funções decoradas com tinylfu_cache no processo atual.
+
+    Returns
+    -------
+    dict
+        Função decorada por nome do cache.
+    """
+    return dict(_registry)
+
+
+def cache_report():
+    """
+    Obtém as estatísticas dos caches registrados.
+
+    Returns
+    -------
+    dict
+        Para cada cache, um dict com hits, misses, hit_ratio, size, capacity, admitted e rejected.
+
+    Exemplo:
+        {'scielo_scholarly_data.standardizer.journal_issn': {'hits': 950, 'misses': 50, 'hit_ratio': 0.95, ...}}
+    """
+    return {
+        name: {
+            'hits': wrapper.cache.hits,
+            'misses': wrapper.cache.misses,
+            'hit_ratio': wrapper.cache.hit_ratio,
+            'size': len(wrapper.cache),
+            'capacity': wrapper.cache.capacity,
+            'admitted': wrapper.cache.admitted,
+            'rejected': wrapper.cache.rejected,
+        }
+        for name, wrapper in sorted(_registry.items())
+    }
+
+
+def save_snapshot(path, names=None, rules_version=NORMALIZATION_RULES_VERSION):
+    """
+    Grava o estado (valores e frequências) dos caches registrados. O arquivo é gravado em um arquivo temporário
+    e movido para path, de modo que processos que o leem concorrentemente nunca encontram um arquivo parcial.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo.
+    names : iterable of str, default None
+        Nomes dos caches gravados; quando não informados, todos os registrados.
+    rules_version : int, default NORMALIZATION_RULES_VERSION
+        Versão das regras de normalização dos valores armazenados.
+
+    Returns
+    -------
+    int
+        Quantidade de valores gravados.
+    """
+    names = sorted(_registry) if names is None else list(names)
+    caches = {name: _registry[name].cache.items() for name in names}
+    state = {'format': SNAPSHOT_FORMAT_VERSION, 'rules_version': rules_version, 'caches': caches}
+    with open(path + '.tmp', 'wb') as fp:
+        pickle.dump(state, fp, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + '.tmp', path)
+    return sum(len(items) for items in caches.values())
+
+
+def load_snapshot(path, rules_version=NORMALIZATION_RULES_VERSION):
+    """
+    Recarrega nos caches registrados o estado gravado por save_snapshot. Pode ser usada como initializer de um
+    multiprocessing.Pool. Caches do arquivo que não estão registrados no processo são ignorados, assim como o
+    arquivo inteiro quando gravado com outra versão das regras de normalização ou quando não existe.
+    O arquivo é lido com pickle: devem ser carregados apenas arquivos gravados por save_snapshot.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo.
+    rules_version : int, default NORMALIZATION_RULES_VERSION
+        Versão das regras de normalização.
+
+    Returns
+    -------
+    int
+        Quantidade de valores recarregados.
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb') as fp:
+        try:
+            state = pickle.load(fp)
+        except (pickle.UnpicklingError, EOFError) as exc:
+            raise InvalidSnapshotFileError(f"{exc}: Arquivo {path} não contém um snapshot de caches")
+    if not isinstance(state, dict) or state.get('format') != SNAPSHOT_FORMAT_VERSION:
+        raise InvalidSnapshotFileError(f"Arquivo {path} não contém um snapshot de caches")
+    if state['rules_version'] != rules_version:
+        return 0
+    loaded = 0
+    for name, items in state['caches'].items():
+        wrapper = _registry.get(name)
+        if wrapper is not None:
+            loaded += wrapper.cache.restore(items)
+    return loaded
@@ -0,0 +1,216 @@
+import csv
+
+from functools import lru_cache
+
+from scielo_scholarly_data.authority import (
+    build_authority_index,
+    load_authority_index,
+)
+from scielo_scholarly_data.standardizer import document_sponsors
+from scielo_scholarly_data.values import (
+    _PATTERN_SPONSOR_ACRONYM,
+    _PATTERN_SPONSOR_CONJUNCTIONS,
+    _PATTERN_SPONSOR_SEGMENT_SEPARATORS,
+)
+
+
+FUNDER_FIELD_SEPARATOR = '\x1f'
+
+
+def read_funder_registry_csv(path, delimiter=';'):
+    """
+    Lê uma cópia local do Crossref Funder Registry em CSV: cada linha contém o identificador do financiador,
+    o nome principal e os nomes alternativos (incluindo siglas).
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo CSV.
+    delimiter : str, default ';'
+        Separador de colunas do arquivo.
+
+    Returns
+    -------
+    generator of tuple
+        Triplas (identificador, nome, lista de nomes alternativos).
+    """
+    with open(path, encoding='utf-8-sig', newline='') as fp:
+        for row in csv.reader(fp, delimiter=delimiter):
+            row = [c.strip() for c in row if c.strip()]
+            if len(row) >= 2:
+                yield row[0], row[1], row[2:]
+
+
+def build_funder_index(entries, path):
+    """
+    Compila o registro de financiadores em um índice de autoridades mapeável em memória (ver authority),
+    com as chaves padronizadas por document_sponsors dos nomes principais, nomes alternativos e siglas.
+
+    Parameters
+    ----------
+    entries : iterable of tuple
+        Triplas (identificador, nome, lista de nomes alternativos), por exemplo, a saída de read_funder_registry_csv.
+    path : str
+        Caminho do arquivo binário.
+
+    Returns
+    -------
+    int
+        Quantidade de chaves distintas indexadas.
+    """
+    # o nome canônico do índice inclui o identificador: o nome principal é indexado também como variante
+    return build_authority_index(
+        (
+            (f'{funder_id}{FUNDER_FIELD_SEPARATOR}{name}', [name, *alternate_names])
+            for funder_id, name, alternate_names in entries
+        ),
+        path,
+        key=document_sponsors,
+    )
+
+
+class FunderRegistry:
+    """
+    Resolução de patrocinadores de documentos para identificadores do Crossref Funder Registry.
+    O índice compilado (ver build_funder_index) é mapeado em memória apenas na primeira consulta, de modo que
+    processos que não o utilizam não pagam o custo de carregamento e processos que o utilizam compartilham
+    as mesmas páginas do arquivo.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do índice compilado.
+    threshold : float, default 0.85
+        Similaridade mínima da busca aproximada por nomes.
+    """
+
+    def __init__(self, path, threshold=0.85):
+        self.path = path
+        self.threshold = threshold
+        self._index = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = load_authority_index(self.path, key=document_sponsors)
+        return self._index
+
+    def close(self):
+        """Fecha o índice, caso tenha sido carregado."""
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+
+    def _lookup(self, text, threshold):
+        match = self.index.lookup(text, threshold=threshold)
+        if match:
+            funder_id, _, name = match[0].partition(FUNDER_FIELD_SEPARATOR)
+            return funder_id, name
+
+    def _resolve_exact(self, text):
+        return self._lookup(text, None)
+
+    def resolve(self, text):
+        """
+        Obtém o financiador correspondente a um nome, pela chave padronizada ou por similaridade.
+
+        Parameters
+        ----------
+        text : str
+            Nome ou sigla do financiador.
+
+        Returns
+        -------
+        tuple or None
+            Par (identificador, nome principal) ou None quando não há correspondência.
+        """
+        return self._lookup(text, self.threshold)
+
+    def _resolve_conjunctions(self, segment):
+        # nomes de financiadores podem conter "e", "and" e "&" (por exemplo, "Bill & Melinda Gates Foundation"):
+        # o segmento é dividido nas conjunções apenas quando todas as partes, formadas por trechos consecutivos,
+        # têm correspondência exata; as partes mais longas são preferidas
+        separators = list(_PATTERN_SPONSOR_CONJUNCTIONS.finditer(segment))
+        starts = [0] + [m.end() for m in separators]
+        ends = [m.start() for m in separators] + [len(segment)]
+        resolved = {len(starts): []}
+        for first in reversed(range(len(starts))):
+            resolved[first] = None
+            for last in reversed(range(first, len(starts))):
+                if resolved[last + 1] is None:
+                    continue
+                match = self._resolve_exact(segment[starts[first]:ends[last]])
+                if match:
+                    resolved[first] = [match] + resolved[last + 1]
+                    break
+        return resolved[0]
+
+    def _resolve_segment(self, segment):
+        matches = self._resolve_conjunctions(segment)
+        if matches:
+            return matches
+        matches = [m for m in map(self._resolve_exact, _PATTERN_SPONSOR_ACRONYM.findall(segment)) if m]
+        if matches:
+            return matches
+        match = self.resolve(segment)
+        if match:
+            return [match]
+        return [m for m in map(self.resolve, _PATTERN_SPONSOR_CONJUNCTIONS.split(segment)) if m]
+
+    def sponsor_ids(self, text):
+        """
+        Procedimento para obter os identificadores dos financiadores citados em um texto de patrocínio:
+            1. Resolve o texto completo pela chave padronizada (document_sponsors);
+            2. Quando não há correspondência exata, separa o texto em segmentos por ";" e "/";
+            3. Resolve cada segmento pela chave padronizada, ou o divide por "&", "and", "e" e "y" quando todas
+               as partes têm correspondência exata (nomes que contêm essas palavras não são divididos);
+            4. Quando não há correspondência exata, resolve as siglas presentes no segmento (por exemplo, "CNPq");
+            5. Quando não há siglas conhecidas, resolve o segmento e, em seguida, cada uma das suas partes por
+               similaridade.
+
+        Parameters
+        ----------
+        text : str
+            Texto de patrocínio do documento.
+
+        Returns
+        -------
+        list of str
+            Identificadores dos financiadores, sem repetição, na ordem em que aparecem no texto.
+
+        Exemplo:
+            registry.sponsor_ids('CNPq; Fundação de Amparo à Pesquisa do Estado de São Paulo') == ['501100003593', '501100001807']
+        """
+        if not text:
+            return []
+        match = self._resolve_exact(text)
+        if match:
+            return [match[0]]
+        funder_ids = []
+        for segment in _PATTERN_SPONSOR_SEGMENT_SEPARATORS.split(text):
+            if not segment:
+                continue
+            for funder_id, _ in self._resolve_segment(segment):
+                if funder_id not in funder_ids:
+                    funder_ids.append(funder_id)
+        return funder_ids
+
+
+@lru_cache(maxsize=None)
+def get_funder_registry(path, threshold=0.85):
+    """
+    Obtém o FunderRegistry do processo para um índice compilado, criado na primeira chamada.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do índice compilado.
+    threshold : float, default 0.85
+        Similaridade mínima da busca aproximada por nomes.
+
+    Returns
+    -------
+    FunderRegistry
+        Registro de financiadores.
+    """
+    return FunderRegistry(path, threshold)
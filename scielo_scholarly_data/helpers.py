@@ -1,7 +1,55 @@
-from stdnum import (
-    issn,
-    isbn,
-)
+ISSN_CHECK_DIGIT_WEIGHTS = (8, 7, 6, 5, 4, 3, 2)
+
+_DIGITS = frozenset('0123456789')
+
+
+def issn_check_digit(digits: str):
+    """
+    Calcula o dígito verificador de um ISSN (módulo 11).
+
+    Parameters
+    ----------
+    digits : str
+        Os sete primeiros dígitos do ISSN.
+
+    Returns
+    -------
+    str
+        Dígito verificador, de '0' a '9' ou 'X'.
+
+    Exemplo:
+        issn_check_digit('2090424') == 'X'
+    """
+    total = 0
+    for digit, weight in zip(digits, ISSN_CHECK_DIGIT_WEIGHTS):
+        total += (ord(digit) - 48) * weight
+    check = -total % 11
+    return 'X' if check == 10 else chr(48 + check)
+
+
+def orcid_check_digit(digits: str):
+    """
+    Calcula o dígito verificador de um ORCID (ISO 7064 11,2).
+
+    Parameters
+    ----------
+    digits : str
+        Os quinze primeiros dígitos do ORCID.
+
+    Returns
+    -------
+    str
+        Dígito verificador, de '0' a '9' ou 'X'.
+
+    Exemplo:
+        orcid_check_digit('000000021694233') == 'X'
+    """
+    total = 0
+    for digit in digits:
+        total = (total + int(digit)) * 2
+    check = (12 - total % 11) % 11
+    return 'X' if check == 10 else str(check)
+
 
 # https://www.issn.org/understanding-the-issn/what-is-an-issn (accessed on 2021/08/31)
 def is_valid_issn(text: str):
@@ -18,7 +66,10 @@ def is_valid_issn(text: str):
     bool
         Valor lógica que indica a validade do ISSN.
     """
-    return issn.is_valid(text)
+    number = text.replace('-', '').replace(' ', '').strip().upper()
+    if len(number) != 8 or not _DIGITS.issuperset(number[:7]):
+        return False
+    return issn_check_digit(number) == number[7]
 
 
 def is_valid_isbn(text: str):
@@ -28,4 +79,21 @@ def is_valid_isbn(text: str):
     :param isbn: código ISBN padronizado
     :return: True se código é válido, False caso contrário
     """
-    pass
\ No newline at end of file
+    pass
+
+
+def escape_prometheus_label(value: str):
+    """
+    Escapa o valor de um rótulo de métrica no formato de texto do Prometheus.
+
+    Parameters
+    ----------
+    value : str
+        Valor do rótulo.
+
+    Returns
+    -------
+    str
+        Valor com barra invertida, aspas e quebra de linha escapadas.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,292 @@
+import bisect
+import hashlib
+import json
+import mmap
+import os
+
+from array import array
+
+from scielo_scholarly_data.values import NORMALIZATION_RULES_VERSION
+
+
+MANIFEST_FORMAT_VERSION = 1
+
+MANIFEST_MAGIC = b'SSDMANI\x00'
+
+MANIFEST_FILENAME = 'manifest.bin'
+
+OUTPUTS_FILENAME = 'outputs.jsonl'
+
+_HEADER_SIZE = 3
+
+
+class InvalidManifestFileError(Exception):
+    ...
+
+
+def record_hash(record, rules_version=NORMALIZATION_RULES_VERSION):
+    """
+    Calcula o hash (BLAKE2b, 64 bits) do conteúdo de um registro e da versão das regras de normalização.
+    O valor não depende da ordem das chaves do registro nem do processo.
+
+    Parameters
+    ----------
+    record : dict
+        Registro de entrada, serializável em JSON.
+    rules_version : int, default NORMALIZATION_RULES_VERSION
+        Versão das regras de normalização.
+
+    Returns
+    -------
+    int
+        Hash do registro.
+    """
+    content = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    digest = hashlib.blake2b(f'{rules_version}\x1f{content}'.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def write_manifest(path, hashes, offsets, rules_version=NORMALIZATION_RULES_VERSION):
+    """
+    Grava um manifesto: hashes de registro ordenados, em 8 bytes cada, acompanhados da posição da saída
+    padronizada de cada registro no arquivo de saídas da execução (ver IncrementalStandardizer).
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo binário.
+    hashes : array of int
+        Hashes dos registros (ver record_hash), sem repetição.
+    offsets : array of int
+        Posição, em bytes, da linha de saída de cada hash no arquivo de saídas.
+    rules_version : int, default NORMALIZATION_RULES_VERSION
+        Versão das regras de normalização das saídas.
+
+    Returns
+    -------
+    int
+        Quantidade de registros do manifesto.
+    """
+    order = sorted(range(len(hashes)), key=hashes.__getitem__)
+    header = array('Q', [MANIFEST_FORMAT_VERSION, rules_version, len(order)])
+    with open(path, 'wb') as fp:
+        fp.write(MANIFEST_MAGIC)
+        fp.write(header.tobytes())
+        fp.write(array('Q', (hashes[i] for i in order)).tobytes())
+        fp.write(array('Q', (offsets[i] for i in order)).tobytes())
+    return len(order)
+
+
+class Manifest:
+    """
+    Manifesto de uma execução mapeado em memória (ver write_manifest e load_manifest).
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        Conteúdo do arquivo (em geral, um mmap).
+    """
+
+    def __init__(self, buffer):
+        offset = len(MANIFEST_MAGIC) + 8 * _HEADER_SIZE
+        if len(buffer) < offset or buffer[:len(MANIFEST_MAGIC)] != MANIFEST_MAGIC:
+            raise InvalidManifestFileError('Conteúdo não é um manifesto')
+        version, self.rules_version, count = array('Q', buffer[len(MANIFEST_MAGIC):offset])
+        if version != MANIFEST_FORMAT_VERSION:
+            raise InvalidManifestFileError(f'Versão {version} de manifesto não suportada')
+        if len(buffer) != offset + 16 * count:
+            raise InvalidManifestFileError('Tamanho do manifesto inválido')
+
+        self._buffer = buffer
+        view = memoryview(buffer)
+        self._hashes = view[offset:offset + 8 * count].cast('Q')
+        self._offsets = view[offset + 8 * count:].cast('Q')
+        self._views = [view, self._hashes, self._offsets]
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def __contains__(self, hash_value):
+        return self.offset(hash_value) is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Libera as visões sobre o arquivo e fecha o mapeamento em memória."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def offset(self, hash_value):
+        """
+        Obtém a posição da saída de um registro no arquivo de saídas.
+
+        Parameters
+        ----------
+        hash_value : int
+            Hash do registro.
+
+        Returns
+        -------
+        int or None
+            Posição em bytes ou None quando o registro não está no manifesto.
+        """
+        position = bisect.bisect_left(self._hashes, hash_value)
+        if position < len(self._hashes) and self._hashes[position] == hash_value:
+            return self._offsets[position]
+
+
+def load_manifest(path):
+    """
+    Carrega um manifesto gravado por write_manifest, mapeando o arquivo em memória em modo somente leitura.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo binário.
+
+    Returns
+    -------
+    Manifest
+        Manifesto.
+    """
+    with open(path, 'rb') as fp:
+        try:
+            buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:
+            raise InvalidManifestFileError(f"{exc}: Arquivo {path} não contém um manifesto")
+    try:
+        return Manifest(buffer)
+    except InvalidManifestFileError as exc:
+        buffer.close()
+        raise InvalidManifestFileError(f"{exc}: {path}")
+
+
+class IncrementalStandardizer:
+    """
+    Padronização incremental de lotes de registros. Cada execução grava, em um diretório, as saídas padronizadas
+    (OUTPUTS_FILENAME, uma linha JSON por registro distinto) e o manifesto (MANIFEST_FILENAME) com o hash de
+    cada registro e a posição da sua saída. Na execução seguinte, apenas os registros cujo conteúdo ou versão
+    das regras de normalização mudaram são padronizados; as saídas dos demais são copiadas da execução anterior.
+    Registros repetidos em uma execução são padronizados uma única vez.
+
+    As saídas são sempre devolvidas como lidas do JSON gravado, tenham sido padronizadas nesta execução ou
+    copiadas da anterior: tuplas são devolvidas como listas.
+
+    Parameters
+    ----------
+    standardize : callable
+        Função que recebe um registro e devolve a sua saída padronizada, serializável em JSON.
+    previous : str, default None
+        Diretório da execução anterior; quando None, não existe ou gravado com outra versão das regras, todos
+        os registros são padronizados.
+    rules_version : int, default NORMALIZATION_RULES_VERSION
+        Versão das regras de normalização.
+
+    Attributes
+    ----------
+    standardized : int
+        Quantidade de registros padronizados na última execução.
+    carried_forward : int
+        Quantidade de registros cujas saídas foram copiadas da execução anterior.
+    repeated : int
+        Quantidade de registros repetidos na última execução, cujas saídas foram reaproveitadas da primeira
+        ocorrência.
+    """
+
+    def __init__(self, standardize, previous=None, rules_version=NORMALIZATION_RULES_VERSION):
+        self.standardize = standardize
+        self.previous = previous
+        self.rules_version = rules_version
+        self.standardized = 0
+        self.carried_forward = 0
+        self.repeated = 0
+
+    def _open_previous(self):
+        if self.previous is None:
+            return None, None
+        manifest_path = os.path.join(self.previous, MANIFEST_FILENAME)
+        if not os.path.exists(manifest_path):
+            return None, None
+        manifest = load_manifest(manifest_path)
+        if manifest.rules_version != self.rules_version:
+            manifest.close()
+            return None, None
+        return manifest, open(os.path.join(self.previous, OUTPUTS_FILENAME), 'rb')
+
+    def run(self, records, directory):
+        """
+        Padroniza um lote de registros. O manifesto e as saídas são gravados em arquivos temporários e movidos
+        para directory apenas quando todos os registros foram consumidos.
+
+        Parameters
+        ----------
+        records : iterable of dict
+            Registros de entrada, serializáveis em JSON.
+        directory : str
+            Diretório da execução atual (deve ser diferente do diretório da execução anterior).
+
+        Returns
+        -------
+        generator of tuple
+            Pares (saída padronizada, valor lógico que indica se o registro foi padronizado nesta execução), na
+            ordem de records. Um registro repetido tem o mesmo valor lógico da sua primeira ocorrência.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.standardized = self.carried_forward = self.repeated = 0
+        manifest, previous_outputs = self._open_previous()
+        outputs_path = os.path.join(directory, OUTPUTS_FILENAME)
+        manifest_path = os.path.join(directory, MANIFEST_FILENAME)
+        hashes = array('Q')
+        offsets = array('Q')
+        # hash -> (posição, tamanho da linha, valor lógico changed) das saídas já gravadas nesta execução
+        written = {}
+        current_outputs = None
+        try:
+            with open(outputs_path + '.tmp', 'wb') as outputs:
+                for record in records:
+                    hash_value = record_hash(record, self.rules_version)
+                    if hash_value in written:
+                        offset, size, changed = written[hash_value]
+                        if current_outputs is None:
+                            current_outputs = open(outputs_path + '.tmp', 'rb')
+                        outputs.flush()
+                        current_outputs.seek(offset)
+                        self.repeated += 1
+                        yield json.loads(current_outputs.read(size)), changed
+                        continue
+                    previous_offset = manifest.offset(hash_value) if manifest is not None else None
+                    if previous_offset is not None:
+                        previous_outputs.seek(previous_offset)
+                        line = previous_outputs.readline()
+                        self.carried_forward += 1
+                        changed = False
+                    else:
+                        line = (json.dumps(self.standardize(record), ensure_ascii=False) + '\n').encode('utf-8')
+                        self.standardized += 1
+                        changed = True
+                    written[hash_value] = (outputs.tell(), len(line), changed)
+                    hashes.append(hash_value)
+                    offsets.append(outputs.tell())
+                    outputs.write(line)
+                    yield json.loads(line), changed
+            write_manifest(manifest_path + '.tmp', hashes, offsets, self.rules_version)
+            os.replace(outputs_path + '.tmp', outputs_path)
+            os.replace(manifest_path + '.tmp', manifest_path)
+        except BaseException:
+            for path in (outputs_path + '.tmp', manifest_path + '.tmp'):
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
+        finally:
+            if current_outputs is not None:
+                current_outputs.close()
+            if manifest is not None:
+                manifest.close()
+                previous_outputs.close()
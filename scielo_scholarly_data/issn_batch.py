@@ -0,0 +1,105 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from scielo_scholarly_data.helpers import ISSN_CHECK_DIGIT_WEIGHTS
+
+
+ISSN_WIDTH = 9
+
+_HYPHEN = ord('-')
+_ZERO = ord('0')
+_UPPER_X = ord('X')
+_LOWER_X = ord('x')
+
+
+def _as_byte_matrix(issns):
+    data = np.asarray(issns)
+    if data.dtype.kind == 'U':
+        data = np.char.encode(data, 'ascii', 'replace')
+    elif data.dtype.kind != 'S':
+        data = data.astype('S')
+    data = data.reshape(-1)
+    width = max(data.dtype.itemsize, ISSN_WIDTH + 1)
+    return np.ascontiguousarray(data, dtype=f'S{width}').view(np.uint8).reshape(len(data), width)
+
+
+def issn_batch(issns, use_issn_validator=False):
+    """
+    Padroniza e valida um array de ISSN de forma vetorizada. Os códigos são convertidos para uma matriz de bytes
+    de largura fixa e os dígitos e o dígito verificador são calculados com operações do numpy sobre todas as
+    linhas de uma vez, sem chamadas de função por código.
+
+    Aceita os mesmos formatos de journal_issn ("1387-666X", "1387-666x", "1387666X"), sem espaços.
+
+    Requer numpy.
+
+    Parameters
+    ----------
+    issns : sequence of str or numpy.ndarray
+        Códigos ISSN, como str ou como bytes de largura fixa (dtype "S").
+    use_issn_validator : bool, default False
+        O dígito verificador deve ser validado?
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        ISSN padronizados (dtype "S9", vazio para códigos inválidos) e máscara booleana dos códigos válidos.
+
+    Exemplo:
+        issn_batch(['1387666x', '2090-4241'], use_issn_validator=True)[0] == [b'1387-666X', b'']
+    """
+    if np is None:
+        raise ImportError('numpy é necessário para issn_batch')
+    matrix = _as_byte_matrix(issns)
+    if not len(matrix):
+        return np.empty(0, dtype=f'S{ISSN_WIDTH}'), np.empty(0, dtype=bool)
+
+    hyphen = matrix[:, 4] == _HYPHEN
+    # posições dos oito caracteres do ISSN com e sem hífen
+    chars = np.where(hyphen[:, None], matrix[:, [0, 1, 2, 3, 5, 6, 7, 8]], matrix[:, :8])
+    end = np.where(hyphen, ISSN_WIDTH, ISSN_WIDTH - 1)
+    length = np.count_nonzero(matrix, axis=1)
+    valid = (length == end) & (matrix[np.arange(len(matrix)), end] == 0)
+
+    digits = chars[:, :7].astype(np.int64) - _ZERO
+    valid &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+    last = chars[:, 7]
+    is_x = (last == _UPPER_X) | (last == _LOWER_X)
+    last_digit = last.astype(np.int64) - _ZERO
+    valid &= is_x | ((last_digit >= 0) & (last_digit <= 9))
+
+    if use_issn_validator:
+        check = -(digits @ np.array(ISSN_CHECK_DIGIT_WEIGHTS, dtype=np.int64)) % 11
+        valid &= np.where(is_x, check == 10, check == last_digit)
+
+    formatted = np.zeros((len(matrix), ISSN_WIDTH), dtype=np.uint8)
+    formatted[:, :4] = chars[:, :4]
+    formatted[:, 4] = _HYPHEN
+    formatted[:, 5:8] = chars[:, 4:7]
+    formatted[:, 8] = np.where(is_x, _UPPER_X, last)
+    formatted[~valid] = 0
+    return formatted.view(f'S{ISSN_WIDTH}').reshape(-1), valid
+
+
+def journal_issn_batch(issns, use_issn_validator=False):
+    """
+    Versão em lote de journal_issn (ver issn_batch), com o mesmo valor padrão de use_issn_validator.
+
+    Requer numpy.
+
+    Parameters
+    ----------
+    issns : sequence of str
+        Códigos ISSN a serem padronizados.
+    use_issn_validator : bool, default False
+        O dígito verificador deve ser validado?
+
+    Returns
+    -------
+    list
+        Código ISSN padronizado ou None para cada código.
+    """
+    formatted, valid = issn_batch(issns, use_issn_validator)
+    return [f.decode('ascii') if v else None for f, v in zip(formatted.tolist(), valid.tolist())]
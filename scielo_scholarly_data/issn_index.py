@@ -0,0 +1,312 @@
+import bisect
+import csv
+import mmap
+
+from array import array
+
+from scielo_scholarly_data.helpers import issn_check_digit
+from scielo_scholarly_data.standardizer import journal_issn
+
+
+ISSN_INDEX_FORMAT_VERSION = 1
+
+ISSN_INDEX_MAGIC = b'SSDISSN\x00'
+
+ISSN_INDEX_BUCKET_SIZE = 1000
+
+_HEADER_SIZE = 4
+
+_NO_TITLE = 0xFFFFFFFF
+
+_ISSN_NUMBER_LIMIT = 10 ** 7
+
+
+class InvalidISSNIndexFileError(Exception):
+    ...
+
+
+def _issn_number(text):
+    # número do ISSN sem o dígito verificador, ou None quando o ISSN é inválido
+    issn = journal_issn(text.strip(), use_issn_validator=True) if text else None
+    if issn:
+        return int(issn[:4] + issn[5:8])
+
+
+def _format_issn(number):
+    digits = f'{number:07d}'
+    return f'{digits[:4]}-{digits[4:]}{issn_check_digit(digits)}'
+
+
+def _padding(size):
+    return b'\x00' * (-size % 8)
+
+
+def read_issn_l_table(path):
+    """
+    Lê a tabela de correspondência ISSN -> ISSN-L distribuída pelo ISSN International Centre
+    (arquivo de texto com as colunas ISSN e ISSN-L separadas por tabulação).
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo.
+
+    Returns
+    -------
+    generator of tuple
+        Pares (ISSN, ISSN-L).
+    """
+    with open(path, encoding='utf-8-sig') as fp:
+        for line in fp:
+            columns = line.split('\t')
+            if len(columns) >= 2 and columns[0].strip().upper() != 'ISSN':
+                yield columns[0].strip(), columns[1].strip()
+
+
+def read_journal_list_csv(path, delimiter=';'):
+    """
+    Lê uma lista de periódicos em CSV: cada linha contém o título do periódico seguido dos seus ISSN.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo CSV.
+    delimiter : str, default ';'
+        Separador de colunas do arquivo.
+
+    Returns
+    -------
+    generator of tuple
+        Pares (título, lista de ISSN).
+    """
+    with open(path, encoding='utf-8-sig', newline='') as fp:
+        for row in csv.reader(fp, delimiter=delimiter):
+            row = [c.strip() for c in row if c.strip()]
+            if len(row) >= 2:
+                yield row[0], row[1:]
+
+
+def build_issn_index(issn_l_pairs, journals, path):
+    """
+    Compila um índice de ISSN em um arquivo binário que pode ser mapeado em memória (ver load_issn_index).
+    Cada ISSN é armazenado como inteiro de 32 bits (sem o dígito verificador) em um array ordenado, acompanhado
+    do seu ISSN-L e do título canônico do periódico, o que resulta em 12 bytes por ISSN além dos títulos.
+    Um diretório de buckets por faixa de ISSN limita a busca binária a poucas posições.
+
+    Parameters
+    ----------
+    issn_l_pairs : iterable of tuple
+        Pares (ISSN, ISSN-L), por exemplo, a saída de read_issn_l_table.
+    journals : iterable of tuple
+        Pares (título, lista de ISSN), por exemplo, a saída de read_journal_list_csv. O título é associado ao
+        ISSN-L de cada ISSN; para ISSN-L repetidos prevalece o primeiro título.
+    path : str
+        Caminho do arquivo binário.
+
+    Returns
+    -------
+    int
+        Quantidade de ISSN indexados.
+    """
+    linking = {}
+    for issn, issn_l in issn_l_pairs:
+        issn, issn_l = _issn_number(issn), _issn_number(issn_l)
+        if issn is not None and issn_l is not None:
+            linking.setdefault(issn, issn_l)
+            linking.setdefault(issn_l, issn_l)
+
+    titles = []
+    title_ids = {}
+    for title, issns in journals:
+        numbers = [n for n in map(_issn_number, issns) if n is not None]
+        if not title or not numbers:
+            continue
+        for number in numbers:
+            linking.setdefault(number, numbers[0])
+        issn_l = linking[numbers[0]]
+        if issn_l not in title_ids:
+            title_ids[issn_l] = len(titles)
+            titles.append(title)
+
+    issns = array('I', sorted(linking))
+    issn_ls = array('I', (linking[n] for n in issns))
+    issn_titles = array('I', (title_ids.get(n, _NO_TITLE) for n in issn_ls))
+
+    buckets = array('I', [0]) * (_ISSN_NUMBER_LIMIT // ISSN_INDEX_BUCKET_SIZE + 1)
+    for number in issns:
+        buckets[number // ISSN_INDEX_BUCKET_SIZE + 1] += 1
+    for position in range(1, len(buckets)):
+        buckets[position] += buckets[position - 1]
+
+    title_blob = bytearray()
+    title_offsets = array('Q', [0])
+    for title in titles:
+        title_blob += title.encode('utf-8')
+        title_offsets.append(len(title_blob))
+
+    header = array('Q', [ISSN_INDEX_FORMAT_VERSION, len(issns), len(titles), len(title_blob)])
+    sections = [
+        buckets.tobytes(),
+        issns.tobytes(),
+        issn_ls.tobytes(),
+        issn_titles.tobytes(),
+        title_offsets.tobytes(),
+        bytes(title_blob),
+    ]
+    with open(path, 'wb') as fp:
+        fp.write(ISSN_INDEX_MAGIC)
+        fp.write(header.tobytes())
+        for section in sections:
+            fp.write(section)
+            fp.write(_padding(len(section)))
+    return len(issns)
+
+
+class ISSNIndex:
+    """
+    Índice de ISSN mapeado em memória (ver build_issn_index e load_issn_index), que associa qualquer ISSN
+    (impresso ou eletrônico) ao seu ISSN-L e ao título canônico do periódico.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        Conteúdo do arquivo compilado (em geral, um mmap).
+    """
+
+    def __init__(self, buffer):
+        offset = len(ISSN_INDEX_MAGIC) + 8 * _HEADER_SIZE
+        if len(buffer) < offset or buffer[:len(ISSN_INDEX_MAGIC)] != ISSN_INDEX_MAGIC:
+            raise InvalidISSNIndexFileError('Conteúdo não é um índice de ISSN compilado')
+        version, n_issns, n_titles, title_size = array('Q', buffer[len(ISSN_INDEX_MAGIC):offset])
+        if version != ISSN_INDEX_FORMAT_VERSION:
+            raise InvalidISSNIndexFileError(f'Versão {version} de índice de ISSN não suportada')
+        n_buckets = _ISSN_NUMBER_LIMIT // ISSN_INDEX_BUCKET_SIZE + 1
+        sizes = (4 * n_buckets, 4 * n_issns, 4 * n_issns, 4 * n_issns, 8 * (n_titles + 1), title_size)
+        if len(buffer) != offset + sum(size + (-size % 8) for size in sizes):
+            raise InvalidISSNIndexFileError('Tamanho do índice de ISSN compilado inválido')
+
+        self._buffer = buffer
+        view = memoryview(buffer)
+        sections = []
+        for size, fmt in zip(sizes, ('I', 'I', 'I', 'I', 'Q', None)):
+            data = view[offset:offset + size]
+            sections.append(data.cast(fmt) if fmt else data)
+            offset += size + (-size % 8)
+        self._buckets, self._issns, self._issn_ls, self._titles, self._title_offsets, self._title_blob = sections
+        self._views = [view, *sections]
+
+    def __len__(self):
+        return len(self._issns)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Libera as visões sobre o arquivo e fecha o mapeamento em memória."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def _position(self, text):
+        number = _issn_number(text)
+        if number is None:
+            return
+        bucket = number // ISSN_INDEX_BUCKET_SIZE
+        low, high = self._buckets[bucket], self._buckets[bucket + 1]
+        position = bisect.bisect_left(self._issns, number, low, high)
+        if position < high and self._issns[position] == number:
+            return position
+
+    def issn_l(self, text):
+        """
+        Obtém o ISSN-L de um ISSN.
+
+        Parameters
+        ----------
+        text : str
+            ISSN impresso ou eletrônico, em qualquer formato aceito por journal_issn.
+
+        Returns
+        -------
+        str or None
+            ISSN-L ou None quando o ISSN é inválido ou não está no índice.
+
+        Exemplo:
+            index.issn_l('1678-4464') == '0102-311X'
+        """
+        position = self._position(text)
+        if position is not None:
+            return _format_issn(self._issn_ls[position])
+
+    def title(self, text):
+        """
+        Obtém o título canônico do periódico de um ISSN.
+
+        Parameters
+        ----------
+        text : str
+            ISSN impresso ou eletrônico.
+
+        Returns
+        -------
+        str or None
+            Título do periódico ou None quando o ISSN não está no índice ou não tem título associado.
+        """
+        position = self._position(text)
+        if position is not None:
+            return self._title(self._titles[position])
+
+    def _title(self, title_id):
+        if title_id != _NO_TITLE:
+            start, end = self._title_offsets[title_id], self._title_offsets[title_id + 1]
+            return bytes(self._title_blob[start:end]).decode('utf-8')
+
+    def lookup(self, text):
+        """
+        Obtém o ISSN-L e o título canônico do periódico de um ISSN.
+
+        Parameters
+        ----------
+        text : str
+            ISSN impresso ou eletrônico.
+
+        Returns
+        -------
+        tuple or None
+            Par (ISSN-L, título) ou None quando o ISSN é inválido ou não está no índice.
+        """
+        position = self._position(text)
+        if position is not None:
+            return _format_issn(self._issn_ls[position]), self._title(self._titles[position])
+
+
+def load_issn_index(path):
+    """
+    Carrega um índice de ISSN compilado por build_issn_index, mapeando o arquivo em memória em modo somente
+    leitura. As páginas do arquivo são compartilhadas entre os processos que o carregam.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo binário.
+
+    Returns
+    -------
+    ISSNIndex
+        Índice de ISSN.
+    """
+    with open(path, 'rb') as fp:
+        try:
+            buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:
+            raise InvalidISSNIndexFileError(f"{exc}: Arquivo {path} não contém um índice de ISSN compilado")
+    try:
+        return ISSNIndex(buffer)
+    except InvalidISSNIndexFileError as exc:
+        buffer.close()
+        raise InvalidISSNIndexFileError(f"{exc}: {path}")
@@ -0,0 +1,224 @@
+import math
+import sys
+
+from array import array
+
+from scielo_scholarly_data.standardizer import (
+    journal_issn,
+    journal_title_for_deduplication,
+)
+from scielo_scholarly_data.unionfind import UnionFind
+from scielo_scholarly_data.values import JOURNAL_TITLE_STOP_WORDS
+
+
+def journal_title_tokens(text, ltwa=None):
+    """
+    Função para obter as palavras significativas de um título de periódico.
+    O título é padronizado com journal_title_for_deduplication, sem o conteúdo entre parênteses, e as palavras
+    de JOURNAL_TITLE_STOP_WORDS são removidas.
+
+    Parameters
+    ----------
+    text : str
+        Título do periódico.
+    ltwa : ltwa.LTWA, default None
+        Tabelas da LTWA. Quando informadas, cada palavra é substituída pela sua abreviatura ISO 4.
+
+    Returns
+    -------
+    tuple of str
+        Palavras significativas do título, na ordem original.
+    """
+    key = journal_title_for_deduplication(text, keep_parenthesis_content=False)
+    words = [w for w in key.split() if w not in JOURNAL_TITLE_STOP_WORDS]
+    if ltwa is not None:
+        words = [ltwa.abbreviate_word(w) for w in words]
+    return tuple(sys.intern(w) for w in words)
+
+
+def journal_title_similarity(tokens_a, tokens_b, min_prefix_size=3):
+    """
+    Função para calcular a similaridade entre dois títulos de periódicos tokenizados.
+    Duas palavras são equivalentes quando são iguais ou quando uma é prefixo da outra (abreviatura),
+    com pelo menos min_prefix_size caracteres. A similaridade é o coeficiente de Dice das palavras equivalentes.
+
+    Parameters
+    ----------
+    tokens_a : tuple of str
+        Palavras do primeiro título.
+    tokens_b : tuple of str
+        Palavras do segundo título.
+    min_prefix_size : int, default 3
+        Tamanho mínimo de uma abreviatura.
+
+    Returns
+    -------
+    float
+        Similaridade entre 0 e 1.
+
+    Exemplo:
+        journal_title_similarity(('rev', 'saude', 'publ'), ('revista', 'saude', 'publica')) == 1.0
+    """
+    if not tokens_a or not tokens_b:
+        return 0.0
+    unmatched = list(tokens_b)
+    abbreviations = []
+    for a in tokens_a:
+        if a in unmatched:
+            unmatched.remove(a)
+        else:
+            abbreviations.append(a)
+    matched = len(tokens_a) - len(abbreviations)
+    for a in abbreviations:
+        for i, b in enumerate(unmatched):
+            if b.startswith(a) if len(a) < len(b) else a.startswith(b):
+                if min(len(a), len(b)) >= min_prefix_size:
+                    matched += 1
+                    del unmatched[i]
+                    break
+    return 2 * matched / (len(tokens_a) + len(tokens_b))
+
+
+class JournalTitleClusterer:
+    """
+    Agrupamento incremental de títulos de periódicos variantes.
+    Títulos com a mesma chave padronizada são agrupados diretamente; os demais são comparados apenas com candidatos
+    obtidos em um índice invertido de q-gramas (os q primeiros caracteres de cada palavra, que são preservados por
+    abreviaturas como "Rev" e "Publ"). Os grupos são mantidos em uma estrutura union-find e o ISSN, quando presente,
+    é usado como ligação forte entre títulos.
+
+    Parameters
+    ----------
+    threshold : float, default 0.8
+        Similaridade mínima (ver journal_title_similarity) para que dois títulos sejam agrupados.
+    q : int, default 3
+        Tamanho do prefixo de cada palavra usado como q-grama no índice.
+    max_posting_size : int, default 1000
+        Quantidade máxima de títulos por q-grama. Q-gramas muito frequentes (como "rev") deixam de ser indexados,
+        o que limita a memória e a quantidade de candidatos por título.
+    ltwa : ltwa.LTWA, default None
+        Tabelas da LTWA usadas para abreviar as palavras dos títulos (ver journal_title_tokens).
+    """
+
+    def __init__(self, threshold=0.8, q=3, max_posting_size=1000, ltwa=None):
+        self.threshold = threshold
+        self.q = q
+        self.max_posting_size = max_posting_size
+        self.ltwa = ltwa
+        self._key_ids = {}
+        self._tokens = []
+        self._issn_ids = {}
+        self._postings = {}
+        self._stop_grams = set()
+        self._records = array('q')
+        self._union_find = UnionFind()
+
+    def __len__(self):
+        return len(self._records)
+
+    def _grams(self, tokens):
+        return [t[:self.q] for t in tokens]
+
+    def _candidates(self, grams):
+        # Para similaridade >= threshold, dois títulos precisam compartilhar ao menos required q-gramas.
+        # Pelo princípio da casa dos pombos, basta consultar os len(indexed) - required + 1 q-gramas mais raros.
+        distinct = set(grams)
+        required = math.ceil(self.threshold * len(grams) / (2 - self.threshold) - 1e-9)
+        required -= len(grams) - len(distinct)
+        required -= len(distinct & self._stop_grams)
+        indexed = sorted(
+            (p for p in (self._postings.get(g) for g in distinct) if p is not None),
+            key=len,
+        )
+        candidates = set()
+        for posting in indexed[:len(indexed) - max(required, 1) + 1]:
+            candidates.update(posting)
+        return candidates
+
+    def _index(self, key_id, grams):
+        for gram in set(grams):
+            if gram in self._stop_grams:
+                continue
+            posting = self._postings.setdefault(gram, array('q'))
+            if len(posting) >= self.max_posting_size:
+                del self._postings[gram]
+                self._stop_grams.add(gram)
+                continue
+            posting.append(key_id)
+
+    def _add_key(self, tokens):
+        key_id = self._union_find.add()
+        self._tokens.append(tokens)
+        if not tokens:
+            return key_id
+        self._key_ids[tokens] = key_id
+        grams = self._grams(tokens)
+        size = len(tokens)
+        for candidate in self._candidates(grams):
+            candidate_tokens = self._tokens[candidate]
+            if 2 * min(size, len(candidate_tokens)) < self.threshold * (size + len(candidate_tokens)):
+                continue
+            if self._union_find.connected(key_id, candidate):
+                continue
+            if journal_title_similarity(tokens, candidate_tokens) >= self.threshold:
+                self._union_find.union(key_id, candidate)
+        self._index(key_id, grams)
+        return key_id
+
+    def add(self, title, issn=None):
+        """
+        Adiciona um título (e, opcionalmente, o seu ISSN) ao agrupamento.
+
+        Parameters
+        ----------
+        title : str
+            Título do periódico.
+        issn : str, default None
+            ISSN do periódico. Títulos com o mesmo ISSN padronizado por journal_issn são sempre agrupados.
+
+        Returns
+        -------
+        int
+            Identificador sequencial do registro adicionado.
+        """
+        tokens = journal_title_tokens(title, self.ltwa)
+        key_id = self._key_ids.get(tokens)
+        if key_id is None:
+            key_id = self._add_key(tokens)
+
+        if issn:
+            issn = journal_issn(issn.strip())
+            if issn:
+                linked_id = self._issn_ids.setdefault(issn, key_id)
+                self._union_find.union(key_id, linked_id)
+
+        self._records.append(key_id)
+        return len(self._records) - 1
+
+    def cluster(self, record_id):
+        """
+        Obtém o representante do grupo de um registro.
+
+        Parameters
+        ----------
+        record_id : int
+            Identificador devolvido por add.
+
+        Returns
+        -------
+        int
+            Identificador do representante do grupo.
+        """
+        return self._union_find.find(self._records[record_id])
+
+    def assignments(self):
+        """
+        Obtém o rótulo do grupo de cada registro, na ordem de inserção.
+
+        Returns
+        -------
+        array of int
+            Rótulos densos, numerados a partir de 0.
+        """
+        key_labels = self._union_find.labels()
+        return array('q', (key_labels[key_id] for key_id in self._records))
@@ -0,0 +1,194 @@
+import csv
+import pickle
+
+from scielo_scholarly_data.core import remove_accents
+from scielo_scholarly_data.standardizer import journal_title_for_deduplication
+from scielo_scholarly_data.values import (
+    JOURNAL_TITLE_STOP_WORDS,
+    LTWA_NOT_ABBREVIATED,
+)
+
+
+LTWA_FORMAT_VERSION = 2
+
+# protocolo fixo, legível por todas as versões de Python suportadas, para que um arquivo gravado por um
+# interpretador possa ser carregado por outro
+LTWA_PICKLE_PROTOCOL = 4
+
+
+class InvalidLTWAFileError(Exception):
+    ...
+
+
+def _normalize(text):
+    return remove_accents(text).lower().replace('.', '').strip()
+
+
+class LTWA:
+    """
+    Tabelas compiladas da List of Title Word Abbreviations (ISSN LTWA).
+    As palavras completas são indexadas em uma tabela de busca exata e os radicais (entradas terminadas em "-")
+    e sufixos (entradas iniciadas por "-") em tabelas de prefixos e sufixos. A abreviatura de uma palavra é obtida
+    pelo maior radical que a inicia, consultando no máximo max_stem_size prefixos, sem percorrer a lista.
+
+    Parameters
+    ----------
+    words : dict
+        Palavra normalizada -> abreviatura normalizada.
+    stems : dict
+        Radical normalizado -> abreviatura normalizada.
+    suffixes : dict
+        Sufixo normalizado -> abreviatura normalizada do sufixo.
+    """
+
+    def __init__(self, words, stems, suffixes):
+        self.words = words
+        self.stems = stems
+        self.suffixes = suffixes
+        self.max_stem_size = max(map(len, stems), default=0)
+        self.max_suffix_size = max(map(len, suffixes), default=0)
+
+    def __len__(self):
+        return len(self.words) + len(self.stems) + len(self.suffixes)
+
+    def abbreviate_word(self, word):
+        """
+        Obtém a abreviatura de uma palavra normalizada (em caixa baixa e sem acentos).
+
+        Parameters
+        ----------
+        word : str
+            Palavra a ser abreviada.
+
+        Returns
+        -------
+        str
+            Abreviatura, sem pontos, ou a própria palavra caso não haja abreviatura.
+        """
+        abbreviation = self.words.get(word)
+        if abbreviation is not None:
+            return abbreviation
+
+        stems = self.stems
+        for size in range(min(len(word), self.max_stem_size), 0, -1):
+            abbreviation = stems.get(word[:size])
+            if abbreviation is not None:
+                return abbreviation
+
+        suffixes = self.suffixes
+        for size in range(min(len(word) - 1, self.max_suffix_size), 0, -1):
+            abbreviation = suffixes.get(word[-size:])
+            if abbreviation is not None:
+                return word[:-size] + abbreviation
+        return word
+
+    def save(self, path):
+        """
+        Grava as tabelas compiladas em formato binário de carregamento rápido (pickle com o protocolo
+        LTWA_PICKLE_PROTOCOL, ver load_ltwa).
+
+        Parameters
+        ----------
+        path : str
+            Caminho do arquivo binário.
+        """
+        with open(path, 'wb') as fp:
+            pickle.dump((LTWA_FORMAT_VERSION, self.words, self.stems, self.suffixes), fp, protocol=LTWA_PICKLE_PROTOCOL)
+
+
+def compile_ltwa(path, delimiter=';'):
+    """
+    Compila um arquivo CSV da LTWA, com as colunas WORDS, ABBREVIATIONS e LANGUAGES.
+    Entradas compostas por mais de uma palavra são ignoradas; para palavras repetidas prevalece a primeira entrada.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo CSV da LTWA.
+    delimiter : str, default ';'
+        Separador de colunas do arquivo.
+
+    Returns
+    -------
+    LTWA
+        Tabelas compiladas.
+    """
+    words = {}
+    stems = {}
+    suffixes = {}
+    with open(path, encoding='utf-8-sig', newline='') as fp:
+        reader = csv.reader(fp, delimiter=delimiter)
+        for row in reader:
+            if len(row) < 2 or row[0].strip().upper() == 'WORDS':
+                continue
+            word = _normalize(row[0])
+            abbreviation = row[1].strip()
+            if not word or ' ' in word:
+                continue
+
+            if word.startswith('-'):
+                table, word = suffixes, word.lstrip('-')
+            elif word.endswith('-'):
+                table, word = stems, word.rstrip('-')
+            else:
+                table = words
+
+            if abbreviation.lower() == LTWA_NOT_ABBREVIATED:
+                abbreviation = word
+            else:
+                abbreviation = _normalize(abbreviation).strip('-')
+            if word and abbreviation:
+                table.setdefault(word, abbreviation)
+    return LTWA(words, stems, suffixes)
+
+
+def load_ltwa(path):
+    """
+    Carrega tabelas da LTWA gravadas por LTWA.save.
+    O arquivo é lido com pickle: devem ser carregados apenas arquivos gravados por LTWA.save.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo binário.
+
+    Returns
+    -------
+    LTWA
+        Tabelas compiladas.
+    """
+    with open(path, 'rb') as fp:
+        try:
+            version, words, stems, suffixes = pickle.load(fp)
+        except (pickle.UnpicklingError, EOFError, ValueError, TypeError) as exc:
+            raise InvalidLTWAFileError(f"{exc}: Arquivo {path} não contém uma LTWA compilada")
+    if version != LTWA_FORMAT_VERSION:
+        raise InvalidLTWAFileError(f"Versão {version} de LTWA compilada não suportada")
+    return LTWA(words, stems, suffixes)
+
+
+def journal_title_abbreviation_key(text, ltwa):
+    """
+    Procedimento para gerar a chave de deduplicação de um título de periódico segundo a norma ISO 4, de modo que
+    o título completo e a sua abreviatura resultem na mesma chave:
+        1. Padroniza o título com journal_title_for_deduplication, sem o conteúdo entre parênteses;
+        2. Remove artigos, preposições e conjunções;
+        3. Substitui cada palavra pela sua abreviatura na LTWA.
+
+    Parameters
+    ----------
+    text : str
+        Título ou abreviatura do título do periódico.
+    ltwa : LTWA
+        Tabelas compiladas da LTWA (ver compile_ltwa e load_ltwa).
+
+    Returns
+    -------
+    str
+        Chave do título do periódico.
+
+    Exemplo:
+        journal_title_abbreviation_key('Revista de Saúde Pública', ltwa) == journal_title_abbreviation_key('Rev. Saúde Públ.', ltwa)
+    """
+    text = journal_title_for_deduplication(text, keep_parenthesis_content=False)
+    return ' '.join(ltwa.abbreviate_word(w) for w in text.split() if w not in JOURNAL_TITLE_STOP_WORDS)
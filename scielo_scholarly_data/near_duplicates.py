@@ -0,0 +1,223 @@
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from scielo_scholarly_data.standardizer import (
+    document_doi,
+    document_first_page,
+    document_title_for_deduplication,
+)
+
+
+def word_shingles(text, size=2):
+    """
+    Função para obter os shingles (sequências de size palavras consecutivas) de um texto padronizado.
+    Textos com menos de size palavras resultam em um único shingle com o texto inteiro.
+
+    Parameters
+    ----------
+    text : str
+        Texto padronizado, por exemplo, a saída de document_title_for_deduplication.
+    size : int, default 2
+        Quantidade de palavras por shingle.
+
+    Returns
+    -------
+    set of str
+        Shingles do texto.
+    """
+    words = text.split()
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _shingle_hashes(shingles):
+    return np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+
+class NearDuplicateDetector:
+    """
+    Detecção de documentos quase duplicados por MinHash e LSH (locality-sensitive hashing) sobre os títulos.
+    As assinaturas MinHash são calculadas de forma vetorizada, em lotes, e divididas em bandas; documentos
+    que coincidem em ao menos uma banda tornam-se candidatos. Os candidatos são confirmados pela similaridade
+    estimada e, quando presentes, por DOI, ano e primeira página.
+
+    Requer numpy.
+
+    Parameters
+    ----------
+    num_perm : int, default 64
+        Quantidade de funções de hash da assinatura MinHash.
+    bands : int, default 16
+        Quantidade de bandas do LSH. Deve dividir num_perm.
+    threshold : float, default 0.7
+        Similaridade de Jaccard estimada mínima para confirmar um par.
+    shingle_size : int, default 2
+        Quantidade de palavras por shingle.
+    max_bucket_size : int, default 1000
+        Tamanho máximo de um bucket do LSH; buckets maiores são ignorados.
+    batch_size : int, default 4096
+        Quantidade de documentos por lote no cálculo das assinaturas.
+    seed : int, default 1
+        Semente das funções de hash.
+    """
+
+    def __init__(self, num_perm=64, bands=16, threshold=0.7, shingle_size=2, max_bucket_size=1000,
+                 batch_size=4096, seed=1):
+        if np is None:
+            raise ImportError('numpy é necessário para NearDuplicateDetector')
+        if num_perm % bands:
+            raise ValueError(f'bands ({bands}) deve dividir num_perm ({num_perm})')
+        self.num_perm = num_perm
+        self.bands = bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.max_bucket_size = max_bucket_size
+        self.batch_size = batch_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+        self._band_multipliers = rng.integers(1, 2 ** 63, size=num_perm // bands, dtype=np.uint64) | np.uint64(1)
+
+        self._pending = []
+        self._signatures = []
+        self._metadata = []
+        self._has_shingles = bytearray()
+
+    def __len__(self):
+        return len(self._metadata)
+
+    def add(self, title, year=None, first_page=None, doi=None):
+        """
+        Adiciona um documento.
+
+        Parameters
+        ----------
+        title : str
+            Título do documento.
+        year : str or int, default None
+            Ano de publicação.
+        first_page : str, default None
+            Primeira página.
+        doi : str, default None
+            DOI do documento.
+
+        Returns
+        -------
+        int
+            Identificador sequencial do documento.
+        """
+        shingles = word_shingles(document_title_for_deduplication(title), self.shingle_size)
+        self._pending.append(_shingle_hashes(shingles))
+        self._has_shingles.append(1 if shingles else 0)
+
+        if doi:
+            doi = document_doi(doi, return_mode='path')
+            doi = doi.lower() if isinstance(doi, str) else None
+        if first_page:
+            first_page = document_first_page(first_page)
+        self._metadata.append((str(year) if year else None, first_page or None, doi or None))
+
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        return len(self._metadata) - 1
+
+    def _flush(self):
+        if not self._pending:
+            return
+        signatures = np.full((len(self._pending), self.num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+        lengths = np.fromiter(map(len, self._pending), dtype=np.int64, count=len(self._pending))
+        non_empty = np.flatnonzero(lengths)
+        if len(non_empty):
+            values = np.concatenate([self._pending[i] for i in non_empty])
+            # hash multiply-shift: os 32 bits altos de a * x + b (mod 2^64)
+            mixed = (self._a[:, None] * values[None, :] + self._b[:, None]) >> np.uint64(32)
+            offsets = np.concatenate(([0], np.cumsum(lengths[non_empty])[:-1]))
+            signatures[non_empty] = np.minimum.reduceat(mixed, offsets, axis=1).T.astype(np.uint32)
+        self._signatures.append(signatures)
+        self._pending = []
+
+    def signatures(self):
+        """
+        Obtém as assinaturas MinHash de todos os documentos adicionados.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matriz (documentos x num_perm) de uint32.
+        """
+        self._flush()
+        if len(self._signatures) > 1:
+            self._signatures = [np.concatenate(self._signatures)]
+        if not self._signatures:
+            return np.empty((0, self.num_perm), dtype=np.uint32)
+        return self._signatures[0]
+
+    def _confirm(self, a, b, signatures):
+        year_a, page_a, doi_a = self._metadata[a]
+        year_b, page_b, doi_b = self._metadata[b]
+        if doi_a and doi_b:
+            if doi_a == doi_b:
+                return 1.0
+            return
+        if year_a and year_b and year_a != year_b:
+            return
+        if page_a and page_b and page_a != page_b:
+            return
+        similarity = float(np.count_nonzero(signatures[a] == signatures[b])) / self.num_perm
+        if similarity >= self.threshold:
+            return similarity
+
+    def _first_shared_band(self, a, b, signatures):
+        equal = (signatures[a] == signatures[b]).reshape(self.bands, -1).all(axis=1)
+        return int(np.argmax(equal))
+
+    def candidate_pairs(self):
+        """
+        Gera os pares de documentos que coincidem em ao menos uma banda do LSH.
+        Cada par é gerado uma única vez, na primeira banda em que os documentos coincidem.
+
+        Returns
+        -------
+        generator of tuple
+            Pares (id, id), com o menor identificador primeiro.
+        """
+        signatures = self.signatures()
+        valid = np.flatnonzero(np.frombuffer(bytes(self._has_shingles), dtype=np.uint8))
+        rows = self.num_perm // self.bands
+        for band in range(self.bands):
+            keys = signatures[valid, band * rows:(band + 1) * rows].astype(np.uint64) @ self._band_multipliers
+            order = np.argsort(keys, kind='stable')
+            sorted_keys = keys[order]
+            starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+            ends = np.concatenate((starts[1:], [len(sorted_keys)]))
+            sizes = ends - starts
+            for start, end in zip(starts[sizes >= 2].tolist(), ends[sizes >= 2].tolist()):
+                if end - start > self.max_bucket_size:
+                    continue
+                bucket = valid[order[start:end]].tolist()
+                for i in range(len(bucket)):
+                    for j in range(i + 1, len(bucket)):
+                        a, b = bucket[i], bucket[j]
+                        if band == 0 or self._first_shared_band(a, b, signatures) == band:
+                            yield a, b
+
+    def duplicate_pairs(self):
+        """
+        Gera os pares de documentos quase duplicados confirmados.
+
+        Returns
+        -------
+        generator of tuple
+            Triplas (id, id, similaridade), cada par uma única vez.
+        """
+        signatures = self.signatures()
+        for a, b in self.candidate_pairs():
+            similarity = self._confirm(a, b, signatures)
+            if similarity is not None:
+                yield a, b, similarity
@@ -0,0 +1,320 @@
+import collections
+import json
+import os
+import pathlib
+import sqlite3
+
+from scielo_scholarly_data import outcomes
+from scielo_scholarly_data.values import NORMALIZATION_RULES_VERSION
+
+
+NORMALIZATION_CACHE_BATCH_SIZE = 500
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS namespaces (id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, '
+    'rules_version INTEGER NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS entries (namespace INTEGER NOT NULL, raw TEXT NOT NULL, value TEXT, error TEXT, '
+    'outcomes TEXT, PRIMARY KEY (namespace, raw)) WITHOUT ROWID',
+)
+
+def function_name(function):
+    """
+    Obtém o nome qualificado de uma função (módulo.função), usado na chave do cache.
+
+    Parameters
+    ----------
+    function : callable
+        Função padronizadora.
+
+    Returns
+    -------
+    str
+        Nome no formato módulo.função, por exemplo, scielo_scholarly_data.standardizer.document_doi.
+    """
+    module = getattr(function, '__module__', None) or type(function).__module__
+    return f'{module}.{function.__qualname__}'
+
+
+def namespace_key(function, options=None, rules_version=NORMALIZATION_RULES_VERSION):
+    """
+    Gera a chave que identifica os valores padronizados de uma função: nome da função, opções (argumentos
+    nomeados) e versão das regras de normalização. A alteração de qualquer um deles leva a outra chave, o que
+    invalida as entradas anteriores.
+
+    Parameters
+    ----------
+    function : callable or str
+        Função padronizadora ou o seu nome qualificado.
+    options : dict, default None
+        Argumentos nomeados passados à função.
+    rules_version : int, default NORMALIZATION_RULES_VERSION
+        Versão das regras de normalização.
+
+    Returns
+    -------
+    str
+        Chave do espaço de nomes.
+
+    Exemplo:
+        namespace_key(document_doi, {'return_mode': 'path'})
+        'scielo_scholarly_data.standardizer.document_doi{"return_mode": "path"}@1'
+    """
+    name = function if isinstance(function, str) else function_name(function)
+    return f'{name}{json.dumps(options or {}, sort_keys=True, default=_option_to_json)}@{rules_version}'
+
+
+def _option_to_json(value):
+    # conjuntos são ordenados para que a chave não dependa da ordem de iteração (que varia entre processos)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return repr(value)
+
+
+def _has_outcomes_column(connection):
+    return 'outcomes' in [row[1] for row in connection.execute('PRAGMA table_info(entries)')]
+
+
+class NormalizationCache:
+    """
+    Cache persistente (SQLite) de valores padronizados: para cada função, opções e versão das regras de
+    normalização, armazena o valor padronizado de cada valor original.
+
+    O arquivo pode ser compartilhado por vários processos: o banco usa o modo WAL, que permite leituras
+    concorrentes a uma escrita, e cada processo abre a sua própria conexão no primeiro acesso. As consultas e
+    gravações são feitas em lote (ver standardize_many).
+
+    Os valores padronizados são armazenados em JSON: tuplas são lidas como listas. Exceções lançadas pela
+    função são armazenadas pelo nome da classe. Os contadores do módulo outcomes incrementados pela função
+    também são armazenados e, a cada valor lido do cache, são incrementados novamente, de modo que
+    outcomes.snapshot não depende de o valor ter sido calculado ou lido do cache.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo do cache.
+    readonly : bool, default False
+        Valor lógico que indica se o cache deve ser aberto somente para leitura; os valores não encontrados são
+        calculados, mas não são gravados.
+    rules_version : int, default NORMALIZATION_RULES_VERSION
+        Versão das regras de normalização.
+    timeout : float, default 30.0
+        Tempo máximo de espera, em segundos, por um bloqueio de escrita de outro processo.
+    """
+
+    def __init__(self, path, readonly=False, rules_version=NORMALIZATION_RULES_VERSION, timeout=30.0):
+        self.path = path
+        self.readonly = readonly
+        self.rules_version = rules_version
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+        self._namespaces = {}
+        self._outcomes_column = 'outcomes'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Fecha a conexão do processo atual."""
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._namespaces = {}
+
+    @property
+    def connection(self):
+        # conexões SQLite não podem ser herdadas por processos filhos: cada processo abre a sua
+        if self._connection is None or self._pid != os.getpid():
+            if self.readonly:
+                # o caminho é convertido em URI, com '?', '#' e '%' escapados
+                uri = pathlib.Path(self.path).absolute().as_uri()
+                connection = sqlite3.connect(f'{uri}?mode=ro', uri=True, timeout=self.timeout)
+            else:
+                connection = sqlite3.connect(self.path, timeout=self.timeout)
+                connection.execute('PRAGMA journal_mode=WAL')
+                connection.execute('PRAGMA synchronous=NORMAL')
+                with connection:
+                    for statement in _SCHEMA:
+                        connection.execute(statement)
+                    # arquivos criados antes da coluna outcomes
+                    if not _has_outcomes_column(connection):
+                        connection.execute('ALTER TABLE entries ADD COLUMN outcomes TEXT')
+            self._outcomes_column = 'outcomes' if _has_outcomes_column(connection) else 'NULL'
+            self._connection = connection
+            self._pid = os.getpid()
+            self._namespaces = {}
+        return self._connection
+
+    def _namespace(self, function, options, create):
+        key = namespace_key(function, options, self.rules_version)
+        namespace = self._namespaces.get(key)
+        if namespace is None:
+            row = self.connection.execute('SELECT id FROM namespaces WHERE key = ?', (key,)).fetchone()
+            if row is None and create:
+                with self.connection:
+                    self.connection.execute(
+                        'INSERT OR IGNORE INTO namespaces (key, rules_version) VALUES (?, ?)', (key, self.rules_version)
+                    )
+                row = self.connection.execute('SELECT id FROM namespaces WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            namespace = self._namespaces[key] = row[0]
+        return namespace
+
+    def get_many(self, function, values, **options):
+        """
+        Consulta em lote os valores padronizados armazenados.
+
+        Parameters
+        ----------
+        function : callable or str
+            Função padronizadora ou o seu nome qualificado.
+        values : iterable of str
+            Valores originais.
+        **options
+            Argumentos nomeados da função.
+
+        Returns
+        -------
+        dict
+            Para cada valor encontrado, o par (valor padronizado, nome da exceção ou None).
+        """
+        return {raw: (value, error) for raw, (value, error, _) in self._select(function, values, options).items()}
+
+    def _select(self, function, values, options):
+        namespace = self._namespace(function, options, create=False)
+        if namespace is None:
+            return {}
+        values = list(dict.fromkeys(values))
+        found = {}
+        for start in range(0, len(values), NORMALIZATION_CACHE_BATCH_SIZE):
+            batch = values[start:start + NORMALIZATION_CACHE_BATCH_SIZE]
+            rows = self.connection.execute(
+                f'SELECT raw, value, error, {self._outcomes_column} FROM entries '
+                f'WHERE namespace = ? AND raw IN ({",".join("?" * len(batch))})',
+                [namespace, *batch],
+            )
+            for raw, value, error, counts in rows:
+                found[raw] = (
+                    json.loads(value) if value is not None else None, error, json.loads(counts) if counts else {},
+                )
+        return found
+
+    def put_many(self, function, items, **options):
+        """
+        Grava em lote valores padronizados.
+
+        Parameters
+        ----------
+        function : callable or str
+            Função padronizadora ou o seu nome qualificado.
+        items : iterable of tuple
+            Triplas (valor original, valor padronizado, nome da exceção ou None), seguidas opcionalmente dos
+            contadores do módulo outcomes incrementados pela função (no formato de outcomes.snapshot).
+        **options
+            Argumentos nomeados da função.
+        """
+        if self.readonly:
+            return
+        namespace = self._namespace(function, options, create=True)
+        with self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO entries (namespace, raw, value, error, outcomes) VALUES (?, ?, ?, ?, ?)',
+                (
+                    (
+                        namespace, raw, json.dumps(value) if value is not None else None, error,
+                        json.dumps(counts[0], sort_keys=True) if counts and counts[0] else None,
+                    )
+                    for raw, value, error, *counts in items
+                ),
+            )
+
+    def standardize_many(self, function, values, default=None, **options):
+        """
+        Padroniza uma lista de valores consultando o cache em lote: apenas os valores distintos que não estão no
+        cache são passados à função, e os resultados são gravados em uma única transação.
+
+        Os valores para os quais a função lança uma exceção, calculados agora ou lidos do cache, resultam em
+        default; a exceção não é propagada, mas o seu nome é armazenado (ver get_many). Os contadores do módulo
+        outcomes são incrementados uma vez para cada valor de values, como se a função tivesse sido chamada com
+        cada um deles.
+
+        Parameters
+        ----------
+        function : callable
+            Função padronizadora, por exemplo, standardizer.journal_title_for_deduplication.
+        values : iterable of str
+            Valores originais.
+        default : any, default None
+            Resultado dos valores para os quais a função lança uma exceção.
+        **options
+            Argumentos nomeados da função.
+
+        Returns
+        -------
+        list
+            Valores padronizados, na ordem de values.
+
+        Exemplo:
+            with NormalizationCache('cache.sqlite') as cache:
+                cache.standardize_many(journal_issn, ['1387666x', '0034-8910'], use_issn_validator=True)
+            ['1387-666X', '0034-8910']
+        """
+        values = list(values)
+        found = self._select(function, values, options)
+        computed = []
+        for value in dict.fromkeys(values):
+            if value in found:
+                continue
+            with outcomes.record() as counts:
+                try:
+                    result, error = function(value, **options), None
+                except Exception as exc:
+                    result, error = None, type(exc).__name__
+            found[value] = (result, error, counts)
+            computed.append((value, result, error, counts))
+        self.misses += len(computed)
+        self.hits += len(found) - len(computed)
+        if computed:
+            self.put_many(function, computed, **options)
+
+        # os valores calculados agora já incrementaram os contadores uma vez
+        occurrences = collections.Counter(values)
+        for value, *_ in computed:
+            occurrences[value] -= 1
+        replayed = {}
+        for value, times in occurrences.items():
+            for name, counts in found[value][2].items():
+                replayed_counts = replayed.setdefault(name, {})
+                for outcome, count in counts.items():
+                    replayed_counts[outcome] = replayed_counts.get(outcome, 0) + count * times
+        outcomes.merge(replayed)
+        return [default if found[value][1] is not None else found[value][0] for value in values]
+
+    def prune(self):
+        """
+        Remove as entradas geradas com outras versões das regras de normalização.
+
+        Returns
+        -------
+        int
+            Quantidade de entradas removidas.
+        """
+        with self.connection:
+            stale = [row[0] for row in self.connection.execute(
+                'SELECT id FROM namespaces WHERE rules_version != ?', (self.rules_version,)
+            )]
+            removed = 0
+            for namespace in stale:
+                removed += self.connection.execute('DELETE FROM entries WHERE namespace = ?', (namespace,)).rowcount
+                self.connection.execute('DELETE FROM namespaces WHERE id = ?', (namespace,))
+        self._namespaces = {}
+        return removed
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
@@ -0,0 +1,277 @@
+"""
+Contadores de resultados de validação e padronização, por função e resultado (por exemplo,
+('standardizer.document_doi', 'invalid doi') ou ('dates.convert_to_iso_date', 'DateDayError')).
+
+Cada thread incrementa a sua própria tabela, sem bloqueio; snapshot soma as tabelas de todas as threads.
+Quando uma thread termina, os seus contadores são somados a uma tabela comum e a sua tabela é descartada, de
+modo que threads de curta duração (por exemplo, de um executor) não acumulam tabelas.
+Em processos filhos criados por fork as tabelas herdadas são descartadas, de modo que cada processo de um pool
+conta apenas os seus registros. Ao final de cada tarefa de um lote, os processos devolvem drain (os contadores
+acumulados desde a tarefa anterior) e o processo principal soma os resultados com combine ou merge:
+
+    counts = pool.map(process_chunk, chunks)   # cada tarefa devolve outcomes.drain()
+    outcomes.merge(outcomes.combine(counts))
+"""
+import os
+import threading
+import weakref
+
+from scielo_scholarly_data.helpers import escape_prometheus_label
+
+
+OK = 'ok'
+NONE = 'none'
+
+PROMETHEUS_METRIC = 'scielo_scholarly_data_outcomes_total'
+
+_local = threading.local()
+_tables = []
+# contadores das threads já encerradas
+_retired = {}
+_drained = {}
+# reentrante: a finalização da tabela de uma thread pode ocorrer durante a coleta de lixo em uma thread que já
+# detém o bloqueio
+_lock = threading.RLock()
+# incrementado após um fork, para que as finalizações das tabelas herdadas não alterem os contadores do filho
+_generation = 0
+
+
+class _TableOwner:
+    # guardado no threading.local junto com a tabela: é coletado quando a thread termina
+    __slots__ = ('__weakref__',)
+
+
+def _retire(table, generation):
+    with _lock:
+        if generation != _generation:
+            return
+        for index, current in enumerate(_tables):
+            if current is table:
+                del _tables[index]
+                break
+        for key, value in table.items():
+            _retired[key] = _retired.get(key, 0) + value
+
+
+def _new_table():
+    table = {}
+    owner = _TableOwner()
+    with _lock:
+        _tables.append(table)
+        weakref.finalize(owner, _retire, table, _generation)
+    _local.table = table
+    _local.owner = owner
+    return table
+
+
+def count(key):
+    """
+    Incrementa o contador de um resultado.
+    Por ser chamada a cada registro padronizado, recebe a chave já montada, que deve ser criada uma única vez
+    (em geral, como constante do módulo que produz o resultado).
+
+    Parameters
+    ----------
+    key : tuple of str
+        Par (função que produziu o resultado no formato módulo.função, resultado). O resultado é, por exemplo,
+        OK, NONE, a mensagem de erro devolvida ou o nome da exceção lançada.
+
+    Exemplo:
+        count(('standardizer.document_doi', 'invalid doi'))
+    """
+    try:
+        table = _local.table
+    except AttributeError:
+        table = _new_table()
+    table[key] = table.get(key, 0) + 1
+
+
+class record:
+    """
+    Registra os contadores incrementados pela thread atual dentro do bloco with. Os incrementos continuam sendo
+    contados normalmente; o registro permite reproduzi-los depois com merge (por exemplo, quando um valor
+    padronizado é lido de um cache em vez de ser calculado novamente).
+
+    Exemplo:
+        with record() as counts:
+            standardizer.document_doi('sem doi')
+        counts
+        {'standardizer.document_doi': {'invalid doi': 1}}
+    """
+
+    def __init__(self):
+        self.counts = {}
+
+    def __enter__(self):
+        try:
+            self._table = _local.table
+        except AttributeError:
+            self._table = _new_table()
+        self._before = dict(self._table)
+        return self.counts
+
+    def __exit__(self, *exc):
+        for (function, outcome), value in self._table.items():
+            value -= self._before.get((function, outcome), 0)
+            if value > 0:
+                self.counts.setdefault(function, {})[outcome] = value
+        self._table = self._before = None
+
+
+def snapshot():
+    """
+    Obtém os contadores acumulados no processo atual, somando as tabelas de todas as threads.
+
+    Returns
+    -------
+    dict
+        Para cada função, um dict com a quantidade de ocorrências de cada resultado.
+
+    Exemplo:
+        {'standardizer.document_doi': {'ok': 980, 'invalid doi': 20}}
+    """
+    with _lock:
+        tables = [dict(_retired), *_tables]
+    result = {}
+    for table in tables:
+        for (function, outcome), value in list(table.items()):
+            outcomes = result.setdefault(function, {})
+            outcomes[outcome] = outcomes.get(outcome, 0) + value
+    return result
+
+
+def drain():
+    """
+    Obtém os contadores acumulados no processo atual desde a chamada anterior de drain (ou desde reset).
+    As tabelas das threads não são alteradas, de modo que nenhum incremento concorrente é perdido.
+
+    Returns
+    -------
+    dict
+        Contadores no formato de snapshot.
+    """
+    with _lock:
+        current = snapshot()
+        result = {}
+        for function, outcomes in current.items():
+            drained = _drained.setdefault(function, {})
+            for outcome, value in outcomes.items():
+                if value != drained.get(outcome, 0):
+                    result.setdefault(function, {})[outcome] = value - drained.get(outcome, 0)
+                    drained[outcome] = value
+    return result
+
+
+def merge(counts):
+    """
+    Acumula no processo atual os contadores de outro processo ou de um lote.
+
+    Parameters
+    ----------
+    counts : dict
+        Contadores no formato de snapshot.
+    """
+    try:
+        table = _local.table
+    except AttributeError:
+        table = _new_table()
+    for function, outcomes in counts.items():
+        for outcome, value in outcomes.items():
+            key = (function, outcome)
+            table[key] = table.get(key, 0) + value
+
+
+def combine(counts):
+    """
+    Soma contadores de vários processos ou lotes, sem alterar os contadores do processo atual.
+
+    Parameters
+    ----------
+    counts : iterable of dict
+        Contadores no formato de snapshot.
+
+    Returns
+    -------
+    dict
+        Contadores somados, no formato de snapshot.
+    """
+    result = {}
+    for partial in counts:
+        for function, outcomes in partial.items():
+            combined = result.setdefault(function, {})
+            for outcome, value in outcomes.items():
+                combined[outcome] = combined.get(outcome, 0) + value
+    return result
+
+
+def reset():
+    """Zera os contadores de todas as threads do processo atual."""
+    with _lock:
+        for table in _tables:
+            table.clear()
+        _retired.clear()
+        _drained.clear()
+
+
+def rates(counts=None):
+    """
+    Calcula a proporção de cada resultado em relação ao total de chamadas da função.
+
+    Parameters
+    ----------
+    counts : dict, default None
+        Contadores no formato de snapshot; quando não informados, são usados os do processo atual.
+
+    Returns
+    -------
+    dict
+        Para cada função, um dict com a proporção de cada resultado.
+    """
+    counts = snapshot() if counts is None else counts
+    result = {}
+    for function, outcomes in counts.items():
+        total = sum(outcomes.values())
+        result[function] = {outcome: value / total for outcome, value in outcomes.items()} if total else {}
+    return result
+
+
+def to_prometheus(counts=None, metric=PROMETHEUS_METRIC):
+    """
+    Exporta os contadores no formato de texto do Prometheus, com os rótulos function e outcome.
+
+    Parameters
+    ----------
+    counts : dict, default None
+        Contadores no formato de snapshot; quando não informados, são usados os do processo atual.
+    metric : str, default PROMETHEUS_METRIC
+        Nome da métrica.
+
+    Returns
+    -------
+    str
+        Métrica no formato de exposição de texto do Prometheus.
+    """
+    counts = snapshot() if counts is None else counts
+    lines = [
+        f'# HELP {metric} Quantidade de resultados de validação e padronização.',
+        f'# TYPE {metric} counter',
+    ]
+    for function in sorted(counts):
+        for outcome in sorted(counts[function]):
+            labels = f'function="{escape_prometheus_label(function)}",outcome="{escape_prometheus_label(outcome)}"'
+            lines.append(f'{metric}{{{labels}}} {counts[function][outcome]}')
+    return '\n'.join(lines) + '\n'
+
+
+def _reset_after_fork():
+    global _local, _tables, _retired, _drained, _lock, _generation
+    _generation += 1
+    _local = threading.local()
+    _tables = []
+    _retired = {}
+    _drained = {}
+    _lock = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,357 @@
+import re
+import time
+
+from functools import lru_cache
+
+from scielo_scholarly_data import core, profiling
+from scielo_scholarly_data.dates import convert_to_iso_date
+from scielo_scholarly_data.values import PUNCTUATION_TO_REMOVE_FROM_TITLE_VISUALIZATION
+
+
+COLLAPSED_SPACES = 'collapsed_spaces'
+STRIPPED = 'stripped'
+
+PATTERN_UPPERCASE_ASCII = re.compile(r'[A-Z]')
+
+
+class UnknownStepError(Exception):
+    ...
+
+
+class _Step:
+    __slots__ = ('name', 'function', 'char_filter', 'ensures', 'preserves', 'drop_if_ensured', 'is_fixed')
+
+    def __init__(self, name, function, char_filter, ensures, preserves, drop_if_ensured, is_fixed):
+        self.name = name
+        self.function = function
+        self.char_filter = char_filter
+        self.ensures = ensures
+        self.preserves = preserves
+        self.drop_if_ensured = drop_if_ensured
+        self.is_fixed = is_fixed
+
+
+STEPS = {}
+
+
+def register_step(name, function, char_filter=False, ensures=(), preserves=(), drop_if_ensured=False, is_fixed=None):
+    """
+    Registra uma etapa que pode ser utilizada em especificações de pipeline.
+
+    Parameters
+    ----------
+    name : str
+        Nome da etapa na especificação.
+    function : callable
+        Função que recebe o texto (e os parâmetros da etapa) e devolve o texto tratado.
+    char_filter : bool, default False
+        Valor lógico que indica se a função trata cada caractere de forma independente, isto é,
+        se function(a + b) == function(a) + function(b). Etapas desse tipo, quando adjacentes, são fundidas.
+    ensures : iterable of str
+        Propriedades do texto garantidas após a execução da etapa (por exemplo, COLLAPSED_SPACES).
+    preserves : iterable of str or callable
+        Propriedades mantidas pela etapa. Pode ser uma função que recebe os parâmetros da etapa.
+    drop_if_ensured : bool, default False
+        Valor lógico que indica se a etapa pode ser descartada quando as propriedades que ela garante já valem.
+    is_fixed : callable, default None
+        Verificação barata que recebe o texto (e os parâmetros da etapa) e retorna True apenas se a etapa
+        devolveria o texto inalterado. Para filtros de caracteres, a verificação é derivada automaticamente.
+
+    """
+    STEPS[name] = _Step(name, function, char_filter, frozenset(ensures), preserves, drop_if_ensured, is_fixed)
+
+
+def _remove_spaces(text):
+    return text.replace(' ', '')
+
+
+def _has_collapsed_spaces(text):
+    # str.isprintable é falso para qualquer espaço em branco que não seja ' '
+    return text.isprintable() and '  ' not in text and not text.startswith(' ') and not text.endswith(' ')
+
+
+def _is_stripped(text):
+    return not text or not (text[0].isspace() or text[-1].isspace())
+
+
+def _is_lower(text):
+    return text.isascii() and not PATTERN_UPPERCASE_ASCII.search(text)
+
+
+def _has_no_entities(text):
+    return '&' not in text
+
+
+def _has_no_parenthesis(text):
+    return '(' not in text and _has_collapsed_spaces(text)
+
+
+def _has_no_end_punctuation(text, end_punctuation_chars_to_remove=PUNCTUATION_TO_REMOVE_FROM_TITLE_VISUALIZATION):
+    return not text.endswith(tuple(end_punctuation_chars_to_remove))
+
+
+def _has_no_words(text, words_to_remove=()):
+    return not any(word in words_to_remove for word in text.split(' '))
+
+
+def _has_ordered_name(text, surname_first=True):
+    if not surname_first:
+        return ',' not in text
+    if ',' not in text:
+        return ' ' not in text
+    surname, separator, name = text.partition(', ')
+    return bool(separator and surname and name) and ',' not in surname + name and name == name.strip()
+
+
+def _has_no_spaces(text):
+    return ' ' not in text
+
+
+def _end_punctuation_preserves(params):
+    if ' ' in dict(params).get('end_punctuation_chars_to_remove', PUNCTUATION_TO_REMOVE_FROM_TITLE_VISUALIZATION):
+        return {COLLAPSED_SPACES, STRIPPED}
+    return ()
+
+
+register_step('unescape', core.unescape, is_fixed=_has_no_entities)
+register_step('remove_non_printable_chars', core.remove_non_printable_chars, char_filter=True)
+register_step('keep_alpha_num_space', core.keep_alpha_num_space, char_filter=True)
+register_step('keep_alpha_space', core.keep_alpha_space, char_filter=True)
+register_step('remove_accents', core.remove_accents, char_filter=True)
+register_step('remove_chars', core.remove_chars, char_filter=True)
+register_step('remove_double_spaces', core.remove_double_spaces,
+              ensures=(COLLAPSED_SPACES, STRIPPED), drop_if_ensured=True, is_fixed=_has_collapsed_spaces)
+register_step('remove_parenthesis', core.remove_parenthesis,
+              ensures=(COLLAPSED_SPACES, STRIPPED), is_fixed=_has_no_parenthesis)
+register_step('remove_end_punctuation_chars', core.remove_end_punctuation_chars,
+              preserves=_end_punctuation_preserves, is_fixed=_has_no_end_punctuation)
+register_step('remove_words', core.remove_words, preserves=(COLLAPSED_SPACES,), is_fixed=_has_no_words)
+register_step('order_name_and_surname', core.order_name_and_surname, is_fixed=_has_ordered_name)
+register_step('strip', str.strip, ensures=(STRIPPED,), drop_if_ensured=True, is_fixed=_is_stripped)
+register_step('lower', str.lower, preserves=(COLLAPSED_SPACES, STRIPPED), is_fixed=_is_lower)
+register_step('remove_spaces', _remove_spaces, is_fixed=_has_no_spaces)
+register_step('convert_to_iso_date', convert_to_iso_date)
+
+
+class _CharTable(dict):
+    """
+    Tabela de tradução preenchida sob demanda: cada caractere é tratado uma única vez
+    pela sequência de filtros e o resultado é reutilizado por str.translate.
+    """
+    __slots__ = ('functions',)
+
+    def __init__(self, functions):
+        super().__init__()
+        self.functions = functions
+
+    def __missing__(self, ordinal):
+        text = chr(ordinal)
+        for function in self.functions:
+            text = function(text)
+        self[ordinal] = text
+        return text
+
+
+def _bind(function, params):
+    if not params:
+        return function
+    kwargs = dict(params)
+    return lambda text: function(text, **kwargs)
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def _normalize_spec(spec):
+    entries = []
+    for entry in spec:
+        if isinstance(entry, str):
+            name, params = entry, ()
+        else:
+            name, params = entry[0], _freeze(entry[1] if len(entry) > 1 else {})
+        if name not in STEPS:
+            raise UnknownStepError(f"Etapa {name} não registrada")
+        entries.append((name, params))
+    return tuple(entries)
+
+
+def _drop_redundant_steps(entries):
+    properties = set()
+    kept = []
+    for name, params in entries:
+        step = STEPS[name]
+        if step.drop_if_ensured and step.ensures <= properties:
+            continue
+        preserves = step.preserves(params) if callable(step.preserves) else step.preserves
+        properties = properties.intersection(preserves) | step.ensures
+        kept.append((name, params))
+    return kept
+
+
+def _changed_ascii_chars(table):
+    unchanged = ''.join(chr(o) for o in range(128) if table[o] == chr(o))
+    return re.compile('[^' + re.escape(unchanged) + ']') if unchanged else re.compile('.', re.DOTALL)
+
+
+def _char_table_is_fixed(table):
+    # a expressão com os caracteres ASCII alterados pelos filtros é montada na primeira verificação,
+    # e não na compilação do pipeline, que ocorre na importação dos módulos
+    changed = None
+
+    def is_fixed(text):
+        nonlocal changed
+        if changed is None:
+            changed = _changed_ascii_chars(table)
+        return text.isascii() and not changed.search(text)
+
+    return is_fixed
+
+
+class Pipeline:
+    """
+    Sequência compilada de etapas de padronização.
+
+    Attributes
+    ----------
+    steps : tuple of str
+        Nomes das etapas efetivamente executadas. Filtros de caracteres fundidos aparecem unidos por '+'.
+    """
+    __slots__ = ('steps', '_functions', '_checks')
+
+    def __init__(self, steps, functions, checks=None):
+        self.steps = tuple(steps)
+        self._functions = tuple(functions)
+        self._checks = tuple(checks) if checks is not None else None
+
+    def _call(self, text):
+        if self.is_canonical(text):
+            return text
+        for function in self._functions:
+            text = function(text)
+        return text
+
+    __call__ = _call
+
+    def _profiled_call(self, text):
+        # substitui __call__ enquanto a instrumentação está ativa (ver profiling.enable)
+        profiler = profiling.active_profiler()
+        if profiler is None:
+            return self._call(text)
+        function = profiling.current_function()
+
+        if self._checks is not None:
+            start = time.perf_counter_ns()
+            canonical = self.is_canonical(text)
+            profiler.record(function, profiling.CANONICAL_CHECK_STEP, len(text), time.perf_counter_ns() - start)
+            if canonical:
+                return text
+        for name, step in zip(self.steps, self._functions):
+            length = len(text)
+            start = time.perf_counter_ns()
+            try:
+                text = step(text)
+            finally:
+                profiler.record(function, name, length, time.perf_counter_ns() - start)
+        return text
+
+    def is_canonical(self, text):
+        """
+        Verifica, sem executar as etapas, se o texto já está na forma padronizada.
+        O resultado True garante que o pipeline devolveria o texto inalterado; o resultado False não garante o contrário.
+
+        Parameters
+        ----------
+        text : str
+            Texto a ser verificado.
+
+        Returns
+        -------
+        bool
+            Valor lógico que indica se o texto já está na forma de saída do pipeline.
+        """
+        if self._checks is None:
+            return False
+        for check in self._checks:
+            if not check(text):
+                return False
+        return True
+
+    def __repr__(self):
+        return f"Pipeline({' -> '.join(self.steps)})"
+
+
+@lru_cache(maxsize=None)
+def _compile(entries, optimize):
+    if not optimize:
+        return Pipeline(
+            [name for name, _ in entries],
+            [_bind(STEPS[name].function, params) for name, params in entries],
+        )
+
+    names = []
+    functions = []
+    checks = []
+    filters = []
+
+    def flush():
+        if not filters:
+            return
+        table = _CharTable(tuple(f for _, f in filters))
+        names.append('+'.join(n for n, _ in filters))
+        functions.append(lambda text: text.translate(table))
+        if checks is not None:
+            checks.append(_char_table_is_fixed(table))
+        filters.clear()
+
+    for name, params in _drop_redundant_steps(entries):
+        step = STEPS[name]
+        if step.char_filter:
+            filters.append((name, _bind(step.function, params)))
+            continue
+        flush()
+        names.append(name)
+        functions.append(_bind(step.function, params))
+        if step.is_fixed is None:
+            checks = None
+        elif checks is not None:
+            checks.append(_bind(step.is_fixed, params))
+    flush()
+
+    return Pipeline(names, functions, checks)
+
+
+def compile_pipeline(spec, optimize=True):
+    """
+    Compila uma especificação de pipeline em uma função de padronização.
+    Filtros de caracteres adjacentes são fundidos em uma única passagem sobre o texto
+    e etapas redundantes (por exemplo, remove_double_spaces após etapa que já removeu os espaços duplos) são descartadas.
+    Textos que já estão na forma padronizada são devolvidos sem executar as etapas (ver Pipeline.is_canonical).
+
+    Parameters
+    ----------
+    spec : list
+        Sequência ordenada de etapas. Cada etapa é o nome registrado em STEPS ou uma tupla (nome, parâmetros),
+        em que parâmetros é um dict com os argumentos nomeados da etapa.
+    optimize : bool, default True
+        Valor lógico que indica se as otimizações devem ser aplicadas.
+
+    Returns
+    -------
+    Pipeline
+        Função compilada que recebe um texto e devolve o texto padronizado.
+
+    Exemplo:
+        compile_pipeline(['unescape', 'remove_accents', 'remove_double_spaces', 'lower'])
+    """
+    return _compile(_normalize_spec(spec), optimize)
+
+
+if profiling.is_enabled_by_environment():
+    profiling.enable()
@@ -0,0 +1,312 @@
+"""
+Instrumentação opcional das funções padronizadoras e das etapas dos seus pipelines (ver pipeline.compile_pipeline).
+
+Quando ativada, cada chamada de uma função decorada com profiled registra o tempo total da função (etapa
+FUNCTION_STEP), e cada execução de etapa de pipeline registra, sob o nome da função decorada em execução, a
+quantidade de chamadas, o tempo acumulado e o histograma do tamanho do texto de entrada. Desativada (padrão), os
+pipelines executam o caminho original e as funções decoradas apenas verificam se há um Profiler ativo.
+
+A instrumentação é ativada pela variável de ambiente SCIELO_SCHOLARLY_DATA_PROFILE (valor diferente de vazio e
+de '0') no momento da importação do pacote, por enable ou pelo gerenciador de contexto profile:
+
+    with profile() as profiler:
+        document_title_for_deduplication('Zoology of the Amazon')
+    print(profiler.to_prometheus())
+"""
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+from functools import wraps
+
+from scielo_scholarly_data.helpers import escape_prometheus_label
+
+
+PROFILE_ENVIRONMENT_VARIABLE = 'SCIELO_SCHOLARLY_DATA_PROFILE'
+
+PROMETHEUS_PREFIX = 'scielo_scholarly_data_step'
+
+LENGTH_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+CANONICAL_CHECK_STEP = 'is_canonical'
+
+FUNCTION_STEP = 'total'
+
+# nome das medidas de pipelines executados fora de uma função decorada com profiled
+UNNAMED_FUNCTION = 'pipeline'
+
+_local = threading.local()
+
+
+class Profiler:
+    """
+    Acumula as medidas das funções padronizadoras e das etapas dos pipelines.
+    As medidas são indexadas pelo nome da função decorada com profiled (módulo.função) e pelo nome da etapa:
+    o tempo total da função aparece como a etapa FUNCTION_STEP (e inclui o tempo das funções decoradas que ela
+    chama, como core.roman_to_int), filtros de caracteres fundidos aparecem com os nomes unidos por '+' e a
+    verificação de texto já padronizado aparece como a etapa is_canonical.
+
+    Parameters
+    ----------
+    buckets : tuple of int, default LENGTH_BUCKETS
+        Limites superiores (inclusivos) das faixas do histograma de tamanho do texto de entrada.
+    """
+
+    def __init__(self, buckets=LENGTH_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, function, step, length, nanoseconds):
+        """
+        Registra uma execução de etapa.
+
+        Parameters
+        ----------
+        function : str
+            Função padronizadora que executou o pipeline.
+        step : str
+            Nome da etapa.
+        length : int
+            Tamanho do texto de entrada.
+        nanoseconds : int
+            Duração da execução.
+        """
+        with self._lock:
+            stats = self._stats.get((function, step))
+            if stats is None:
+                stats = self._stats[(function, step)] = [0, 0, 0, [0] * (len(self.buckets) + 1)]
+            stats[0] += 1
+            stats[1] += nanoseconds
+            stats[2] += length
+            position = 0
+            for bound in self.buckets:
+                if length <= bound:
+                    break
+                position += 1
+            stats[3][position] += 1
+
+    def reset(self):
+        """Descarta as medidas acumuladas."""
+        with self._lock:
+            self._stats = {}
+
+    def to_dict(self):
+        """
+        Exporta as medidas acumuladas.
+
+        Returns
+        -------
+        dict
+            Para cada função padronizadora, um dict por etapa com a quantidade de chamadas (calls), o tempo
+            acumulado em segundos (seconds), a soma dos tamanhos de entrada (input_length_sum) e o histograma de
+            tamanhos (input_length_histogram), que associa o limite superior de cada faixa ('+Inf' para a última)
+            à quantidade de chamadas na faixa.
+
+        Exemplo:
+            {'standardizer.document_sponsors': {'unescape': {'calls': 2, 'seconds': 1.2e-06, ...}}}
+        """
+        with self._lock:
+            items = sorted(self._stats.items())
+        result = {}
+        labels = [str(bound) for bound in self.buckets] + ['+Inf']
+        for (function, step), (calls, nanoseconds, length_sum, histogram) in items:
+            result.setdefault(function, {})[step] = {
+                'calls': calls,
+                'seconds': nanoseconds / 1e9,
+                'input_length_sum': length_sum,
+                'input_length_histogram': dict(zip(labels, histogram)),
+            }
+        return result
+
+    def to_prometheus(self, prefix=PROMETHEUS_PREFIX):
+        """
+        Exporta as medidas acumuladas no formato de texto do Prometheus: os contadores <prefix>_calls_total e
+        <prefix>_seconds_total e o histograma <prefix>_input_length, com os rótulos function e step.
+
+        Parameters
+        ----------
+        prefix : str, default PROMETHEUS_PREFIX
+            Prefixo do nome das métricas.
+
+        Returns
+        -------
+        str
+            Métricas no formato de exposição de texto do Prometheus.
+        """
+        data = self.to_dict()
+        series = [
+            (f'function="{escape_prometheus_label(function)}",step="{escape_prometheus_label(step)}"', stats)
+            for function, steps in data.items()
+            for step, stats in steps.items()
+        ]
+        lines = [
+            f'# HELP {prefix}_calls_total Quantidade de execuções da etapa.',
+            f'# TYPE {prefix}_calls_total counter',
+        ]
+        lines.extend(f'{prefix}_calls_total{{{labels}}} {stats["calls"]}' for labels, stats in series)
+        lines.extend([
+            f'# HELP {prefix}_seconds_total Tempo acumulado de execução da etapa, em segundos.',
+            f'# TYPE {prefix}_seconds_total counter',
+        ])
+        lines.extend(f'{prefix}_seconds_total{{{labels}}} {stats["seconds"]:.9f}' for labels, stats in series)
+        lines.extend([
+            f'# HELP {prefix}_input_length Tamanho do texto de entrada da etapa.',
+            f'# TYPE {prefix}_input_length histogram',
+        ])
+        for labels, stats in series:
+            cumulative = 0
+            for bound, count in stats['input_length_histogram'].items():
+                cumulative += count
+                lines.append(f'{prefix}_input_length_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_input_length_sum{{{labels}}} {stats["input_length_sum"]}')
+            lines.append(f'{prefix}_input_length_count{{{labels}}} {stats["calls"]}')
+        return '\n'.join(lines) + '\n'
+
+
+_profiler = None
+
+
+def active_profiler():
+    """
+    Obtém o Profiler ativo.
+
+    Returns
+    -------
+    Profiler or None
+        Profiler que recebe as medidas ou None quando a instrumentação está desativada.
+    """
+    return _profiler
+
+
+def current_function():
+    """
+    Obtém o nome da função decorada com profiled em execução na thread atual.
+
+    Returns
+    -------
+    str
+        Nome da função (módulo.função) ou UNNAMED_FUNCTION.
+    """
+    return getattr(_local, 'function', UNNAMED_FUNCTION)
+
+
+def profiled(name):
+    """
+    Decorador que identifica uma função padronizadora nas medidas do Profiler ativo: registra o tempo total de
+    cada chamada (etapa FUNCTION_STEP) e associa ao nome as etapas dos pipelines executados durante a chamada.
+    Sem Profiler ativo, a função é chamada diretamente.
+
+    Parameters
+    ----------
+    name : str
+        Nome da função nas medidas, no formato módulo.função.
+
+    Returns
+    -------
+    callable
+        Decorador.
+
+    Exemplo:
+        @profiled('standardizer.journal_issn')
+        def journal_issn(text, use_issn_validator=False):
+            ...
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            profiler = _profiler
+            if profiler is None:
+                return function(*args, **kwargs)
+            text = args[0] if args else next(iter(kwargs.values()), None)
+            previous = current_function()
+            _local.function = name
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                _local.function = previous
+                profiler.record(name, FUNCTION_STEP, len(text) if isinstance(text, str) else 0, elapsed)
+
+        return wrapper
+
+    return decorator
+
+
+def enable(profiler=None):
+    """
+    Ativa a instrumentação das etapas dos pipelines.
+
+    Parameters
+    ----------
+    profiler : Profiler, default None
+        Profiler que recebe as medidas; quando não informado, é mantido o ativo ou criado um novo.
+
+    Returns
+    -------
+    Profiler
+        Profiler ativo.
+    """
+    global _profiler
+    from scielo_scholarly_data.pipeline import Pipeline
+
+    _profiler = profiler or _profiler or Profiler()
+    Pipeline.__call__ = Pipeline._profiled_call
+    return _profiler
+
+
+def disable():
+    """
+    Desativa a instrumentação: os pipelines voltam a executar o caminho original.
+
+    Returns
+    -------
+    Profiler or None
+        Profiler que estava ativo, com as medidas acumuladas.
+    """
+    global _profiler
+    from scielo_scholarly_data.pipeline import Pipeline
+
+    profiler, _profiler = _profiler, None
+    Pipeline.__call__ = Pipeline._call
+    return profiler
+
+
+@contextmanager
+def profile(profiler=None):
+    """
+    Gerenciador de contexto que ativa a instrumentação durante o bloco e restaura o estado anterior ao final.
+
+    Parameters
+    ----------
+    profiler : Profiler, default None
+        Profiler que recebe as medidas; quando não informado, é criado um novo.
+
+    Returns
+    -------
+    Profiler
+        Profiler que recebe as medidas do bloco.
+
+    Exemplo:
+        with profile() as profiler:
+            journal_title_for_deduplication('Agrociencia &amp; (Uruguay)')
+        profiler.to_dict()
+    """
+    previous = _profiler
+    profiler = enable(profiler or Profiler())
+    try:
+        yield profiler
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
+
+
+def is_enabled_by_environment():
+    """
+    Verifica se a instrumentação foi solicitada pela variável de ambiente PROFILE_ENVIRONMENT_VARIABLE.
+    """
+    return os.environ.get(PROFILE_ENVIRONMENT_VARIABLE, '') not in ('', '0')
@@ -0,0 +1,242 @@
+from array import array
+
+from scielo_scholarly_data.fingerprint import (
+    FingerprintTable,
+    text_fingerprint,
+)
+from scielo_scholarly_data.standardizer import (
+    document_doi,
+    orcid_validator,
+)
+from scielo_scholarly_data.unionfind import UnionFind
+
+
+def doi_key(text):
+    """
+    Função para obter a chave de comparação de um DOI: o DOI padronizado por document_doi (path) em caixa baixa.
+
+    Parameters
+    ----------
+    text : str
+        DOI do documento.
+
+    Returns
+    -------
+    str or None
+        Chave do DOI ou None quando o DOI é inválido.
+    """
+    if not text:
+        return None
+    doi = document_doi(text, return_mode='path')
+    return doi.lower() if isinstance(doi, str) else None
+
+
+def orcid_key(text):
+    """
+    Função para obter a chave de comparação de um ORCID: o ORCID validado por orcid_validator (path).
+
+    Parameters
+    ----------
+    text : str
+        Registro ORCID.
+
+    Returns
+    -------
+    str or None
+        Chave do ORCID ou None quando o ORCID é inválido.
+    """
+    if not text:
+        return None
+    orcid = orcid_validator(text.strip(), return_mode='path')
+    return orcid.upper() if isinstance(orcid, str) else None
+
+
+def key_edges(keys):
+    """
+    Gera as arestas entre registros com a mesma chave (por exemplo, doi_key, orcid_key ou document_fingerprint).
+    Cada registro é ligado ao primeiro registro com a mesma chave, de modo que um grupo de n registros
+    resulta em n - 1 arestas. As chaves são armazenadas como impressões digitais em uma FingerprintTable.
+
+    Parameters
+    ----------
+    keys : iterable of str or int
+        Chave de cada registro, na ordem dos identificadores; chaves vazias ou None são ignoradas.
+        Chaves inteiras são consideradas impressões digitais de 64 bits.
+
+    Returns
+    -------
+    generator of tuple
+        Pares (id, id), com o menor identificador primeiro.
+    """
+    table = FingerprintTable()
+    for record_id, key in enumerate(keys):
+        if isinstance(key, str):
+            key = text_fingerprint(key) if key else None
+        first = table.add(key)
+        if first != record_id:
+            yield first, record_id
+
+
+def read_edges(path):
+    """
+    Lê arestas de um arquivo de texto com um par de identificadores por linha, separados por tabulação
+    (formato de sorted_neighborhood.write_pairs), sem carregar o arquivo em memória.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo.
+
+    Returns
+    -------
+    generator of tuple
+        Pares (id, id).
+    """
+    with open(path, encoding='utf-8') as fp:
+        for line in fp:
+            a, _, b = line.partition('\t')
+            if b:
+                yield int(a), int(b)
+
+
+def write_binary_edges(edges, path):
+    """
+    Grava arestas em um arquivo binário de inteiros de 64 bits (ordem de bytes nativa), dois por aresta.
+
+    Parameters
+    ----------
+    edges : iterable of tuple
+        Pares (id, id).
+    path : str
+        Caminho do arquivo.
+
+    Returns
+    -------
+    int
+        Quantidade de arestas gravadas.
+    """
+    count = 0
+    buffer = array('q')
+    with open(path, 'wb') as fp:
+        for a, b in edges:
+            buffer.append(a)
+            buffer.append(b)
+            if len(buffer) >= 131072:
+                buffer.tofile(fp)
+                count += len(buffer) // 2
+                del buffer[:]
+        buffer.tofile(fp)
+        count += len(buffer) // 2
+    return count
+
+
+def read_binary_edges(path, chunk_size=65536):
+    """
+    Lê arestas gravadas por write_binary_edges, em blocos de chunk_size arestas.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo.
+    chunk_size : int, default 65536
+        Quantidade de arestas lidas por bloco.
+
+    Returns
+    -------
+    generator of tuple
+        Pares (id, id).
+    """
+    with open(path, 'rb') as fp:
+        while True:
+            buffer = array('q')
+            try:
+                buffer.fromfile(fp, 2 * chunk_size)
+            except EOFError:
+                pass
+            if not buffer:
+                break
+            yield from zip(buffer[::2], buffer[1::2])
+
+
+class DuplicateClusterer:
+    """
+    Agrupamento de registros duplicados a partir de arestas de várias fontes (DOI, ORCID, impressão digital,
+    pares de similaridade), unidas em uma estrutura union-find sobre os identificadores inteiros dos registros.
+    As arestas são consumidas de forma incremental, sem serem armazenadas.
+
+    Parameters
+    ----------
+    size : int, default 0
+        Quantidade de registros. A estrutura cresce automaticamente para os identificadores das arestas.
+
+    Exemplo:
+        clusterer = DuplicateClusterer(len(records))
+        clusterer.add_keys(doi_key(r['doi']) for r in records)
+        clusterer.add_edges(read_edges('fuzzy_pairs.tsv'))
+        clusters = clusterer.labels()
+    """
+
+    def __init__(self, size=0):
+        self._union_find = UnionFind(size)
+
+    def __len__(self):
+        return len(self._union_find)
+
+    def add_edges(self, edges):
+        """
+        Une os registros de cada aresta.
+
+        Parameters
+        ----------
+        edges : iterable of tuple
+            Pares (id, id); triplas (id, id, similaridade), como as de near_duplicates, também são aceitas.
+
+        Returns
+        -------
+        int
+            Quantidade de arestas que uniram grupos distintos.
+        """
+        return self._union_find.union_pairs(edge[:2] for edge in edges)
+
+    def add_keys(self, keys):
+        """
+        Une os registros com a mesma chave (ver key_edges).
+
+        Parameters
+        ----------
+        keys : iterable of str or int
+            Chave de cada registro, na ordem dos identificadores.
+
+        Returns
+        -------
+        int
+            Quantidade de arestas que uniram grupos distintos.
+        """
+        return self._union_find.union_pairs(key_edges(keys))
+
+    def cluster(self, record_id):
+        """
+        Obtém o representante do grupo de um registro.
+
+        Parameters
+        ----------
+        record_id : int
+            Identificador do registro.
+
+        Returns
+        -------
+        int
+            Identificador do representante do grupo.
+        """
+        return self._union_find.find(record_id)
+
+    def labels(self):
+        """
+        Obtém o rótulo do grupo de cada registro.
+
+        Returns
+        -------
+        array of int
+            Rótulos densos, numerados a partir de 0.
+        """
+        return self._union_find.labels()
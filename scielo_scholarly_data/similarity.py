@@ -0,0 +1,219 @@
+def _pattern_masks(pattern):
+    masks = {}
+    bit = 1
+    for char in pattern:
+        masks[char] = masks.get(char, 0) | bit
+        bit <<= 1
+    return masks
+
+
+def _levenshtein(masks, size, text, max_distance):
+    # Algoritmo bit-paralelo de Myers (1999), na formulação de Hyyrö para a distância global.
+    # Cada coluna da matriz de programação dinâmica é representada pelos vetores de diferenças verticais
+    # positivas (vp) e negativas (vn), armazenados em inteiros de size bits.
+    if not size:
+        return len(text)
+    mask = (1 << size) - 1
+    high = 1 << (size - 1)
+    vp = mask
+    vn = 0
+    score = size
+    remaining = len(text)
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | (~(xh | vp) & mask)
+        hn = vp & xh
+        if hp & high:
+            score += 1
+        elif hn & high:
+            score -= 1
+        remaining -= 1
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = hn | (~(xv | hp) & mask)
+        vn = hp & xv
+    return score
+
+
+def levenshtein_distance(a, b, max_distance=None):
+    """
+    Função para calcular a distância de Levenshtein entre dois textos com o algoritmo bit-paralelo de Myers,
+    que processa uma coluna inteira da matriz de distâncias por operação sobre inteiros.
+
+    Parameters
+    ----------
+    a : str
+        Primeiro texto.
+    b : str
+        Segundo texto.
+    max_distance : int, default None
+        Distância máxima de interesse. Quando informada, o cálculo é interrompido assim que a distância
+        certamente a ultrapassa e o valor max_distance + 1 é retornado.
+
+    Returns
+    -------
+    int
+        Distância de Levenshtein (ou max_distance + 1).
+
+    Exemplo:
+        levenshtein_distance('revista', 'revsita') == 2
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if max_distance is not None and len(b) - len(a) > max_distance:
+        return max_distance + 1
+    return _levenshtein(_pattern_masks(a), len(a), b, max_distance)
+
+
+def _max_distance(threshold, size):
+    # maior distância d tal que 1 - d / size >= threshold
+    return int((1 - threshold) * size + 1e-9)
+
+
+def levenshtein_similarity(a, b, threshold=None):
+    """
+    Função para calcular a similaridade normalizada de Levenshtein: 1 - distância / tamanho do maior texto.
+
+    Parameters
+    ----------
+    a : str
+        Primeiro texto, por exemplo, a saída de document_title_for_deduplication.
+    b : str
+        Segundo texto.
+    threshold : float, default None
+        Similaridade mínima de interesse. Quando informada, similaridades menores são retornadas como 0.0
+        e o cálculo é interrompido assim que o limiar se torna inatingível.
+
+    Returns
+    -------
+    float
+        Similaridade entre 0 e 1.
+
+    Exemplo:
+        levenshtein_similarity('revista', 'revsita') == 0.7142857142857143
+    """
+    size = max(len(a), len(b))
+    if not size:
+        return 1.0
+    max_distance = None if threshold is None else _max_distance(threshold, size)
+    distance = levenshtein_distance(a, b, max_distance)
+    if max_distance is not None and distance > max_distance:
+        return 0.0
+    return 1 - distance / size
+
+
+def jaccard_similarity(a, b):
+    """
+    Função para calcular o coeficiente de Jaccard entre os conjuntos de palavras de dois textos.
+
+    Parameters
+    ----------
+    a : str
+        Primeiro texto.
+    b : str
+        Segundo texto.
+
+    Returns
+    -------
+    float
+        Similaridade entre 0 e 1.
+
+    Exemplo:
+        jaccard_similarity('silva joao', 'joao silva') == 1.0
+    """
+    words_a = set(a.split())
+    words_b = set(b.split())
+    if not words_a and not words_b:
+        return 1.0
+    intersection = len(words_a & words_b)
+    return intersection / (len(words_a) + len(words_b) - intersection)
+
+
+def token_set_similarity(a, b, threshold=None):
+    """
+    Função para calcular a similaridade entre os conjuntos de palavras de dois textos, tolerante à ordem e à
+    repetição das palavras e a palavras adicionais em um dos textos. As palavras comuns (ordenadas) são comparadas,
+    com levenshtein_similarity, com as palavras comuns acrescidas das palavras exclusivas de cada texto,
+    e a maior similaridade é retornada.
+
+    Parameters
+    ----------
+    a : str
+        Primeiro texto.
+    b : str
+        Segundo texto.
+    threshold : float, default None
+        Similaridade mínima de interesse (ver levenshtein_similarity).
+
+    Returns
+    -------
+    float
+        Similaridade entre 0 e 1.
+
+    Exemplo:
+        token_set_similarity('silva joao', 'joao da silva') == 1.0
+    """
+    words_a = set(a.split())
+    words_b = set(b.split())
+    common = ' '.join(sorted(words_a & words_b))
+    only_a = ' '.join(sorted(words_a - words_b))
+    only_b = ' '.join(sorted(words_b - words_a))
+    if common and (not only_a or not only_b):
+        return 1.0
+    combined_a = f'{common} {only_a}'.strip()
+    combined_b = f'{common} {only_b}'.strip()
+    best = levenshtein_similarity(combined_a, combined_b, threshold)
+    if common:
+        best = max(
+            best,
+            levenshtein_similarity(common, combined_a, threshold),
+            levenshtein_similarity(common, combined_b, threshold),
+        )
+    return best
+
+
+def match_candidates(query, candidates, threshold=0.8, limit=None):
+    """
+    Compara um texto com uma lista de candidatos pela similaridade de Levenshtein normalizada.
+    As máscaras de bits do texto consultado são calculadas uma única vez para todos os candidatos
+    e candidatos cujo tamanho torna o limiar inatingível são descartados sem comparação.
+
+    Parameters
+    ----------
+    query : str
+        Texto consultado.
+    candidates : iterable of str
+        Candidatos.
+    threshold : float, default 0.8
+        Similaridade mínima.
+    limit : int, default None
+        Quantidade máxima de resultados.
+
+    Returns
+    -------
+    list of tuple
+        Pares (posição do candidato, similaridade), em ordem decrescente de similaridade.
+
+    Exemplo:
+        match_candidates('revista', ['revsita', 'revista', 'journal'], threshold=0.7) == [(1, 1.0), (0, 0.7142857142857143)]
+    """
+    masks = _pattern_masks(query)
+    size = len(query)
+    results = []
+    for position, candidate in enumerate(candidates):
+        longest = max(size, len(candidate))
+        if not longest:
+            results.append((position, 1.0))
+            continue
+        max_distance = _max_distance(threshold, longest)
+        if abs(size - len(candidate)) > max_distance:
+            continue
+        distance = _levenshtein(masks, size, candidate, max_distance)
+        if distance <= max_distance:
+            results.append((position, 1 - distance / longest))
+    results.sort(key=lambda r: -r[1])
+    return results[:limit] if limit is not None else results
@@ -0,0 +1,158 @@
+import heapq
+import os
+import tempfile
+
+from collections import deque
+from itertools import islice
+
+from scielo_scholarly_data.standardizer import document_title_for_deduplication
+from scielo_scholarly_data.values import _PATTERN_YEAR
+
+
+def title_year_key(title, year=None):
+    """
+    Função para gerar a chave de ordenação de um documento: o título padronizado com
+    document_title_for_deduplication seguido do ano de publicação.
+
+    Parameters
+    ----------
+    title : str
+        Título do documento.
+    year : str or int, default None
+        Ano ou data de publicação; apenas o ano é considerado.
+
+    Returns
+    -------
+    str
+        Chave do documento ou str vazia quando não há título.
+
+    Exemplo:
+        title_year_key('A Title.', 'March 2020') == 'a title 2020'
+    """
+    title = document_title_for_deduplication(title) if title else ''
+    if not title:
+        return ''
+    matched_year = _PATTERN_YEAR.search(str(year)) if year else None
+    return f'{title} {matched_year.group()}' if matched_year else title
+
+
+def _clean(key):
+    # os runs são lidos e gravados com newline='\n': apenas '\n' separa linhas e outros separadores ('\r',
+    # '\x85', '\u2028' etc.) são mantidos na chave
+    return key.replace('\t', ' ').replace('\n', ' ')
+
+
+def _write_run(lines, directory):
+    lines.sort()
+    fd, path = tempfile.mkstemp(suffix='.run', dir=directory)
+    with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as fp:
+        fp.writelines(lines)
+    return path
+
+
+def _merge_runs(paths, directory, fan_in):
+    # reduz a quantidade de runs em passadas sucessivas, mantendo no máximo fan_in arquivos abertos
+    while len(paths) > fan_in:
+        merged = []
+        for start in range(0, len(paths), fan_in):
+            group = paths[start:start + fan_in]
+            files = [open(p, encoding='utf-8', newline='\n') for p in group]
+            try:
+                fd, path = tempfile.mkstemp(suffix='.run', dir=directory)
+                with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as fp:
+                    fp.writelines(heapq.merge(*files))
+            finally:
+                for f in files:
+                    f.close()
+            for p in group:
+                os.remove(p)
+            merged.append(path)
+        paths = merged
+    return paths
+
+
+def sorted_neighborhood_pairs(keys, window=10, chunk_size=500000, fan_in=128, compare=None, directory=None):
+    """
+    Deduplicação por vizinhança ordenada (sorted neighborhood) fora da memória principal.
+    As chaves são lidas em uma única passada e gravadas em disco em runs ordenados de até chunk_size chaves;
+    os runs são intercalados (k-way merge) e cada registro é comparado com os window - 1 registros anteriores
+    na ordem das chaves. A memória utilizada depende de chunk_size, window e fan_in, e não do total de registros.
+
+    Parameters
+    ----------
+    keys : iterable of str
+        Chave de ordenação de cada registro (ver title_year_key); o identificador do registro é a sua posição.
+        Registros com chave vazia são ignorados.
+    window : int, default 10
+        Tamanho da janela deslizante.
+    chunk_size : int, default 500000
+        Quantidade de chaves ordenadas em memória por run.
+    fan_in : int, default 128
+        Quantidade máxima de runs intercalados de uma vez.
+    compare : callable, default None
+        Função compare(key_a, key_b) que decide se dois registros da janela formam um par candidato.
+        Quando não informada, todos os pares da janela são gerados.
+    directory : str, default None
+        Diretório dos arquivos temporários.
+
+    Returns
+    -------
+    generator of tuple
+        Pares (id, id), com o menor identificador primeiro.
+    """
+    if window < 2:
+        raise ValueError(f'window ({window}) deve ser maior ou igual a 2')
+
+    with tempfile.TemporaryDirectory(dir=directory) as run_directory:
+        paths = []
+        keys = iter(keys)
+        record_id = 0
+        while True:
+            chunk = list(islice(keys, chunk_size))
+            if not chunk:
+                break
+            lines = [f'{_clean(key)}\t{i}\n' for i, key in enumerate(chunk, record_id) if key]
+            record_id += len(chunk)
+            del chunk
+            if lines:
+                paths.append(_write_run(lines, run_directory))
+            del lines
+
+        paths = _merge_runs(paths, run_directory, fan_in)
+        files = [open(p, encoding='utf-8', newline='\n') for p in paths]
+        try:
+            neighbors = deque(maxlen=window - 1)
+            for line in heapq.merge(*files):
+                key, _, current = line.rstrip('\n').rpartition('\t')
+                current = int(current)
+                for neighbor_key, neighbor in neighbors:
+                    if compare is None or compare(neighbor_key, key):
+                        yield (neighbor, current) if neighbor < current else (current, neighbor)
+                neighbors.append((key, current))
+        finally:
+            for f in files:
+                f.close()
+
+
+def write_pairs(pairs, path):
+    """
+    Grava pares candidatos em um arquivo de texto, um par por linha separado por tabulação, sem mantê-los em memória.
+
+    Parameters
+    ----------
+    pairs : iterable of tuple
+        Pares (id, id), por exemplo, a saída de sorted_neighborhood_pairs.
+    path : str
+        Caminho do arquivo de saída.
+
+    Returns
+    -------
+    int
+        Quantidade de pares gravados.
+    """
+    count = 0
+    with open(path, 'w', encoding='utf-8') as fp:
+        for a, b in pairs:
+            fp.write(f'{a}\t{b}\n')
+            count += 1
+    return count
@@ -1,39 +1,30 @@
 import re
 
-from scielo_scholarly_data.dates import (
-    convert_to_iso_date,
-)
+from functools import lru_cache
 
 from scielo_scholarly_data.core import (
     check_sum_orcid,
-    keep_alpha_space,
     keep_alpha_num_space,
-    remove_accents,
-    remove_double_spaces,
-    remove_non_printable_chars,
-    remove_parenthesis,
-    remove_end_punctuation_chars,
-    remove_chars,
-    remove_words,
-    order_name_and_surname,
-    unescape,
     roman_to_int,
 )
 
 from scielo_scholarly_data.values import (
     JOURNAL_TITLE_SPECIAL_CHARS,
     JOURNAL_TITLE_SPECIAL_WORDS,
-    PATTERN_ISSN_WITH_HYPHEN,
-    PATTERN_ISSN_WITHOUT_HYPHEN,
-    PATTERNS_DOI,
-    PATTERN_ORCID,
-    PATTERN_PAGE_RANGE,
+    _PATTERN_ISSN_CANONICAL,
+    _PATTERN_ISSN_WITH_HYPHEN,
+    _PATTERN_ISSN_WITHOUT_HYPHEN,
+    _PATTERNS_DOI,
+    _PATTERN_ORCID,
+    _PATTERN_PAGE_RANGE,
     PUNCTUATION_TO_DEFINE_PAGE_RANGE,
     PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_VISUALIZATION,
 )
 
+from scielo_scholarly_data import outcomes
 from scielo_scholarly_data.helpers import is_valid_issn
-from urllib.parse import urlparse
+from scielo_scholarly_data.pipeline import compile_pipeline
+from scielo_scholarly_data.profiling import profiled
 
 
 class InvalidRomanNumeralError(Exception):
@@ -43,6 +34,23 @@ class ImpossibleConvertionToIntError(Exception):
     ...
 
 
+_JOURNAL_ISSN_OK = ('standardizer.journal_issn', outcomes.OK)
+_JOURNAL_ISSN_NONE = ('standardizer.journal_issn', outcomes.NONE)
+_ISSUE_VOLUME_OK = ('standardizer.issue_volume', outcomes.OK)
+_ISSUE_VOLUME_INVALID_ROMAN_NUMERAL = ('standardizer.issue_volume', 'InvalidRomanNumeralError')
+_ISSUE_VOLUME_IMPOSSIBLE_CONVERTION = ('standardizer.issue_volume', 'ImpossibleConvertionToIntError')
+_DOCUMENT_DOI_OK = ('standardizer.document_doi', outcomes.OK)
+_DOCUMENT_DOI_INVALID = ('standardizer.document_doi', 'invalid doi')
+_ORCID_OK = ('standardizer.orcid_validator', outcomes.OK)
+_ORCID_INVALID_FORMAT = ('standardizer.orcid_validator', 'invalid format')
+_ORCID_INVALID_CHECKSUM = ('standardizer.orcid_validator', 'invalid checksum')
+
+
+def _is_integer(text):
+    return text.isascii() and text.isdigit()
+
+
+@profiled('standardizer.journal_title_for_deduplication')
 def journal_title_for_deduplication(text: str, words_to_remove=JOURNAL_TITLE_SPECIAL_WORDS,
                                     keep_parenthesis_content=True, chars_to_remove=[]):
     """
@@ -73,19 +81,30 @@ def journal_title_for_deduplication(text: str, words_to_remove=JOURNAL_TITLE_SPE
     str
         Título padronizado do periódico.
     """
-    text = unescape(text)
-    text = remove_non_printable_chars(text)
+    pipeline = _journal_title_for_deduplication_pipeline(
+        frozenset(words_to_remove), keep_parenthesis_content, tuple(chars_to_remove)
+    )
+    return pipeline(text)
+
+
+@lru_cache(maxsize=None)
+def _journal_title_for_deduplication_pipeline(words_to_remove, keep_parenthesis_content, chars_to_remove):
+    spec = ['unescape', 'remove_non_printable_chars']
     if not keep_parenthesis_content:
-        text = remove_parenthesis(text)
-    text = remove_accents(text)
-    text = keep_alpha_num_space(text, JOURNAL_TITLE_SPECIAL_CHARS)
-    text = remove_double_spaces(text)
-    text = remove_words(text, words_to_remove)
+        spec.append('remove_parenthesis')
+    spec.extend([
+        'remove_accents',
+        ('keep_alpha_num_space', {'keep_chars': JOURNAL_TITLE_SPECIAL_CHARS}),
+        'remove_double_spaces',
+        ('remove_words', {'words_to_remove': words_to_remove}),
+    ])
     if chars_to_remove:
-        text = remove_chars(text, chars_to_remove)
-    return text.lower()
+        spec.append(('remove_chars', {'chars_to_remove': chars_to_remove}))
+    spec.append('lower')
+    return compile_pipeline(spec)
 
 
+@profiled('standardizer.journal_title_for_visualization')
 def journal_title_for_visualization(text: str):
     """
     Procedimento para padronizar título de periódico de acordo com os seguintes métodos, por ordem:
@@ -105,13 +124,18 @@ def journal_title_for_visualization(text: str):
     str
         Título padronizado do periódico.
     """
-    text = unescape(text)
-    text = remove_non_printable_chars(text)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    return text
+    return _JOURNAL_TITLE_FOR_VISUALIZATION(text)
+
 
+_JOURNAL_TITLE_FOR_VISUALIZATION = compile_pipeline([
+    'unescape',
+    'remove_non_printable_chars',
+    'remove_double_spaces',
+    'remove_end_punctuation_chars',
+])
 
+
+@profiled('standardizer.journal_issn')
 def journal_issn(text, use_issn_validator=False):
     '''
     Padroniza ISSN. Por exemplo, de "1387666x" para "1387-666X".
@@ -129,20 +153,22 @@ def journal_issn(text, use_issn_validator=False):
         Código ISSN padronizado ou None.
     '''
 
-    if re.match(PATTERN_ISSN_WITH_HYPHEN, text):
-        if use_issn_validator:
-            if not is_valid_issn(text):
-                return
-        return text.upper()
+    if _PATTERN_ISSN_CANONICAL.fullmatch(text):
+        issn = text
+    elif _PATTERN_ISSN_WITH_HYPHEN.fullmatch(text):
+        issn = text.upper()
+    elif _PATTERN_ISSN_WITHOUT_HYPHEN.fullmatch(text):
+        issn = (text[:4] + '-' + text[4:]).upper()
+    else:
+        issn = None
 
-    if re.match(PATTERN_ISSN_WITHOUT_HYPHEN, text):
-        text = '-'.join([text[:4], text[4:]])
-        if use_issn_validator:
-            if not is_valid_issn(text):
-                return
-        return text.upper()
+    if issn is not None and use_issn_validator and not is_valid_issn(issn):
+        issn = None
+    outcomes.count(_JOURNAL_ISSN_NONE if issn is None else _JOURNAL_ISSN_OK)
+    return issn
 
 
+@profiled('standardizer.issue_volume')
 def issue_volume(text: str, force_integer=True):
     """
     Procedimento que padroniza o número do volume do periódico de acordo com os seguintes métodos, por ordem:
@@ -169,18 +195,18 @@ def issue_volume(text: str, force_integer=True):
         Número do volume do periódico padronizado.
     """
 
-    text = unescape(text)
-    text = remove_non_printable_chars(text)
-    text = keep_alpha_num_space(text, replace_with=' ')
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.strip()
+    if _is_integer(text):
+        outcomes.count(_ISSUE_VOLUME_OK)
+        return text
+
+    text = _ISSUE_VOLUME(text)
     #text = remove_words(text, WORDS_TO_REMOVE_VOLUME_NUMBER)
 
     if force_integer:
         romans = ['M', 'D', 'C', 'L', 'X', 'V', 'I']
         for value in text.split(' '):
             if value.isnumeric():
+                outcomes.count(_ISSUE_VOLUME_OK)
                 return value
         for value in text.split(' '):
             if value.isalpha():
@@ -191,14 +217,31 @@ def issue_volume(text: str, force_integer=True):
                         pass
                 if convert_roman:
                     try:
-                        return str(roman_to_int(value.upper()))
+                        number = str(roman_to_int(value.upper()))
                     except:
+                        outcomes.count(_ISSUE_VOLUME_INVALID_ROMAN_NUMERAL)
                         raise InvalidRomanNumeralError(f"O valor {value} não é um número romano")
+                    outcomes.count(_ISSUE_VOLUME_OK)
+                    return number
 
+        outcomes.count(_ISSUE_VOLUME_IMPOSSIBLE_CONVERTION)
         raise ImpossibleConvertionToIntError(f"Não foi possível converter o valor {text} para inteiro")
 
+    outcomes.count(_ISSUE_VOLUME_OK)
     return text
 
+
+_ISSUE_VOLUME = compile_pipeline([
+    'unescape',
+    'remove_non_printable_chars',
+    ('keep_alpha_num_space', {'replace_with': ' '}),
+    'remove_double_spaces',
+    'remove_end_punctuation_chars',
+    'strip',
+])
+
+
+@profiled('standardizer.issue_number')
 def issue_number(text: str):
     """
     Procedimento que padroniza número da edição do periódico de acordo com os seguintes métodos, por ordem:
@@ -217,12 +260,17 @@ def issue_number(text: str):
         Número da edição do periódico padronizado.
     """
 
-    text = remove_non_printable_chars(text)
-    text = keep_alpha_num_space(text, replace_with='')
-    text = text.strip()
-    return text
+    return _ISSUE_NUMBER(text)
+
+
+_ISSUE_NUMBER = compile_pipeline([
+    'remove_non_printable_chars',
+    ('keep_alpha_num_space', {'replace_with': ''}),
+    'strip',
+])
 
 
+@profiled('standardizer.document_doi')
 def document_doi(text: str, return_mode='uri'):
     """
     Procedimento que padroniza DOI de documento.
@@ -245,12 +293,14 @@ def document_doi(text: str, return_mode='uri'):
         host: dx.doi.org.
     """
     matched_doi = False
-    for pattern_doi in PATTERNS_DOI:
+    for pattern_doi in _PATTERNS_DOI:
         matched_doi = pattern_doi.search(text)
         if matched_doi:
             break
     if not matched_doi:
+        outcomes.count(_DOCUMENT_DOI_INVALID)
         return {'error' : 'invalid doi'}
+    outcomes.count(_DOCUMENT_DOI_OK)
     if return_mode == 'uri':
         return f'http://doi.org/{matched_doi.group()}'
     if return_mode == 'host':
@@ -259,6 +309,7 @@ def document_doi(text: str, return_mode='uri'):
         return matched_doi.group()
 
 
+@profiled('standardizer.document_title_for_deduplication')
 def document_title_for_deduplication(text: str, remove_special_char=True, chars_to_remove=[]):
     """
     Função para padronizar títulos de documentos de acordo com os seguinte métodos, por ordem:
@@ -287,20 +338,32 @@ def document_title_for_deduplication(text: str, remove_special_char=True, chars_
         Título padronizado do documento.
     """
 
-    text = unescape(text)
-    if remove_special_char:
-        text = keep_alpha_num_space(text)
-    text = remove_non_printable_chars(text)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.strip()
-    text = remove_accents(text)
+    return _document_title_for_deduplication_pipeline(remove_special_char, tuple(chars_to_remove))(text)
+
+
+@lru_cache(maxsize=None)
+def _document_title_for_deduplication_pipeline(remove_special_char, chars_to_remove):
+    spec = _title_spec(remove_special_char) + ['remove_accents']
     if chars_to_remove:
-        text = remove_chars(text, chars_to_remove)
-    text = text.lower()
-    return text
+        spec.append(('remove_chars', {'chars_to_remove': chars_to_remove}))
+    spec.append('lower')
+    return compile_pipeline(spec)
 
 
+def _title_spec(keep_alpha_num_space_only):
+    spec = ['unescape']
+    if keep_alpha_num_space_only:
+        spec.append('keep_alpha_num_space')
+    spec.extend([
+        'remove_non_printable_chars',
+        'remove_double_spaces',
+        'remove_end_punctuation_chars',
+        'strip',
+    ])
+    return spec
+
+
+@profiled('standardizer.document_title_for_visualization')
 def document_title_for_visualization(text: str, remove_special_char=True):
     """
     Função para padronizar titulos de documentos de acordo com os seguintes métodos, por ordem:
@@ -324,16 +387,15 @@ def document_title_for_visualization(text: str, remove_special_char=True):
         Título padronizado do documento.
     """
 
-    text = unescape(text)
-    if remove_special_char:
-        text = keep_alpha_num_space(text)
-    text = remove_non_printable_chars(text)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.strip()
-    return text
+    return _title_pipeline(remove_special_char)(text)
 
 
+@lru_cache(maxsize=None)
+def _title_pipeline(keep_alpha_num_space_only):
+    return compile_pipeline(_title_spec(keep_alpha_num_space_only))
+
+
+@profiled('standardizer.document_first_page')
 def document_first_page(text: str, keep_chars=PUNCTUATION_TO_DEFINE_PAGE_RANGE):
     """
     Função para normalizar o número da página inicial de um documento, considerando os seguintes métodos em ordem:
@@ -355,20 +417,31 @@ def document_first_page(text: str, keep_chars=PUNCTUATION_TO_DEFINE_PAGE_RANGE):
         Número da página inicial de um documento padronizado.
     """
 
-    text = unescape(text)
-    text = remove_non_printable_chars(text)
-    text = keep_alpha_num_space(text, keep_chars)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.replace(' ','')
+    if _is_integer(text):
+        return text
+
+    text = _page_pipeline(frozenset(keep_chars))(text)
     if not text.isdigit():
         try:
-            text = re.match(PATTERN_PAGE_RANGE, text).groups()[0]
+            text = _PATTERN_PAGE_RANGE.match(text).groups()[0]
         except (KeyError, AttributeError):
             return
     return text
 
 
+@lru_cache(maxsize=None)
+def _page_pipeline(keep_chars):
+    return compile_pipeline([
+        'unescape',
+        'remove_non_printable_chars',
+        ('keep_alpha_num_space', {'keep_chars': keep_chars}),
+        'remove_double_spaces',
+        'remove_end_punctuation_chars',
+        'remove_spaces',
+    ])
+
+
+@profiled('standardizer.document_last_page')
 def document_last_page(text: str, keep_chars=PUNCTUATION_TO_DEFINE_PAGE_RANGE):
     """
     Função para normalizar o número da página final de um documento, considerando os seguintes métodos em ordem:
@@ -390,16 +463,13 @@ def document_last_page(text: str, keep_chars=PUNCTUATION_TO_DEFINE_PAGE_RANGE):
         Número da página final de um documento padronizado.
     """
 
-    text = unescape(text)
-    text = remove_non_printable_chars(text)
-    text = keep_alpha_num_space(text, keep_chars)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.replace(' ', '')
+    if _is_integer(text):
+        return text
+
+    text = _page_pipeline(frozenset(keep_chars))(text)
     if not text.isdigit():
         try:
-            first_page = int(re.match(PATTERN_PAGE_RANGE, text).groups()[0])
-            last_page = int(re.match(PATTERN_PAGE_RANGE, text).groups()[1])
+            first_page, last_page = map(int, _PATTERN_PAGE_RANGE.match(text).groups())
         except (KeyError, AttributeError):
             return
         if first_page > last_page:
@@ -409,6 +479,7 @@ def document_last_page(text: str, keep_chars=PUNCTUATION_TO_DEFINE_PAGE_RANGE):
     return text
 
 
+@profiled('standardizer.document_elocation')
 def document_elocation(text: str):
     """
     Função para padronizar o valor do atributo elocation, esse valor identifica uma paginação eletrônica e só deverá
@@ -431,14 +502,19 @@ def document_elocation(text: str):
         Valor do atributo elocation padronizado.
     """
 
-    text = remove_non_printable_chars(text)
-    text = keep_alpha_num_space(text, replace_with='')
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.replace(' ','')
-    return text
+    return _DOCUMENT_ELOCATION(text)
 
 
+_DOCUMENT_ELOCATION = compile_pipeline([
+    'remove_non_printable_chars',
+    ('keep_alpha_num_space', {'replace_with': ''}),
+    'remove_double_spaces',
+    'remove_end_punctuation_chars',
+    'remove_spaces',
+])
+
+
+@profiled('standardizer.document_publication_date')
 def document_publication_date(text: str, day='01', month='01', only_year=False):
     """
     Função para padronizar a data da publicação de um documento para o formato ISO,
@@ -460,15 +536,26 @@ def document_publication_date(text: str, day='01', month='01', only_year=False):
         Data da publicação padronizada.
     """
 
-    text = remove_non_printable_chars(text)
-    text = remove_double_spaces(text)
-    text = text.strip()
-    text = remove_words(text, words_to_remove=['de', 'of'])
-    text = convert_to_iso_date(text, day, month, only_year)
+    text = _DOCUMENT_PUBLICATION_DATE(text)
+    text = _iso_date_pipeline(day, month, only_year)(text)
 
     return text
 
 
+@lru_cache(maxsize=None)
+def _iso_date_pipeline(day, month, only_year):
+    return compile_pipeline([('convert_to_iso_date', {'day': day, 'month': month, 'only_year': only_year})])
+
+
+_DOCUMENT_PUBLICATION_DATE = compile_pipeline([
+    'remove_non_printable_chars',
+    'remove_double_spaces',
+    'strip',
+    ('remove_words', {'words_to_remove': ['de', 'of']}),
+])
+
+
+@profiled('standardizer.document_author_for_visualization')
 def document_author_for_visualization(text: str, surname_first=True):
     """
     Procedimento para padronizar nome de autor de documento, considerando os seguintes métodos, em ordem:
@@ -490,14 +577,26 @@ def document_author_for_visualization(text: str, surname_first=True):
         Nome padronizado do autor.
     """
 
-    text = remove_non_printable_chars(text)
-    text = keep_alpha_space(text, keep_chars=PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_VISUALIZATION)
-    text = remove_double_spaces(text)
-    text = text.strip()
-    text = order_name_and_surname(text, surname_first)
-    return text
+    return _document_author_for_visualization_pipeline(surname_first)(text)
+
+
+@lru_cache(maxsize=None)
+def _document_author_for_visualization_pipeline(surname_first):
+    return compile_pipeline(_author_spec() + [
+        ('order_name_and_surname', {'surname_first': surname_first}),
+    ])
+
 
+def _author_spec():
+    return [
+        'remove_non_printable_chars',
+        ('keep_alpha_space', {'keep_chars': PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_VISUALIZATION}),
+        'remove_double_spaces',
+        'strip',
+    ]
 
+
+@profiled('standardizer.document_author_for_deduplication')
 def document_author_for_deduplication(text: str, surname_first=True, chars_to_remove=[]):
     """
     Procedimento para padronizar nome de autor de documento, considerando os seguintes métodos, em ordem:
@@ -523,18 +622,22 @@ def document_author_for_deduplication(text: str, surname_first=True, chars_to_re
     str
         Nome padronizado do autor.
     """
-    text = remove_non_printable_chars(text)
-    text = keep_alpha_space(text, keep_chars=PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_VISUALIZATION)
-    text = remove_double_spaces(text)
-    text = text.strip()
-    text = remove_accents(text)
-    text = text.lower()
-    text = order_name_and_surname(text, surname_first)
+    return _document_author_for_deduplication_pipeline(surname_first, tuple(chars_to_remove))(text)
+
+
+@lru_cache(maxsize=None)
+def _document_author_for_deduplication_pipeline(surname_first, chars_to_remove):
+    spec = _author_spec() + [
+        'remove_accents',
+        'lower',
+        ('order_name_and_surname', {'surname_first': surname_first}),
+    ]
     if chars_to_remove:
-        text = remove_chars(text, chars_to_remove)
-    return text
+        spec.append(('remove_chars', {'chars_to_remove': chars_to_remove}))
+    return compile_pipeline(spec)
 
 
+@profiled('standardizer.book_title_for_deduplication')
 def book_title_for_deduplication(text: str, keep_alpha_num_space_chars_only=True, chars_to_remove=[]):
     """
     Função para padronizar títulos de livros de acordo com os seguinte métodos, por ordem:
@@ -563,20 +666,18 @@ def book_title_for_deduplication(text: str, keep_alpha_num_space_chars_only=True
         Título padronizado do livro.
     """
 
-    text = unescape(text)
-    if keep_alpha_num_space_chars_only:
-        text = keep_alpha_num_space(text)
-    text = remove_non_printable_chars(text)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.strip()
-    text = remove_accents(text)
-    text = text.lower()
+    return _book_title_for_deduplication_pipeline(keep_alpha_num_space_chars_only, tuple(chars_to_remove))(text)
+
+
+@lru_cache(maxsize=None)
+def _book_title_for_deduplication_pipeline(keep_alpha_num_space_chars_only, chars_to_remove):
+    spec = _title_spec(keep_alpha_num_space_chars_only) + ['remove_accents', 'lower']
     if chars_to_remove:
-        text = remove_chars(text, chars_to_remove)
-    return text
+        spec.append(('remove_chars', {'chars_to_remove': chars_to_remove}))
+    return compile_pipeline(spec)
 
 
+@profiled('standardizer.book_title_for_visualization')
 def book_title_for_visualization(text: str, keep_alpha_num_space_chars_only=True, chars_to_remove=[]):
     """
     Função para padronizar titulos de livros de acordo com os seguintes métodos, por ordem:
@@ -603,18 +704,18 @@ def book_title_for_visualization(text: str, keep_alpha_num_space_chars_only=True
         Título padronizado do livro.
     """
 
-    text = unescape(text)
-    if keep_alpha_num_space_chars_only:
-        text = keep_alpha_num_space(text)
-    text = remove_non_printable_chars(text)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.strip()
+    return _book_title_for_visualization_pipeline(keep_alpha_num_space_chars_only, tuple(chars_to_remove))(text)
+
+
+@lru_cache(maxsize=None)
+def _book_title_for_visualization_pipeline(keep_alpha_num_space_chars_only, chars_to_remove):
+    spec = _title_spec(keep_alpha_num_space_chars_only)
     if chars_to_remove:
-        text = remove_chars(text, chars_to_remove)
-    return text
+        spec.append(('remove_chars', {'chars_to_remove': chars_to_remove}))
+    return compile_pipeline(spec)
 
 
+@profiled('standardizer.book_editor_name_for_visualization')
 def book_editor_name_for_visualization(text: str, keep_alpha_num_space_only=True):
     """
     Função para padronizar nomes de editoras de acordo com os seguintes métodos, por ordem:
@@ -638,16 +739,10 @@ def book_editor_name_for_visualization(text: str, keep_alpha_num_space_only=True
         Nome padronizado da editora.
     """
 
-    text = unescape(text)
-    if keep_alpha_num_space_only:
-        text = keep_alpha_num_space(text)
-    text = remove_non_printable_chars(text)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.strip()
-    return text
+    return _title_pipeline(keep_alpha_num_space_only)(text)
 
 
+@profiled('standardizer.book_editor_name_for_deduplication')
 def book_editor_name_for_deduplication(text: str, keep_alpha_num_space_only=True):
     """
     Função para padronizar nomes de editoras de acordo com os seguinte métodos, por ordem:
@@ -673,18 +768,15 @@ def book_editor_name_for_deduplication(text: str, keep_alpha_num_space_only=True
         Nome padronizado da editora.
     """
 
-    text = unescape(text)
-    if keep_alpha_num_space_only:
-        text = keep_alpha_num_space(text)
-    text = remove_non_printable_chars(text)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.strip()
-    text = remove_accents(text)
-    text = text.lower()
-    return text
+    return _title_key_pipeline(keep_alpha_num_space_only)(text)
+
+
+@lru_cache(maxsize=None)
+def _title_key_pipeline(keep_alpha_num_space_only):
+    return compile_pipeline(_title_spec(keep_alpha_num_space_only) + ['remove_accents', 'lower'])
 
   
+@profiled('standardizer.orcid_validator')
 def orcid_validator(text: str, return_mode='uri'):
     """
         Função para verificar e padronizar um registro ORCID.
@@ -705,13 +797,18 @@ def orcid_validator(text: str, return_mode='uri'):
             path: 0000-0002-1825-0097.
             host: orcid.org.
         """
-    orcid = urlparse(text)
-    matched_orcid = re.match(PATTERN_ORCID, orcid.path)
+    import urllib.parse
+
+    orcid = urllib.parse.urlparse(text)
+    matched_orcid = _PATTERN_ORCID.match(orcid.path)
     if not matched_orcid:
+        outcomes.count(_ORCID_INVALID_FORMAT)
         return {'error' : 'invalid format'}
     path = keep_alpha_num_space(matched_orcid.groups()[1], replace_with='')
     if not check_sum_orcid(path):
+        outcomes.count(_ORCID_INVALID_CHECKSUM)
         return {'error' : 'invalid checksum'}
+    outcomes.count(_ORCID_OK)
     if orcid.scheme == '':
         scheme = 'https'
     else:
@@ -728,6 +825,7 @@ def orcid_validator(text: str, return_mode='uri'):
         return hostname
   
 
+@profiled('standardizer.document_sponsors')
 def document_sponsors(text: str, remove_special_char=True):
     """
     Função para padronizar o nome de patrocinadores de documentos de acordo com os seguinte métodos, por ordem:
@@ -753,25 +851,89 @@ def document_sponsors(text: str, remove_special_char=True):
         Título padronizado do documento.
     """
 
-    text = unescape(text)
-    if remove_special_char:
-        text = keep_alpha_num_space(text)
-    text = remove_non_printable_chars(text)
-    text = remove_double_spaces(text)
-    text = remove_end_punctuation_chars(text)
-    text = text.strip()
-    text = remove_accents(text)
-    text = text.lower()
-    return text
+    return _title_key_pipeline(remove_special_char)(text)
 
 
+@profiled('standardizer.book_title')
 def book_title(text: str):
-    pass  
+    """
+    Função para padronizar títulos de livros, mantendo caracteres especiais (como o separador de subtítulo),
+    de acordo com os seguintes métodos, por ordem:
+        1. Converte códigos HTML para caracteres Unicode;
+        2. Remove caracteres non printable;
+        3. Remove espaços duplos;
+        4. Remove pontuação no final do título;
+        5. Remove espaços nas extremidades do título.
 
-  
+    Parameters
+    ----------
+    text : str
+        Título do livro a ser padronizado.
+
+    Returns
+    -------
+    str
+        Título padronizado do livro.
+    """
+    return _title_pipeline(False)(text)
+
+
+@profiled('standardizer.book_editor_address')
 def book_editor_address(text: str):
-    pass
+    """
+    Função para padronizar o local de publicação (endereço da editora) de livros de acordo com os seguintes métodos,
+    por ordem:
+        1. Converte códigos HTML para caracteres Unicode;
+        2. Remove caracteres non printable e colchetes (usados em catálogos para locais inferidos);
+        3. Remove espaços duplos;
+        4. Remove pontuação no final do local;
+        5. Remove espaços nas extremidades do local.
+
+    Parameters
+    ----------
+    text : str
+        Local de publicação a ser padronizado.
+
+    Returns
+    -------
+    str
+        Local de publicação padronizado.
 
+    Exemplo:
+        book_editor_address('[São Paulo] :') == 'São Paulo'
+    """
+    return _BOOK_EDITOR_ADDRESS(text)
+
+
+_BOOK_EDITOR_ADDRESS = compile_pipeline([
+    'unescape',
+    'remove_non_printable_chars',
+    ('remove_chars', {'chars_to_remove': ('[', ']')}),
+    'remove_double_spaces',
+    'remove_end_punctuation_chars',
+    'strip',
+])
 
+
+@profiled('standardizer.chapter_title')
 def chapter_title(text: str):
-    pass
+    """
+    Função para padronizar títulos de capítulos de livros de acordo com os seguintes métodos, por ordem:
+        1. Converte códigos HTML para caracteres Unicode;
+        2. Remove caracteres non printable;
+        3. Remove espaços duplos;
+        4. Remove pontuação no final do título;
+        5. Remove espaços nas extremidades do título.
+
+    Parameters
+    ----------
+    text : str
+        Título do capítulo a ser padronizado.
+
+    Returns
+    -------
+    str
+        Título padronizado do capítulo.
+    """
+    return _title_pipeline(False)(text)
+
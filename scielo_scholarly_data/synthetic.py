@@ -0,0 +1,404 @@
+import html.entities
+import json
+import random
+
+from itertools import islice
+
+from scielo_scholarly_data.core import remove_accents
+from scielo_scholarly_data.dates import TEXT_MONTH_TO_NUMERIC_MONTH
+# o dígito verificador do ORCID é o mesmo usado por core.check_sum_orcid
+from scielo_scholarly_data.helpers import issn_check_digit, orcid_check_digit
+
+
+NON_PRINTABLE_CHARS = ('\t', '\n', '\x0b', '\x0c', '\u200b', '\xad')
+
+END_PUNCTUATION = ('.', '..', ';', ',', ' .', ':')
+
+_SYLLABLES = (
+    'ba', 'be', 'bi', 'bra', 'ca', 'ção', 'ci', 'co', 'da', 'de', 'di', 'do', 'é', 'fa', 'fe', 'ga', 'gi', 'la',
+    'le', 'li', 'lo', 'lu', 'ma', 'me', 'mi', 'mo', 'na', 'ne', 'ni', 'no', 'pa', 'pe', 'pi', 'po', 'qui', 'ra',
+    're', 'ri', 'ro', 'sa', 'se', 'si', 'so', 'ta', 'te', 'ti', 'to', 'tu', 'va', 've', 'vi', 'ño', 'ú', 'ã', 'ô',
+)
+
+_CONNECTORS = ('de', 'da', 'do', 'en', 'la', 'of', 'the', 'e', 'y', 'and')
+
+_JOURNAL_WORDS = ('Revista', 'Journal', 'Cadernos', 'Anais', 'Acta', 'Boletim', 'Archivos', 'Estudos')
+
+_GIVEN_NAMES = (
+    'Ana', 'João', 'María', 'José', 'Luis', 'Fernanda', 'Paulo', 'Inês', 'Andrés', 'Lucía', 'Tomás', 'Beatriz',
+    'Raúl', 'Helena', 'Sérgio', 'Camila', 'Jürgen', 'Renée', 'Ñusta', 'Çağla',
+)
+
+_DOI_TEMPLATES = (
+    '{doi}',
+    'https://doi.org/{doi}',
+    'http://dx.doi.org/{doi}',
+    'doi:{doi}',
+    '&referrer=google*url={doi}',
+    'https://doi.org/{doi}?utm_source=newsletter',
+)
+
+_ORCID_TEMPLATES = (
+    '{orcid}',
+    'https://orcid.org/{orcid}',
+    'http://orcid.org/{orcid}',
+    ' {orcid} ',
+)
+
+
+def _month_names():
+    names = {}
+    for name, number in TEXT_MONTH_TO_NUMERIC_MONTH.items():
+        names.setdefault(int(number), []).append(name)
+    return names
+
+
+_MONTH_NAMES = _month_names()
+
+
+class CitationGenerator:
+    """
+    Gerador reprodutível de referências bibliográficas sintéticas com os ruídos tratados pelos padronizadores:
+    entidades HTML, caracteres non printable, variações de acentuação e caixa, volumes em algarismos romanos,
+    nomes de meses em vários idiomas, DOI e ORCID em URLs e intervalos de páginas invertidos.
+    Os registros são gerados em sequência, com memória constante, e a mesma semente produz os mesmos registros.
+
+    Cada registro é um dict com os campos id, cluster_id (identificador do registro original, para avaliar a
+    deduplicação), title, authors, orcid, journal, issn, volume, number, pages, publication_date, doi e sponsor.
+
+    Parameters
+    ----------
+    seed : int, default 1
+        Semente do gerador.
+    duplicate_rate : float, default 0.2
+        Proporção de registros que são cópias ruidosas de um registro anterior.
+    noise_rate : float, default 0.3
+        Probabilidade de cada tipo de ruído ser aplicado a cada campo.
+    journals : int, default 1000
+        Quantidade de periódicos distintos.
+    authors : int, default 20000
+        Quantidade de autores distintos.
+    vocabulary_size : int, default 5000
+        Quantidade de palavras distintas dos títulos.
+    duplicate_window : int, default 10000
+        Quantidade de registros originais recentes dos quais as duplicatas são sorteadas.
+    """
+
+    def __init__(self, seed=1, duplicate_rate=0.2, noise_rate=0.3, journals=1000, authors=20000,
+                 vocabulary_size=5000, duplicate_window=10000):
+        self.seed = seed
+        self.duplicate_rate = duplicate_rate
+        self.noise_rate = noise_rate
+        self.duplicate_window = duplicate_window
+        self._random = random.Random(seed)
+        rng = self._random
+
+        self._vocabulary = [self._word(rng) for _ in range(vocabulary_size)]
+        self._journals = [
+            (
+                f'{rng.choice(_JOURNAL_WORDS)} {rng.choice(_CONNECTORS)} {self._title_words(rng, 2, 4)}',
+                self._issn(rng),
+            )
+            for _ in range(journals)
+        ]
+        self._authors = [
+            (self._word(rng).capitalize(), rng.choice(_GIVEN_NAMES), self._orcid(rng))
+            for _ in range(authors)
+        ]
+
+    @staticmethod
+    def _word(rng):
+        return ''.join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+    def _title_words(self, rng, minimum, maximum):
+        words = []
+        for _ in range(rng.randint(minimum, maximum)):
+            words.append(rng.choice(self._vocabulary))
+            if rng.random() < 0.3:
+                words.append(rng.choice(_CONNECTORS))
+        words[0] = words[0].capitalize()
+        return ' '.join(words)
+
+    @staticmethod
+    def _issn(rng):
+        digits = f'{rng.randrange(10 ** 7):07d}'
+        return f'{digits[:4]}-{digits[4:]}{issn_check_digit(digits)}'
+
+    @staticmethod
+    def _orcid(rng):
+        digits = f'0000000{rng.randrange(10 ** 8):08d}'
+        orcid = digits + orcid_check_digit(digits)
+        return '-'.join(orcid[i:i + 4] for i in range(0, 16, 4))
+
+    def _original(self, record_id):
+        rng = self._random
+        journal, issn = rng.choice(self._journals)
+        year = rng.randint(1990, 2024)
+        first_page = rng.randint(1, 400)
+        authors = rng.sample(self._authors, rng.randint(1, 5))
+        return {
+            'id': record_id,
+            'cluster_id': record_id,
+            'title': self._title_words(rng, 4, 16),
+            'authors': [(surname, given) for surname, given, _ in authors],
+            'orcid': authors[0][2] if rng.random() < 0.4 else None,
+            'journal': journal,
+            'issn': issn,
+            'volume': rng.randint(1, 60),
+            'number': rng.randint(1, 12),
+            'pages': (first_page, first_page + rng.randint(1, 30)),
+            'publication_date': (year, rng.randint(1, 12), rng.randint(1, 28)),
+            'doi': f'10.1590/{issn}{year}{record_id % 1000000:06d}' if rng.random() < 0.7 else None,
+            'sponsor': rng.choice(('CNPq', 'FAPESP', 'CAPES', 'Conselho Nacional de Desenvolvimento Científico e Tecnológico',
+                                   'Fundação de Amparo à Pesquisa do Estado de São Paulo', None, None)),
+        }
+
+    def _noisy(self, probability=None):
+        return self._random.random() < (self.noise_rate if probability is None else probability)
+
+    def _text(self, text):
+        rng = self._random
+        if self._noisy():
+            text = text.upper() if rng.random() < 0.5 else text.lower()
+        if self._noisy():
+            text = remove_accents(text)
+        if self._noisy():
+            text = text.replace(' ', '  ', rng.randint(1, 3))
+        if self._noisy():
+            position = rng.randint(0, len(text))
+            text = text[:position] + rng.choice(NON_PRINTABLE_CHARS) + text[position:]
+        if self._noisy():
+            text = ''.join(
+                f'&{html.entities.codepoint2name[ord(c)]};' if ord(c) in html.entities.codepoint2name and ord(c) > 127 else c
+                for c in text
+            )
+        elif self._noisy():
+            text = text.replace(' e ', ' &amp; ')
+        if self._noisy():
+            text = text + rng.choice(END_PUNCTUATION)
+        if self._noisy(self.noise_rate / 3):
+            text = f' {text} '
+        return text
+
+    def _authors_text(self, authors):
+        rng = self._random
+        names = []
+        for surname, given in authors:
+            if self._noisy():
+                names.append(f'{given} {surname}')
+            elif self._noisy():
+                names.append(f'{surname}, {given[0]}.')
+            else:
+                names.append(f'{surname}, {given}')
+        return self._text(rng.choice(('; ', ';', ' and ')).join(names))
+
+    def _volume(self, volume):
+        if self._noisy():
+            import roman
+
+            return roman.toRoman(volume)
+        if self._noisy():
+            return self._random.choice(('v. {}', 'vol. {}', ' {} ', '{}.')).format(volume)
+        return str(volume)
+
+    def _pages(self, pages):
+        first, last = pages
+        rng = self._random
+        if self._noisy():
+            first, last = last, first
+        if self._noisy():
+            last = str(last)[-len(str(last)) // 2:]
+        if self._noisy():
+            return f'e{first}'
+        return f'{first}{rng.choice(("-", "-", "_", ":", ";"))}{last}'
+
+    def _date(self, date):
+        year, month, day = date
+        rng = self._random
+        month_name = rng.choice(_MONTH_NAMES[month])
+        if self._noisy():
+            month_name = month_name.capitalize()
+        return rng.choice((
+            f'{year}-{month:02d}-{day:02d}',
+            f'{day:02d}/{month:02d}/{year}',
+            f'{day} de {month_name} de {year}',
+            f'{month_name} {day}, {year}',
+            f'{year}',
+        ))
+
+    def _doi(self, doi):
+        if doi is None:
+            return None
+        if self._noisy():
+            doi = doi.upper()
+        return self._random.choice(_DOI_TEMPLATES).format(doi=doi)
+
+    def _orcid_text(self, orcid):
+        if orcid is None:
+            return None
+        return self._random.choice(_ORCID_TEMPLATES).format(orcid=orcid)
+
+    def _render(self, record):
+        return {
+            'id': record['id'],
+            'cluster_id': record['cluster_id'],
+            'title': self._text(record['title']),
+            'authors': self._authors_text(record['authors']),
+            'orcid': self._orcid_text(record['orcid']),
+            'journal': self._text(record['journal']),
+            'issn': record['issn'].replace('-', '') if self._noisy() else record['issn'],
+            'volume': self._volume(record['volume']),
+            'number': str(record['number']),
+            'pages': self._pages(record['pages']),
+            'publication_date': self._date(record['publication_date']),
+            'doi': self._doi(record['doi']),
+            'sponsor': self._text(record['sponsor']) if record['sponsor'] else None,
+        }
+
+    def records(self, count=None):
+        """
+        Gera registros sintéticos.
+
+        Parameters
+        ----------
+        count : int, default None
+            Quantidade de registros; quando None, a geração é infinita.
+
+        Returns
+        -------
+        generator of dict
+            Registros com os campos descritos na classe.
+        """
+        rng = self._random
+        originals = []
+        record_id = 0
+        while count is None or record_id < count:
+            if originals and rng.random() < self.duplicate_rate:
+                record = dict(rng.choice(originals), id=record_id)
+            else:
+                record = self._original(record_id)
+                if len(originals) < self.duplicate_window:
+                    originals.append(record)
+                else:
+                    originals[record_id % self.duplicate_window] = record
+            yield self._render(record)
+            record_id += 1
+
+
+def generate_citations(count, seed=1, **kwargs):
+    """
+    Gera referências bibliográficas sintéticas (ver CitationGenerator).
+
+    Parameters
+    ----------
+    count : int
+        Quantidade de registros.
+    seed : int, default 1
+        Semente do gerador.
+    **kwargs
+        Demais parâmetros de CitationGenerator (duplicate_rate, noise_rate, journals, authors, vocabulary_size).
+
+    Returns
+    -------
+    generator of dict
+        Registros sintéticos.
+
+    Exemplo:
+        list(generate_citations(10, seed=7)) == list(generate_citations(10, seed=7))
+    """
+    return CitationGenerator(seed=seed, **kwargs).records(count)
+
+
+def write_jsonl(records, path):
+    """
+    Grava registros em JSON Lines, um registro por linha, sem mantê-los em memória.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        Registros, por exemplo, a saída de generate_citations.
+    path : str
+        Caminho do arquivo.
+
+    Returns
+    -------
+    int
+        Quantidade de registros gravados.
+    """
+    count = 0
+    with open(path, 'w', encoding='utf-8') as fp:
+        for record in records:
+            fp.write(json.dumps(record, ensure_ascii=False))
+            fp.write('\n')
+            count += 1
+    return count
+
+
+def read_jsonl(path):
+    """
+    Lê registros gravados por write_jsonl.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo.
+
+    Returns
+    -------
+    generator of dict
+        Registros.
+    """
+    with open(path, encoding='utf-8') as fp:
+        for line in fp:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_parquet(records, path, batch_size=100000):
+    """
+    Grava registros em Parquet, em lotes de batch_size registros.
+
+    Requer pyarrow.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        Registros, por exemplo, a saída de generate_citations.
+    path : str
+        Caminho do arquivo.
+    batch_size : int, default 100000
+        Quantidade de registros por lote (row group).
+
+    Returns
+    -------
+    int
+        Quantidade de registros gravados.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError('pyarrow é necessário para write_parquet')
+
+    count = 0
+    writer = None
+    records = iter(records)
+    try:
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            if writer is None:
+                # colunas sem nenhum valor no primeiro lote são gravadas como texto
+                schema = pa.Table.from_pylist(batch).schema
+                schema = pa.schema([
+                    (f.name, pa.string() if pa.types.is_null(f.type) else f.type) for f in schema
+                ])
+                writer = pq.ParquetWriter(path, schema)
+            table = pa.Table.from_pylist(batch, schema=schema)
+            writer.write_table(table)
+            count += len(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
@@ -0,0 +1,161 @@
+from array import array
+
+
+class UnionFind:
+    """
+    Estrutura union-find (conjuntos disjuntos) sobre identificadores inteiros 0..n-1, armazenada em arrays compactos.
+    Utiliza união por tamanho e compressão de caminho (path halving).
+
+    Parameters
+    ----------
+    size : int, default 0
+        Quantidade inicial de elementos.
+    """
+
+    def __init__(self, size=0):
+        self._parent = array('q', range(size))
+        self._size = array('q', [1]) * size
+
+    def __len__(self):
+        return len(self._parent)
+
+    def add(self):
+        """
+        Adiciona um novo elemento em um conjunto unitário.
+
+        Returns
+        -------
+        int
+            Identificador do novo elemento.
+        """
+        element = len(self._parent)
+        self._parent.append(element)
+        self._size.append(1)
+        return element
+
+    def grow(self, size):
+        """
+        Aumenta a quantidade de elementos para size, criando conjuntos unitários.
+
+        Parameters
+        ----------
+        size : int
+            Nova quantidade de elementos.
+        """
+        current = len(self._parent)
+        if size > current:
+            self._parent.extend(range(current, size))
+            self._size.extend(array('q', [1]) * (size - current))
+
+    def find(self, element):
+        """
+        Obtém o representante do conjunto de element.
+
+        Parameters
+        ----------
+        element : int
+            Identificador do elemento.
+
+        Returns
+        -------
+        int
+            Identificador do representante do conjunto.
+        """
+        parent = self._parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, a, b):
+        """
+        Une os conjuntos de a e de b.
+
+        Parameters
+        ----------
+        a : int
+            Identificador do primeiro elemento.
+        b : int
+            Identificador do segundo elemento.
+
+        Returns
+        -------
+        int
+            Identificador do representante do conjunto resultante.
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        return root_a
+
+    def union_pairs(self, pairs):
+        """
+        Une os conjuntos de cada par de uma sequência de pares, que pode ser lida de forma incremental
+        (por exemplo, de um arquivo). A estrutura cresce automaticamente para conter os identificadores dos pares.
+
+        Parameters
+        ----------
+        pairs : iterable of tuple
+            Pares (a, b) de identificadores.
+
+        Returns
+        -------
+        int
+            Quantidade de pares que uniram conjuntos distintos.
+        """
+        parent = self._parent
+        size = self._size
+        merged = 0
+        for a, b in pairs:
+            if a >= len(parent) or b >= len(parent):
+                self.grow(max(a, b) + 1)
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+            merged += 1
+        return merged
+
+    def connected(self, a, b):
+        """
+        Verifica se a e b pertencem ao mesmo conjunto.
+
+        Returns
+        -------
+        bool
+            Valor lógico que indica se a e b pertencem ao mesmo conjunto.
+        """
+        return self.find(a) == self.find(b)
+
+    def labels(self):
+        """
+        Obtém rótulos densos de conjunto para todos os elementos.
+        Os rótulos são numerados a partir de 0 na ordem em que cada conjunto aparece pela primeira vez.
+
+        Returns
+        -------
+        array of int
+            Rótulo do conjunto de cada elemento.
+        """
+        labels = array('q', bytes(8 * len(self._parent)))
+        root_label = {}
+        for element in range(len(self._parent)):
+            root = self.find(element)
+            label = root_label.get(root)
+            if label is None:
+                label = root_label[root] = len(root_label)
+            labels[element] = label
+        return labels
@@ -1,14 +1,46 @@
 import re
 
 
-PATTERN_PARENTHESIS = re.compile(r'[-a-zA-ZÀ-ÖØ-öø-ÿ|0-9]*\([-a-zA-ZÀ-ÖØ-öø-ÿ|\W|0-9]*\)[-a-zA-ZÀ-ÖØ-öø-ÿ|0-9]*', re.UNICODE)
+# Versão das regras de normalização: deve ser incrementada a cada alteração que modifique o resultado de alguma
+# função padronizadora, o que invalida os valores armazenados em caches persistentes e manifestos
+NORMALIZATION_RULES_VERSION = 1
+
+
+class _LazyPattern:
+    """
+    Expressão regular compilada apenas no primeiro uso. Após a compilação, os métodos do padrão compilado são
+    copiados para a instância, de modo que as chamadas seguintes não passam por __getattr__.
+    É usada apenas internamente (nomes iniciados por _PATTERN): os nomes públicos correspondentes são padrões
+    compilados (re.Pattern), obtidos no primeiro acesso por __getattr__ do módulo.
+    """
+
+    def __init__(self, pattern, flags=0):
+        self._source = (pattern, flags)
+        self._compiled = None
+
+    def compile(self):
+        """Compila a expressão regular (uma única vez) e devolve o padrão compilado."""
+        if self._compiled is None:
+            self._compiled = re.compile(*self._source)
+            for attribute in ('match', 'fullmatch', 'search', 'sub', 'subn', 'split', 'findall', 'finditer'):
+                setattr(self, attribute, getattr(self._compiled, attribute))
+        return self._compiled
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.compile(), name)
+
+
+_PATTERN_PARENTHESIS = _LazyPattern(r'[-a-zA-ZÀ-ÖØ-öø-ÿ|0-9]*\([-a-zA-ZÀ-ÖØ-öø-ÿ|\W|0-9]*\)[-a-zA-ZÀ-ÖØ-öø-ÿ|0-9]*', re.UNICODE)
 
 PATTERN_DATE = r'(\d+)([a-zA-Z]*)(\d+)'
 
 PATTERN_ORCID = r'(.*)(\d{4}-\d{4}-\d{4}-\d{3}[\d|X|x])(.*)'
+_PATTERN_ORCID = _LazyPattern(PATTERN_ORCID)
 
 # https://www.crossref.org/blog/dois-and-matching-regular-expressions/ (accessed on 2021/08/31)
-PATTERNS_DOI = [re.compile(pd) for pd in [
+_PATTERNS_DOI = [_LazyPattern(pd) for pd in [
     r'10.\d{4,9}/[-._;()/:A-Z0-9]+$',
     r'10.1002/[^\s]+$',
     r'10.\d{4}/\d+-\d+X?(\d+)\d+<[\d\w]+:[\d\w]*>\d+.\d+.\w+;\d$',
@@ -17,10 +49,14 @@ PATTERNS_DOI = [re.compile(pd) for pd in [
 ]
 
 # https://en.wikipedia.org/wiki/International_Standard_Serial_Number (accessed on 2021/08/31)
-PATTERN_ISSN_WITHOUT_HYPHEN = re.compile(r'^[0-9]{4}[0-9]{3}[0-9xX]$')
-PATTERN_ISSN_WITH_HYPHEN = re.compile(r'^[0-9]{4}-[0-9]{3}[0-9xX]$')
+_PATTERN_ISSN_WITHOUT_HYPHEN = _LazyPattern(r'^[0-9]{4}[0-9]{3}[0-9xX]$')
+_PATTERN_ISSN_WITH_HYPHEN = _LazyPattern(r'^[0-9]{4}-[0-9]{3}[0-9xX]$')
+_PATTERN_ISSN_CANONICAL = _LazyPattern(r'^[0-9]{4}-[0-9]{3}[0-9X]$')
+
+_PATTERN_YEAR = _LazyPattern(r'(?<![0-9])(1[5-9][0-9]{2}|20[0-9]{2})(?![0-9])')
 
 PATTERN_PAGE_RANGE = r'(\d*)[-|_|:|;|,|.](\d*)'
+_PATTERN_PAGE_RANGE = _LazyPattern(PATTERN_PAGE_RANGE)
 
 JOURNAL_TITLE_SPECIAL_CHARS = {
     '@',
@@ -37,6 +73,34 @@ JOURNAL_TITLE_SPECIAL_WORDS = {
     'cdrom'
 }
 
+JOURNAL_TITLE_STOP_WORDS = {
+    'a',
+    'and',
+    'da',
+    'das',
+    'de',
+    'del',
+    'do',
+    'dos',
+    'e',
+    'el',
+    'em',
+    'en',
+    'for',
+    'in',
+    'la',
+    'las',
+    'los',
+    'o',
+    'of',
+    'para',
+    'the',
+    'y'
+}
+
+# https://www.issn.org/services/online-services/access-to-the-ltwa/ (accessed on 2026/10/19)
+LTWA_NOT_ABBREVIATED = 'n.a.'
+
 PUNCTUATION_TO_REMOVE_FROM_TITLE_VISUALIZATION = {
     ',',
     '.',
@@ -49,6 +113,61 @@ PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_VISUALIZATION = {
     ','
 }
 
+PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_PARSING = {
+    ',',
+    '-',
+    "'"
+}
+
+PERSON_NAME_PARTICLES = {
+    'da',
+    'das',
+    'de',
+    'del',
+    'della',
+    'der',
+    'des',
+    'di',
+    'do',
+    'dos',
+    'du',
+    'la',
+    'le',
+    'van',
+    'von',
+    'y'
+}
+
+# Regras aplicadas em ordem sobre o sobrenome em caixa baixa e sem acentos
+_PHONETIC_RULES_PT_ES = [(_LazyPattern(pattern), replace_with) for pattern, replace_with in [
+    (r'ph', 'f'),
+    (r'[cs]h', 'x'),
+    (r'lh', 'l'),
+    (r'nh', 'n'),
+    (r'sc(?=[eiy])', 's'),
+    (r'qu(?=[eiy])', 'k'),
+    (r'gu(?=[eiy])', 'g'),
+    (r'c(?=[eiy])', 's'),
+    (r'g(?=[eiy])', 'j'),
+    (r'h', ''),
+    (r'[cqk]', 'k'),
+    (r'z', 's'),
+    (r'w', 'v'),
+    (r'v', 'b'),
+    (r'y', 'i'),
+    (r'n(?=[bp])', 'm'),
+]]
+
+_PATTERN_AUTHOR_SEPARATORS = _LazyPattern(r'\s*;\s*|\s+(?:&|and|e)\s+')
+
+_PATTERN_SPONSOR_SEPARATORS = _LazyPattern(r'\s*[;/]\s*|\s+(?:&|and|e|y)\s+')
+
+_PATTERN_SPONSOR_SEGMENT_SEPARATORS = _LazyPattern(r'\s*[;/]\s*')
+
+_PATTERN_SPONSOR_CONJUNCTIONS = _LazyPattern(r'\s+(?:&|and|e|y)\s+')
+
+_PATTERN_SPONSOR_ACRONYM = _LazyPattern(r'(?<![\w-])[A-Z][A-Za-z]{0,10}[A-Z][a-z]?(?![\w-])')
+
 DATE_SEPARATORS = {
     '/',
     '.',
@@ -64,3 +183,41 @@ PUNCTUATION_TO_DEFINE_PAGE_RANGE = {
     ',',
     '.'
 }
+
+
+# nomes públicos compilados no primeiro acesso (ver __getattr__) a partir dos padrões internos _<nome>
+_COMPILED_ON_ACCESS = (
+    'PATTERN_PARENTHESIS',
+    'PATTERNS_DOI',
+    'PATTERN_ISSN_WITHOUT_HYPHEN',
+    'PATTERN_ISSN_WITH_HYPHEN',
+    'PATTERN_ISSN_CANONICAL',
+    'PATTERN_YEAR',
+    'PHONETIC_RULES_PT_ES',
+    'PATTERN_AUTHOR_SEPARATORS',
+    'PATTERN_SPONSOR_SEPARATORS',
+    'PATTERN_SPONSOR_SEGMENT_SEPARATORS',
+    'PATTERN_SPONSOR_CONJUNCTIONS',
+    'PATTERN_SPONSOR_ACRONYM',
+)
+
+
+def _compiled(value):
+    if isinstance(value, _LazyPattern):
+        return value.compile()
+    if isinstance(value, tuple):
+        return tuple(_compiled(item) for item in value)
+    if isinstance(value, list):
+        return [_compiled(item) for item in value]
+    return value
+
+
+def __getattr__(name):
+    if name not in _COMPILED_ON_ACCESS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = _compiled(globals()['_' + name])
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_COMPILED_ON_ACCESS))
@@ -2,7 +2,6 @@ from setuptools import setup, find_packages
 
 install_requirements=[
     'python-dateutil',
-    'python_stdnum',
     'roman',
 ]
 
@@ -14,8 +13,9 @@ setup(
     author_email="scielo-dev@googlegroups.com",
     license="BSD",
     install_requires=install_requirements,
+    extras_require={'dedup': ['numpy'], 'parquet': ['pyarrow']},
     url="https://github.com/scieloorg/scielo_scholarly_data",
     keywords='scholarly data, normalization, deduplication, disambiguation, preprocessing',
     maintainer_email='rafael.pezzuto@gmail.com',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
 )
@@ -0,0 +1,171 @@
+from scielo_scholarly_data.async_standardizer import standardize_stream
+from scielo_scholarly_data.standardizer import journal_issn
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import asyncio
+import multiprocessing
+import time
+import unittest
+
+
+ISSNS = ['1387666x', '0034-8910', '1413-8123', '0102311x', 'invalid'] * 20
+
+
+def _standardize(record):
+    return journal_issn(record['issn'], use_issn_validator=True)
+
+
+def _slow_standardize(record):
+    time.sleep(0.005)
+    return _standardize(record)
+
+
+def _fail_on_invalid(record):
+    if record['issn'] == 'invalid':
+        raise ValueError(record['issn'])
+    return _standardize(record)
+
+
+async def _producer(values, pulled=None):
+    for value in values:
+        if pulled is not None:
+            pulled.append(value)
+        yield {'issn': value}
+        await asyncio.sleep(0)
+
+
+async def _collect(stream):
+    return [result async for result in stream]
+
+
+async def _take(stream, count):
+    results = []
+    async for result in stream:
+        results.append(result)
+        if len(results) == count:
+            return results
+
+
+class TestStandardizeStream(unittest.IsolatedAsyncioTestCase):
+
+    def expected(self, values=ISSNS):
+        return [_standardize({'issn': value}) for value in values]
+
+    async def test_results_in_input_order(self):
+        results = await _collect(standardize_stream(_producer(ISSNS), _standardize, chunk_size=7))
+        self.assertEqual(results, self.expected())
+
+    async def test_thread_pool(self):
+        with ThreadPoolExecutor(2) as executor:
+            stream = standardize_stream(_producer(ISSNS), _standardize, executor=executor, chunk_size=10)
+            self.assertEqual(await _collect(stream), self.expected())
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'requer fork')
+    async def test_process_pool(self):
+        with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('fork')) as executor:
+            stream = standardize_stream(_producer(ISSNS), _standardize, executor=executor, chunk_size=10)
+            self.assertEqual(await _collect(stream), self.expected())
+
+    async def test_empty_source(self):
+        self.assertEqual(await _collect(standardize_stream(_producer([]), _standardize)), [])
+
+    async def test_event_loop_is_not_blocked(self):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        try:
+            results = await _collect(standardize_stream(_producer(ISSNS), _slow_standardize, chunk_size=25))
+        finally:
+            task.cancel()
+        self.assertEqual(results, self.expected())
+        # os lotes levam cerca de 125 ms cada; o laço de eventos continua atendendo outras tarefas
+        self.assertGreater(len(ticks), 20)
+
+    async def test_in_flight_work_is_bounded(self):
+        pulled = []
+        stream = standardize_stream(_producer(ISSNS, pulled), _standardize, chunk_size=5, max_in_flight=2)
+        consumed = 0
+        async for _ in stream:
+            consumed += 1
+            # no máximo max_in_flight lotes lidos e ainda não consumidos, além do lote em formação
+            self.assertLessEqual(len(pulled) - consumed, 5 * 3)
+            await asyncio.sleep(0)
+        self.assertEqual(consumed, len(ISSNS))
+
+    async def test_bounded_queue_producer(self):
+        queue = asyncio.Queue(maxsize=10)
+
+        async def fill():
+            for value in ISSNS:
+                await queue.put(value)
+            await queue.put(None)
+
+        async def drain():
+            while True:
+                value = await queue.get()
+                if value is None:
+                    return
+                yield {'issn': value}
+
+        producer = asyncio.create_task(fill())
+        results = await _collect(standardize_stream(drain(), _standardize, chunk_size=4, max_in_flight=2))
+        await producer
+        self.assertEqual(results, self.expected())
+
+    async def test_source_that_never_closes(self):
+        queue = asyncio.Queue()
+        for value in ISSNS[:10]:
+            queue.put_nowait(value)
+
+        async def endless():
+            while True:
+                yield {'issn': await queue.get()}
+
+        stream = standardize_stream(endless(), _standardize, chunk_size=4, max_in_flight=4, flush_interval=0.01)
+        results = []
+
+        async def consume():
+            async for result in stream:
+                results.append(result)
+                if len(results) == 10:
+                    return
+
+        # os dois lotes completos não esperam max_in_flight, e o lote incompleto é enviado depois de flush_interval
+        await asyncio.wait_for(consume(), timeout=5)
+        await stream.aclose()
+        self.assertEqual(results, self.expected(ISSNS[:10]))
+
+    async def test_completed_chunks_are_not_held_back(self):
+        queue = asyncio.Queue()
+        for value in ISSNS[:4]:
+            queue.put_nowait(value)
+
+        async def source():
+            while True:
+                value = await queue.get()
+                if value is None:
+                    return
+                yield {'issn': value}
+
+        stream = standardize_stream(source(), _standardize, chunk_size=4, max_in_flight=4)
+        first = await asyncio.wait_for(_take(stream, 4), timeout=5)
+        self.assertEqual(first, self.expected(ISSNS[:4]))
+        queue.put_nowait(ISSNS[4])
+        queue.put_nowait(None)
+        self.assertEqual(await _collect(stream), self.expected(ISSNS[4:5]))
+
+    async def test_errors_are_propagated(self):
+        with self.assertRaises(ValueError):
+            await _collect(standardize_stream(_producer(ISSNS), _fail_on_invalid, chunk_size=3))
+
+    async def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            await _collect(standardize_stream(_producer(ISSNS), _standardize, chunk_size=0))
+        with self.assertRaises(ValueError):
+            await _collect(standardize_stream(_producer(ISSNS), _standardize, flush_interval=0))
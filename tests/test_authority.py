@@ -0,0 +1,133 @@
+from scielo_scholarly_data.authority import (
+    AuthorityIndex,
+    book_editor_address_key,
+    book_title_key,
+    build_authority_index,
+    chapter_title_key,
+    InvalidAuthorityFileError,
+    load_authority_index,
+    read_authority_csv,
+)
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+AUTHORITY_CSV = '''Editora Fiocruz;Ed. Fiocruz;Editora FIOCRUZ;Fiocruz
+Editora da Universidade de São Paulo;EDUSP;Edusp;Editora USP
+Editora Unesp;Fundação Editora da UNESP;Ed. UNESP
+Fiocruz;Editora Unesp
+'''
+
+
+class TestAuthority(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        csv_path = os.path.join(self.directory.name, 'publishers.csv')
+        with open(csv_path, 'w', encoding='utf-8') as fp:
+            fp.write(AUTHORITY_CSV)
+        self.path = os.path.join(self.directory.name, 'publishers.bin')
+        self.size = build_authority_index(read_authority_csv(csv_path), self.path)
+        self.index = load_authority_index(self.path)
+
+    def tearDown(self):
+        self.index.close()
+        self.directory.cleanup()
+
+    def test_read_authority_csv(self):
+        entries = list(read_authority_csv(os.path.join(self.directory.name, 'publishers.csv')))
+        self.assertEqual(entries[0], ('Editora Fiocruz', ['Ed. Fiocruz', 'Editora FIOCRUZ', 'Fiocruz']))
+
+    def test_build_authority_index(self):
+        self.assertEqual(self.size, 9)
+        self.assertEqual(len(self.index), 9)
+
+    def test_lookup_exact(self):
+        self.assertEqual(self.index.lookup('EDITORA FIOCRUZ.'), ('Editora Fiocruz', 1.0))
+        self.assertEqual(self.index.lookup('Ed. Fiocruz'), ('Editora Fiocruz', 1.0))
+        self.assertEqual(self.index.lookup('edusp'), ('Editora da Universidade de São Paulo', 1.0))
+        self.assertEqual(self.index.lookup('Fiocruz'), ('Editora Fiocruz', 1.0))
+        self.assertEqual(self.index.lookup('Editora Unesp'), ('Editora Unesp', 1.0))
+
+    def test_lookup_fuzzy(self):
+        name, score = self.index.lookup('Editora da Universidade de Sao Paulo - EDUSP')
+        self.assertEqual(name, 'Editora da Universidade de São Paulo')
+        self.assertGreaterEqual(score, 0.8)
+        self.assertLess(score, 1.0)
+        self.assertIsNone(self.index.lookup('Editora da Universidade de Sao Paulo - EDUSP', threshold=None))
+        self.assertIsNone(self.index.lookup('Springer'))
+        self.assertIsNone(self.index.lookup(''))
+
+    def test_authority_index_from_bytes(self):
+        with open(self.path, 'rb') as fp:
+            index = AuthorityIndex(fp.read())
+        self.assertEqual(index.lookup('Ed. UNESP'), ('Editora Unesp', 1.0))
+        index.close()
+
+    def test_load_authority_index_invalid_file(self):
+        path = os.path.join(self.directory.name, 'invalid.bin')
+        with open(path, 'wb') as fp:
+            fp.write(b'not an authority index')
+        self.assertRaises(InvalidAuthorityFileError, load_authority_index, path)
+        with open(path, 'wb'):
+            pass
+        self.assertRaises(InvalidAuthorityFileError, load_authority_index, path)
+
+    def test_fuzzy_tie_break_does_not_depend_on_hash_seed(self):
+        path = os.path.join(self.directory.name, 'ties.bin')
+        build_authority_index([('Editora Abcx', []), ('Editora Abcy', [])], path)
+        script = (
+            'from scielo_scholarly_data.authority import load_authority_index\n'
+            f'print(load_authority_index({path!r}).lookup("Editora Abcz", threshold=0.5))'
+        )
+        results = set()
+        for seed in range(5):
+            environment = dict(os.environ, PYTHONHASHSEED=str(seed))
+            results.add(subprocess.run(
+                [sys.executable, '-c', script], cwd=ROOT, env=environment, capture_output=True, text=True, check=True,
+            ).stdout)
+        self.assertEqual(len(results), 1)
+
+
+class TestStandardizedKeys(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'authority.bin')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_keys(self):
+        self.assertEqual(book_editor_address_key('[São Paulo] :'), 'sao paulo')
+        self.assertEqual(book_title_key('Saúde &amp; Sociedade.'), 'saude & sociedade')
+        self.assertEqual(chapter_title_key('Introdução:  a   história.'), 'introducao: a historia')
+        self.assertEqual(book_title_key(''), '')
+
+    def test_book_editor_address_index(self):
+        build_authority_index(
+            [('São Paulo', ['S. Paulo', 'SP']), ('Rio de Janeiro', ['RJ'])], self.path, key=book_editor_address_key,
+        )
+        with load_authority_index(self.path, key=book_editor_address_key) as index:
+            self.assertEqual(index.lookup('[Sao Paulo] :'), ('São Paulo', 1.0))
+            self.assertEqual(index.lookup('[S. Paulo]'), ('São Paulo', 1.0))
+            self.assertEqual(index.lookup('Rio de Janeiro, RJ')[0], 'Rio de Janeiro')
+
+    def test_book_title_index(self):
+        build_authority_index(
+            [('Saúde & Sociedade', ['Saude e Sociedade'])], self.path, key=book_title_key,
+        )
+        with load_authority_index(self.path, key=book_title_key) as index:
+            self.assertEqual(index.lookup('SAÚDE &amp; SOCIEDADE.'), ('Saúde & Sociedade', 1.0))
+            self.assertIsNone(index.lookup('Zoologia'))
+
+    def test_chapter_title_index(self):
+        build_authority_index([('Introdução: a história da saúde', [])], self.path, key=chapter_title_key)
+        with load_authority_index(self.path, key=chapter_title_key) as index:
+            self.assertEqual(index.lookup('Introdução:  a história da saúde.'), ('Introdução: a história da saúde', 1.0))
@@ -0,0 +1,70 @@
+from scielo_scholarly_data.authors import (
+    AuthorName,
+    format_author_name,
+    parse_author_name,
+    parse_authors,
+)
+
+import unittest
+
+
+class TestAuthors(unittest.TestCase):
+
+    def test_parse_author_name_given_names_first(self):
+        self.assertEqual(
+            parse_author_name('John Fitzgerald Kennedy'),
+            AuthorName('Kennedy', 'John Fitzgerald', 'JF', '')
+        )
+
+    def test_parse_author_name_surname_first(self):
+        self.assertEqual(
+            parse_author_name('Kennedy, John Fitzgerald'),
+            AuthorName('Kennedy', 'John Fitzgerald', 'JF', '')
+        )
+
+    def test_parse_author_name_particle(self):
+        self.assertEqual(parse_author_name('João da Silva'), AuthorName('Silva', 'João', 'J', 'da'))
+        self.assertEqual(parse_author_name('Jan van der Berg'), AuthorName('Berg', 'Jan', 'J', 'van der'))
+        self.assertEqual(parse_author_name('van der Berg, Jan'), AuthorName('Berg', 'Jan', 'J', 'van der'))
+        self.assertEqual(parse_author_name('Silva, João da'), AuthorName('Silva', 'João', 'J', 'da'))
+        self.assertEqual(parse_author_name('de Souza'), AuthorName('Souza', '', '', 'de'))
+
+    def test_parse_author_name_capitalized_particle(self):
+        self.assertEqual(parse_author_name('De Souza'), AuthorName('Souza', '', '', 'De'))
+        self.assertEqual(parse_author_name('Maria Da Silva'), AuthorName('Silva', 'Maria', 'M', 'Da'))
+        self.assertEqual(parse_author_name('Van Der Berg'), AuthorName('Berg', '', '', 'Van Der'))
+        self.assertEqual(parse_author_name('De Souza', for_deduplication=True), AuthorName('souza', '', '', 'de'))
+
+    def test_parse_author_name_initials(self):
+        self.assertEqual(parse_author_name('Silva JP'), AuthorName('Silva', '', 'JP', ''))
+        self.assertEqual(parse_author_name('Souza-Lima, A. B.'), AuthorName('Souza-Lima', 'A B', 'AB', ''))
+        self.assertEqual(parse_author_name('J.-P. Sartre'), AuthorName('Sartre', 'J P', 'JP', ''))
+
+    def test_parse_author_name_for_deduplication(self):
+        self.assertEqual(
+            parse_author_name('Gabriel García MÁRQUEZ', for_deduplication=True),
+            AuthorName('marquez', 'gabriel garcia', 'gg', '')
+        )
+
+    def test_parse_author_name_empty(self):
+        self.assertIsNone(parse_author_name(' .\n'))
+
+    def test_parse_author_name_interns_surname(self):
+        first = parse_author_name('Maria ' + ''.join(['Sil', 'va']))
+        second = parse_author_name('Silva, José')
+        self.assertIs(first.surname, second.surname)
+
+    def test_parse_authors_separators(self):
+        self.assertEqual(
+            [a.surname for a in parse_authors('Silva, J.; Souza M & Maria Costa and Ana Lima e Pedro Alves')],
+            ['Silva', 'Souza', 'Costa', 'Lima', 'Alves']
+        )
+
+    def test_parse_authors_skips_empty_names(self):
+        self.assertEqual(parse_authors('Silva, J.;; ; '), [AuthorName('Silva', 'J', 'J', '')])
+
+    def test_format_author_name(self):
+        author = parse_author_name('Jan van der Berg')
+        self.assertEqual(format_author_name(author), 'van der Berg, Jan')
+        self.assertEqual(format_author_name(author, surname_first=False), 'Jan van der Berg')
+        self.assertEqual(format_author_name(parse_author_name('Silva JP')), 'Silva, JP')
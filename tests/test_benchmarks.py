@@ -0,0 +1,63 @@
+from benchmarks import runner
+from benchmarks.cases import CASES, DISTRIBUTIONS
+from scielo_scholarly_data import core, standardizer
+
+import inspect
+import os
+import tempfile
+import unittest
+
+
+def _public_functions(module):
+    return {
+        f'{module.__name__.rsplit(".", 1)[-1]}.{name}'
+        for name, value in inspect.getmembers(module, inspect.isfunction)
+        if not name.startswith('_') and value.__module__ == module.__name__
+    }
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_cases_cover_core_and_standardizer(self):
+        names = {name for name, *_ in CASES}
+        self.assertEqual(_public_functions(core) - names, set())
+        self.assertEqual(_public_functions(standardizer) - names, set())
+        self.assertIn('dates.convert_to_iso_date', names)
+
+    def test_cases_distributions(self):
+        for name, function, kwargs, inputs in CASES:
+            self.assertEqual(tuple(inputs), DISTRIBUTIONS, name)
+
+    def test_run_save_and_compare(self):
+        report = runner.run(pattern=r'^core\.remove_accents$', min_time=0.001, repeat=1)
+        self.assertEqual(list(report['results']), ['core.remove_accents'])
+        result = report['results']['core.remove_accents']['clean']
+        self.assertGreater(result['latency_ns'], 0)
+        self.assertAlmostEqual(result['records_per_second'], 1e9 / result['latency_ns'])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = runner.save(report, os.path.join(directory, 'baseline.json'))
+            baseline = runner.load(path)
+        ratios = runner.compare(report, baseline)
+        self.assertEqual(len(ratios), len(DISTRIBUTIONS))
+        self.assertTrue(all(ratio == 1.0 for _, _, ratio in ratios))
+        self.assertIn('vs baseline', runner.format_report(report, baseline))
+
+    def test_exceptions_are_reported(self):
+        def fail_on_digits(text):
+            if text.isdigit():
+                raise ValueError(text)
+            return text
+
+        cases = [('tests.fail_on_digits', fail_on_digits, {}, {'clean': ['a', 'b', '2'], 'dirty': ['1', '2']})]
+        report = runner.run(min_time=0.001, repeat=1, cases=cases)
+        clean, dirty = report['results']['tests.fail_on_digits'].values()
+        self.assertEqual((clean['errors'], clean['inputs'], clean['error_types']), (1, 3, {'ValueError': 1}))
+        self.assertEqual((dirty['errors'], dirty['inputs']), (2, 2))
+        table = runner.format_report(report)
+        self.assertIn('2/2  ValueError=2', table)
+        self.assertIn('1/3  ValueError=1', table)
+
+    def test_machine_tag(self):
+        info = dict(runner.machine_info(), node='my host', machine='x86_64', python='3.11.4')
+        self.assertEqual(runner.machine_tag(info), 'my_host-x86_64-py3.11')
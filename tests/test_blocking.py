@@ -0,0 +1,75 @@
+from scielo_scholarly_data.blocking import (
+    author_blocking_keys,
+    BlockingIndex,
+    phonetic_code,
+)
+
+import unittest
+
+
+class TestBlocking(unittest.TestCase):
+
+    def test_phonetic_code(self):
+        self.assertEqual(phonetic_code('rodrigues'), phonetic_code('rodriguez'))
+        self.assertEqual(phonetic_code('souza'), phonetic_code('sousa'))
+        self.assertEqual(phonetic_code('mello'), phonetic_code('melo'))
+        self.assertEqual(phonetic_code('correa'), phonetic_code('correia'))
+        self.assertEqual(phonetic_code('campos'), phonetic_code('canpos'))
+        self.assertEqual(phonetic_code('herrera'), phonetic_code('errera'))
+        self.assertNotEqual(phonetic_code('silva'), phonetic_code('souza'))
+
+    def test_phonetic_code_empty(self):
+        self.assertEqual(phonetic_code(''), '')
+        self.assertEqual(phonetic_code('h'), '')
+
+    def test_author_blocking_keys(self):
+        self.assertEqual(
+            author_blocking_keys('João da Silva', orcid='https://orcid.org/0000-0002-1694-233X'),
+            ('o:0000-0002-1694-233X', 'n:silva j', 'p:slb')
+        )
+
+    def test_author_blocking_keys_invalid_orcid(self):
+        self.assertEqual(author_blocking_keys('Silva, J.', orcid='0000-0002-1694-2331'), ('n:silva j', 'p:slb'))
+
+    def test_author_blocking_keys_surname_only(self):
+        self.assertEqual(author_blocking_keys('Silva'), ('n:silva', 'p:slb'))
+        self.assertEqual(author_blocking_keys(''), ())
+
+    def test_blocking_index_candidate_pairs(self):
+        index = BlockingIndex()
+        index.add(1, 'João Silva')
+        index.add(2, 'Silva, J.')
+        index.add(3, 'Maria Souza')
+        index.add(4, 'M. Sousa')
+        index.add(5, 'Pedro Alves', orcid='0000-0002-1694-233X')
+        index.add(6, 'P. A. Álvares', orcid='0000-0002-1694-233X')
+        index.add(7, 'Ana Costa')
+        self.assertEqual(sorted(index.candidate_pairs()), [(1, 2), (3, 4), (5, 6)])
+
+    def test_blocking_index_pairs_are_unique(self):
+        index = BlockingIndex()
+        index.add('a', 'João Silva', orcid='0000-0002-1694-233X')
+        index.add('b', 'Silva, João', orcid='0000-0002-1694-233X')
+        self.assertEqual(list(index.candidate_pairs()), [('a', 'b')])
+
+    def test_blocking_index_repeated_id_is_replaced(self):
+        index = BlockingIndex()
+        index.add(1, 'João Silva')
+        index.add(2, 'Silva, J.')
+        index.add(1, 'João Silva')
+        self.assertEqual(list(index.candidate_pairs()), [(2, 1)])
+        self.assertEqual(index.block('n:silva j'), [2, 1])
+        index.add(2, 'Maria Souza')
+        self.assertEqual(list(index.candidate_pairs()), [])
+        self.assertEqual(index.block('n:silva j'), [1])
+        self.assertEqual(len(index), 2)
+
+    def test_blocking_index_max_block_size(self):
+        index = BlockingIndex(max_block_size=2)
+        index.add(1, 'João Silva')
+        index.add(2, 'José Silva')
+        index.add(3, 'Joana Silva')
+        index.add(4, 'Maria Silva')
+        self.assertEqual(list(index.candidate_pairs()), [])
+        self.assertEqual(index.block('n:silva j'), [1, 2, 3])
+        self.assertEqual(len(index), 4)
@@ -0,0 +1,70 @@
+from scielo_scholarly_data.fingerprint import (
+    document_fingerprint,
+    fingerprint_key,
+    FingerprintTable,
+)
+
+import unittest
+
+
+class TestFingerprint(unittest.TestCase):
+
+    def test_fingerprint_key_doi(self):
+        self.assertEqual(fingerprint_key(doi='https://doi.org/10.1590/ABC.123', title='Title'), 'doi:10.1590/abc.123')
+
+    def test_fingerprint_key_fallback(self):
+        self.assertEqual(
+            fingerprint_key(doi='invalid', title='A Title.', year='March 2020', first_page='12-20', journal='Rev. Saúde (Online)'),
+            fingerprint_key(title='a title', year=2020, first_page='12', journal='REV SAUDE'),
+        )
+        self.assertIsNone(fingerprint_key(year=2020))
+
+    def test_document_fingerprint(self):
+        self.assertEqual(
+            document_fingerprint(doi='https://doi.org/10.1590/ABC'),
+            document_fingerprint(doi='10.1590/abc'),
+        )
+        self.assertNotEqual(
+            document_fingerprint(title='A title', year=2020),
+            document_fingerprint(title='A title', year=2021),
+        )
+        self.assertLess(document_fingerprint(title='A title'), 2 ** 64)
+        self.assertGreaterEqual(document_fingerprint(title='A title', digest_size=16), 0)
+        self.assertIsNone(document_fingerprint())
+
+    def test_fingerprint_table(self):
+        table = FingerprintTable(shard_bits=2, initial_capacity=2)
+        fingerprints = [document_fingerprint(title=f'Title {i % 300}') for i in range(1000)]
+        for record_id, fingerprint in enumerate(fingerprints):
+            self.assertEqual(table.add(fingerprint), record_id if record_id < 300 else record_id % 300)
+        self.assertEqual(table.add(None), 1000)
+        self.assertEqual(len(table), 1001)
+        self.assertEqual(table.distinct, 300)
+        self.assertEqual(table.get(fingerprints[5]), 5)
+        self.assertIsNone(table.get(document_fingerprint(title='Other')))
+
+        groups = sorted(table.duplicate_groups())
+        self.assertEqual(len(groups), 300)
+        self.assertEqual(groups[0], [0, 300, 600, 900])
+
+    def test_fingerprint_table_wide(self):
+        table = FingerprintTable(digest_size=16, initial_capacity=1)
+        low = 5
+        table.add(low)
+        table.add(low + (1 << 64))
+        table.add(low)
+        self.assertEqual(list(table.duplicate_groups()), [[0, 2]])
+        self.assertEqual(table.distinct, 2)
+
+    def test_fingerprint_table_invalid(self):
+        self.assertRaises(ValueError, FingerprintTable, digest_size=4)
+        self.assertRaises(ValueError, FingerprintTable, initial_capacity=3)
+        self.assertRaises(ValueError, FingerprintTable, max_load_factor=1.0)
+        self.assertRaises(ValueError, FingerprintTable, max_load_factor=0)
+
+    def test_fingerprint_table_full_load_factor(self):
+        table = FingerprintTable(shard_bits=0, initial_capacity=16, max_load_factor=0.99)
+        for fingerprint in range(64):
+            table.add(fingerprint)
+        self.assertEqual(table.distinct, 64)
+        self.assertEqual(table.get(63), 63)
@@ -0,0 +1,222 @@
+from scielo_scholarly_data import frequency_cache
+from scielo_scholarly_data.frequency_cache import (
+    CountMinSketch,
+    InvalidSnapshotFileError,
+    TinyLFUCache,
+    cache_report,
+    load_snapshot,
+    save_snapshot,
+    tinylfu_cache,
+)
+from scielo_scholarly_data.standardizer import journal_issn, journal_title_for_deduplication
+
+from functools import lru_cache
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+
+def _workload(rounds=20, hot=100, one_off=300):
+    # poucos valores frequentes intercalados com uma cauda longa de valores que aparecem uma única vez
+    keys = []
+    for round_number in range(rounds):
+        for position in range(hot):
+            keys.append(f'hot {position}')
+            keys.append(f'dirty {round_number} {position}')
+            keys.append(f'dirty {round_number} {position} {one_off}')
+    return keys
+
+
+def _issn_in_worker(values):
+    issn = frequency_cache.registered_caches()['tests.issn']
+    results = [issn(value, use_issn_validator=True) for value in values]
+    return results, issn.cache.hits, issn.cache.misses
+
+
+class TestCountMinSketch(unittest.TestCase):
+
+    def test_estimate_counts_accesses(self):
+        sketch = CountMinSketch(64)
+        for _ in range(5):
+            sketch.increment('0034-8910')
+        sketch.increment('1413-8123')
+        self.assertEqual(sketch.estimate('0034-8910'), 5)
+        self.assertEqual(sketch.estimate('1413-8123'), 1)
+        self.assertEqual(sketch.estimate('0102-311X'), 0)
+
+    def test_counters_saturate(self):
+        sketch = CountMinSketch(64)
+        for _ in range(100):
+            sketch.increment('hot')
+        self.assertEqual(sketch.estimate('hot'), frequency_cache.SKETCH_COUNTER_MAX)
+
+    def test_counters_are_halved_after_sample(self):
+        sketch = CountMinSketch(16, sample_size=10)
+        for _ in range(8):
+            sketch.increment('hot')
+        sketch.increment('a')
+        sketch.increment('b')
+        self.assertEqual(sketch.estimate('hot'), 4)
+        self.assertEqual(sketch.additions, 5)
+
+
+class TestTinyLFUCache(unittest.TestCase):
+
+    def test_rejects_less_frequent_candidates(self):
+        cache = TinyLFUCache(capacity=2)
+        for key in ('a', 'b', 'a', 'b'):
+            if cache.get(key) is None:
+                cache.put(key, key.upper())
+        self.assertIsNone(cache.get('c'))
+        self.assertFalse(cache.put('c', 'C'))
+        self.assertEqual((cache.get('a'), cache.get('b')), ('A', 'B'))
+        self.assertEqual(cache.rejected, 1)
+
+    def test_admits_more_frequent_candidates(self):
+        cache = TinyLFUCache(capacity=1)
+        cache.get('a')
+        cache.put('a', 'A')
+        for _ in range(3):
+            cache.get('b')
+        self.assertTrue(cache.put('b', 'B'))
+        self.assertNotIn('a', cache)
+
+    def test_scan_resistance(self):
+        keys = _workload()
+        capacity = 150
+
+        cache = TinyLFUCache(capacity)
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, key)
+
+        @lru_cache(maxsize=capacity)
+        def lru(key):
+            return key
+
+        for key in keys:
+            lru(key)
+        info = lru.cache_info()
+        self.assertGreater(cache.hit_ratio, 0.25)
+        self.assertLess(info.hits / (info.hits + info.misses), 0.05)
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            TinyLFUCache(0)
+
+
+class TestTinyLFUDecorator(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'caches.pickle')
+        self.issn = tinylfu_cache(capacity=100, name='tests.issn')(journal_issn)
+        self.title = tinylfu_cache(capacity=100, name='tests.title')(journal_title_for_deduplication)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_results_match_function(self):
+        for value in ['1387666x', '0034-8910', '0034-8910', 'invalid']:
+            self.assertEqual(
+                self.issn(value, use_issn_validator=True),
+                journal_issn(value, use_issn_validator=True),
+            )
+        self.assertEqual(self.issn.cache_info().hits, 1)
+        self.assertEqual(self.issn.cache_info().currsize, 3)
+        self.issn('1387666x')
+        self.assertEqual(self.issn.cache_info().currsize, 4)
+
+    def test_threads(self):
+        issn = tinylfu_cache(capacity=8, name='tests.threads')(journal_issn)
+        values = [f'{number:04d}-{number % 7:03d}X' for number in range(32)]
+        expected = {value: journal_issn(value) for value in values}
+        calls = 2000
+        errors = []
+
+        def work(offset):
+            try:
+                for position in range(calls):
+                    value = values[(offset + position * (offset + 1)) % len(values)]
+                    if issn(value) != expected[value]:
+                        errors.append(value)
+            except Exception as exc:
+                errors.append(exc)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+        info = issn.cache_info()
+        self.assertEqual(info.hits + info.misses, 8 * calls)
+        self.assertLessEqual(info.currsize, 8)
+        # entre a consulta e o armazenamento, outra thread pode ter armazenado a mesma chave
+        self.assertLessEqual(issn.cache.admitted + issn.cache.rejected, info.misses)
+
+    def test_unhashable_arguments_are_not_cached(self):
+        self.assertEqual(
+            self.title('Revista de Saúde', words_to_remove=['revista']),
+            journal_title_for_deduplication('Revista de Saúde', words_to_remove=['revista']),
+        )
+        self.assertEqual(len(self.title.cache), 0)
+
+    def test_report(self):
+        self.issn('0034-8910')
+        self.issn('0034-8910')
+        report = cache_report()['tests.issn']
+        self.assertEqual((report['hits'], report['misses'], report['size']), (1, 1, 1))
+        self.assertEqual(report['hit_ratio'], 0.5)
+
+    def test_snapshot_roundtrip(self):
+        for _ in range(3):
+            self.issn('1387666x', use_issn_validator=True)
+        self.title('Agrociencia &amp; (Uruguay)')
+        self.assertEqual(save_snapshot(self.path, ['tests.issn', 'tests.title']), 2)
+
+        self.issn.cache_clear()
+        self.title.cache_clear()
+        self.assertEqual(load_snapshot(self.path), 2)
+        self.assertEqual(self.issn('1387666x', use_issn_validator=True), '1387-666X')
+        self.assertEqual(self.issn.cache_info().hits, 1)
+        self.assertEqual(self.issn.cache.sketch.estimate(('1387666x', frequency_cache._KWARGS_MARK,
+                                                          ('use_issn_validator', True))), 4)
+
+    def test_snapshot_of_other_rules_version_is_ignored(self):
+        self.issn('0034-8910')
+        save_snapshot(self.path, ['tests.issn'], rules_version=0)
+        self.issn.cache_clear()
+        self.assertEqual(load_snapshot(self.path), 0)
+        self.assertEqual(len(self.issn.cache), 0)
+
+    def test_missing_and_invalid_snapshot(self):
+        self.assertEqual(load_snapshot(self.path), 0)
+        with open(self.path, 'wb') as fp:
+            fp.write(b'not a snapshot')
+        with self.assertRaises(InvalidSnapshotFileError):
+            load_snapshot(self.path)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), 'requer fork')
+    def test_snapshot_loaded_at_worker_startup(self):
+        values = ['1387666x', '0034-8910', '1413-8123']
+        for value in values:
+            self.issn(value, use_issn_validator=True)
+        save_snapshot(self.path, ['tests.issn'])
+        self.issn.cache_clear()
+
+        context = multiprocessing.get_context('fork')
+        with context.Pool(2, initializer=load_snapshot, initargs=(self.path,)) as pool:
+            for results, hits, misses in pool.map(_issn_in_worker, [values, values]):
+                self.assertEqual(results, ['1387-666X', '0034-8910', '1413-8123'])
+                self.assertEqual(misses, 0)
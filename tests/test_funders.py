@@ -0,0 +1,74 @@
+from scielo_scholarly_data.funders import (
+    build_funder_index,
+    FunderRegistry,
+    get_funder_registry,
+    read_funder_registry_csv,
+)
+
+import os
+import tempfile
+import unittest
+
+
+FUNDER_REGISTRY_CSV = '''501100003593;Conselho Nacional de Desenvolvimento Científico e Tecnológico;CNPq;National Council for Scientific and Technological Development
+501100001807;Fundação de Amparo à Pesquisa do Estado de São Paulo;FAPESP;São Paulo Research Foundation
+501100002322;Coordenação de Aperfeiçoamento de Pessoal de Nível Superior;CAPES
+100000002;National Institutes of Health;NIH
+100000865;Bill & Melinda Gates Foundation;Gates Foundation
+'''
+
+
+class TestFunders(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        csv_path = os.path.join(self.directory.name, 'funders.csv')
+        with open(csv_path, 'w', encoding='utf-8') as fp:
+            fp.write(FUNDER_REGISTRY_CSV)
+        self.path = os.path.join(self.directory.name, 'funders.bin')
+        build_funder_index(read_funder_registry_csv(csv_path), self.path)
+        self.registry = FunderRegistry(self.path)
+
+    def tearDown(self):
+        self.registry.close()
+        self.directory.cleanup()
+
+    def test_registry_loads_lazily(self):
+        self.assertIsNone(self.registry._index)
+        self.registry.resolve('CNPq')
+        self.assertIsNotNone(self.registry._index)
+
+    def test_resolve(self):
+        self.assertEqual(self.registry.resolve('cnpq'), ('501100003593', 'Conselho Nacional de Desenvolvimento Científico e Tecnológico'))
+        self.assertEqual(self.registry.resolve('Sao Paulo Research Foundation (FAPESP)')[0], '501100001807')
+        self.assertIsNone(self.registry.resolve('Wellcome Trust'))
+
+    def test_sponsor_ids(self):
+        self.assertEqual(
+            self.registry.sponsor_ids('CNPq; Fundação de Amparo à Pesquisa do Estado de São Paulo'),
+            ['501100003593', '501100001807'],
+        )
+        self.assertEqual(
+            self.registry.sponsor_ids('Supported by CAPES (grant 001) and FAPESP/CNPq and CAPES'),
+            ['501100002322', '501100001807', '501100003593'],
+        )
+        self.assertEqual(self.registry.sponsor_ids('National Institutes of Health & Unknown Foundation'), ['100000002'])
+        self.assertEqual(self.registry.sponsor_ids(''), [])
+
+    def test_sponsor_ids_names_with_conjunctions(self):
+        cnpq, gates, fapesp = '501100003593', '100000865', '501100001807'
+        self.assertEqual(self.registry.sponsor_ids('Conselho Nacional de Desenvolvimento Científico e Tecnológico'), [cnpq])
+        self.assertEqual(self.registry.sponsor_ids('National Council for Scientific and Technological Development'), [cnpq])
+        self.assertEqual(self.registry.sponsor_ids('Bill & Melinda Gates Foundation'), [gates])
+        self.assertEqual(
+            self.registry.sponsor_ids('Bill & Melinda Gates Foundation and Conselho Nacional de Desenvolvimento Científico e Tecnológico'),
+            [gates, cnpq],
+        )
+        self.assertEqual(
+            self.registry.sponsor_ids('FAPESP e Conselho Nacional de Desenvolvimento Científico e Tecnológico; Bill & Melinda Gates Foundation'),
+            [fapesp, cnpq, gates],
+        )
+
+    def test_get_funder_registry(self):
+        self.assertIs(get_funder_registry(self.path), get_funder_registry(self.path))
+        get_funder_registry(self.path).close()
@@ -1,6 +1,7 @@
 import unittest
 
-from scielo_scholarly_data.helpers import is_valid_issn
+from scielo_scholarly_data.core import check_sum_orcid
+from scielo_scholarly_data.helpers import is_valid_issn, orcid_check_digit
 
 
 class TestHelpers(unittest.TestCase):
@@ -28,4 +29,10 @@ class TestHelpers(unittest.TestCase):
         expected_values = list(issns.values())
         obtained_values = [is_valid_issn(i) for i in issns]
 
-        self.assertListEqual(expected_values, obtained_values)
\ No newline at end of file
+        self.assertListEqual(expected_values, obtained_values)
+
+    def test_orcid_check_digit(self):
+        self.assertEqual(orcid_check_digit('000000021825009'), '7')
+        self.assertEqual(orcid_check_digit('000000021694233'), 'X')
+        for digits in ('000000021825009', '000000021694233', '123456789012345'):
+            self.assertTrue(check_sum_orcid(digits + orcid_check_digit(digits)))
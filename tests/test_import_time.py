@@ -0,0 +1,75 @@
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+from scielo_scholarly_data import values
+
+
+LAZY_MODULES = ('stdnum', 'roman', 'html', 'urllib.parse', 'datetime', 'argparse')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_heavy_modules_are_not_imported(self):
+        loaded = _run(
+            'import sys, scielo_scholarly_data.standardizer;'
+            f'print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules))'
+        )
+        self.assertEqual(loaded, '')
+
+    def test_heavy_modules_are_imported_on_first_use(self):
+        loaded = _run(
+            'import sys;'
+            'from scielo_scholarly_data import core, standardizer;'
+            'core.roman_to_int("XIV"); standardizer.orcid_validator("0000-0002-1825-0097");'
+            'standardizer.document_publication_date("2021-03-15"); core.unescape("&amp;");'
+            'print(",".join(m for m in ("roman", "urllib.parse", "datetime", "html") if m in sys.modules))'
+        )
+        self.assertEqual(loaded, 'roman,urllib.parse,datetime,html')
+
+    def test_synthetic_imports_roman_on_first_use(self):
+        loaded = _run(
+            'import sys; from scielo_scholarly_data import synthetic; before = "roman" in sys.modules;'
+            'list(synthetic.generate_citations(200, seed=1)); print(before, "roman" in sys.modules)'
+        )
+        self.assertEqual(loaded, 'False True')
+
+    def test_patterns_are_not_compiled_on_import(self):
+        compiled = _run(
+            'from scielo_scholarly_data import authors, blocking, fingerprint, funders, sorted_neighborhood, '
+            'standardizer, values;'
+            'print(",".join(n for n, v in vars(values).items() '
+            'if isinstance(v, values._LazyPattern) and v._compiled is not None))'
+        )
+        self.assertEqual(compiled, '')
+
+
+class TestLazyPattern(unittest.TestCase):
+
+    def test_methods(self):
+        pattern = values._LazyPattern(r'(?<![0-9])(1[5-9][0-9]{2}|20[0-9]{2})(?![0-9])')
+        self.assertIsNone(pattern._compiled)
+        self.assertEqual(pattern.findall('de 1999 a 2021'), ['1999', '2021'])
+        self.assertEqual(pattern.pattern, r'(?<![0-9])(1[5-9][0-9]{2}|20[0-9]{2})(?![0-9])')
+        self.assertIs(pattern.compile(), pattern.compile())
+
+    def test_public_names_keep_their_types(self):
+        self.assertIsInstance(values.PATTERN_ISSN_CANONICAL, re.Pattern)
+        self.assertIsNotNone(values.PATTERN_ISSN_CANONICAL.match('1387-666X'))
+        self.assertIsNotNone(re.match(values.PATTERN_ISSN_CANONICAL, '1387-666X'))
+        self.assertIsNone(values.PATTERN_ISSN_CANONICAL.match('1387666X'))
+        self.assertIsInstance(values.PATTERN_YEAR, re.Pattern)
+        self.assertIs(values.PATTERN_YEAR, values._PATTERN_YEAR.compile())
+        self.assertIsInstance(values.PATTERN_ORCID, str)
+        self.assertIsNotNone(re.search(values.PATTERN_ORCID, '0000-0002-1825-0097'))
+        self.assertIsInstance(values.PATTERN_PAGE_RANGE, str)
+        self.assertTrue(all(isinstance(p, re.Pattern) for p in values.PATTERNS_DOI))
@@ -0,0 +1,162 @@
+from scielo_scholarly_data.incremental import (
+    MANIFEST_FILENAME,
+    IncrementalStandardizer,
+    InvalidManifestFileError,
+    load_manifest,
+    record_hash,
+    write_manifest,
+)
+from scielo_scholarly_data.standardizer import document_doi, journal_issn
+
+from array import array
+
+import os
+import tempfile
+import unittest
+
+
+def _standardize(record):
+    return {'doi': document_doi(record['doi']), 'issn': journal_issn(record['issn'])}
+
+
+RECORDS = [
+    {'doi': 'https://doi.org/10.1590/S0034-89102009000200001', 'issn': '0034-8910'},
+    {'doi': '10.1590/s1413-81232011000300002', 'issn': '1413-8123'},
+    {'doi': 'doi: 10.1590/0102-311X00109417', 'issn': '0102311x'},
+]
+
+
+class TestRecordHash(unittest.TestCase):
+
+    def test_hash_ignores_key_order(self):
+        self.assertEqual(record_hash({'a': 1, 'b': 2}), record_hash({'b': 2, 'a': 1}))
+
+    def test_hash_depends_on_content_and_rules_version(self):
+        self.assertNotEqual(record_hash({'a': 1}), record_hash({'a': 2}))
+        self.assertNotEqual(record_hash({'a': 1}, rules_version=1), record_hash({'a': 1}, rules_version=2))
+
+
+class TestManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, MANIFEST_FILENAME)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_manifest_is_sorted_and_fixed_width(self):
+        write_manifest(self.path, array('Q', [30, 10, 20]), array('Q', [0, 5, 9]), rules_version=4)
+        self.assertEqual(os.path.getsize(self.path), 8 + 3 * 8 + 3 * 16)
+        with load_manifest(self.path) as manifest:
+            self.assertEqual(len(manifest), 3)
+            self.assertEqual(manifest.rules_version, 4)
+            self.assertEqual([manifest.offset(value) for value in (10, 20, 30, 40)], [5, 9, 0, None])
+            self.assertIn(20, manifest)
+
+    def test_invalid_manifest(self):
+        with open(self.path, 'wb') as fp:
+            fp.write(b'not a manifest file at all, really not')
+        with self.assertRaises(InvalidManifestFileError):
+            load_manifest(self.path)
+
+    def test_truncated_manifest(self):
+        write_manifest(self.path, array('Q', [1, 2]), array('Q', [0, 1]))
+        with open(self.path, 'r+b') as fp:
+            fp.truncate(os.path.getsize(self.path) - 8)
+        with self.assertRaises(InvalidManifestFileError):
+            load_manifest(self.path)
+
+
+class TestIncrementalStandardizer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.first = os.path.join(self.directory.name, 'first')
+        self.second = os.path.join(self.directory.name, 'second')
+        self.calls = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def standardize(self, record):
+        self.calls.append(record)
+        return _standardize(record)
+
+    def test_first_run_standardizes_everything(self):
+        incremental = IncrementalStandardizer(self.standardize)
+        results = list(incremental.run(RECORDS, self.first))
+        self.assertEqual([output for output, _ in results], [_standardize(record) for record in RECORDS])
+        self.assertTrue(all(changed for _, changed in results))
+        self.assertEqual((incremental.standardized, incremental.carried_forward), (3, 0))
+        with load_manifest(os.path.join(self.first, MANIFEST_FILENAME)) as manifest:
+            self.assertEqual(len(manifest), 3)
+
+    def test_only_changed_records_are_standardized(self):
+        list(IncrementalStandardizer(self.standardize).run(RECORDS, self.first))
+        self.calls = []
+        changed_record = {'doi': '10.1590/S1516-35982007000100001', 'issn': '1516-3598'}
+        records = [RECORDS[2], changed_record, RECORDS[0]]
+
+        incremental = IncrementalStandardizer(self.standardize, previous=self.first)
+        results = list(incremental.run(records, self.second))
+
+        self.assertEqual(self.calls, [changed_record])
+        self.assertEqual([output for output, _ in results], [_standardize(record) for record in records])
+        self.assertEqual([changed for _, changed in results], [False, True, False])
+        self.assertEqual((incremental.standardized, incremental.carried_forward), (1, 2))
+
+    def test_rules_version_change_reprocesses_everything(self):
+        list(IncrementalStandardizer(self.standardize, rules_version=1).run(RECORDS, self.first))
+        self.calls = []
+        incremental = IncrementalStandardizer(self.standardize, previous=self.first, rules_version=2)
+        list(incremental.run(RECORDS, self.second))
+        self.assertEqual(self.calls, RECORDS)
+        self.assertEqual(incremental.carried_forward, 0)
+
+    def test_duplicated_records_share_one_output_line(self):
+        incremental = IncrementalStandardizer(self.standardize)
+        results = list(incremental.run(RECORDS + RECORDS[:1], self.first))
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[3], results[0])
+        self.assertEqual(self.calls, RECORDS)
+        self.assertEqual((incremental.standardized, incremental.carried_forward, incremental.repeated), (3, 0, 1))
+        with load_manifest(os.path.join(self.first, MANIFEST_FILENAME)) as manifest:
+            self.assertEqual(len(manifest), 3)
+
+        self.calls = []
+        incremental = IncrementalStandardizer(self.standardize, previous=self.first)
+        results = list(incremental.run(RECORDS[:1] * 3, self.second))
+        self.assertEqual(self.calls, [])
+        self.assertEqual(results, [(_standardize(RECORDS[0]), False)] * 3)
+        self.assertEqual((incremental.standardized, incremental.carried_forward, incremental.repeated), (0, 1, 2))
+
+    def test_outputs_have_the_same_type_when_carried_forward(self):
+        def standardize(record):
+            return (record['doi'], 1)
+
+        first = list(IncrementalStandardizer(standardize).run(RECORDS, self.first))
+        second = list(IncrementalStandardizer(standardize, previous=self.first).run(RECORDS, self.second))
+        self.assertEqual([output for output, _ in first], [[record['doi'], 1] for record in RECORDS])
+        self.assertEqual([output for output, _ in first], [output for output, _ in second])
+
+    def test_chained_runs_carry_outputs_forward(self):
+        list(IncrementalStandardizer(self.standardize).run(RECORDS, self.first))
+        list(IncrementalStandardizer(self.standardize, previous=self.first).run(RECORDS, self.second))
+        third = os.path.join(self.directory.name, 'third')
+        self.calls = []
+        incremental = IncrementalStandardizer(self.standardize, previous=self.second)
+        results = list(incremental.run(RECORDS, third))
+        self.assertEqual(self.calls, [])
+        self.assertEqual([output for output, _ in results], [_standardize(record) for record in RECORDS])
+
+    def test_interrupted_run_does_not_publish_manifest(self):
+        run = IncrementalStandardizer(self.standardize).run(RECORDS, self.first)
+        next(run)
+        run.close()
+        self.assertFalse(os.path.exists(os.path.join(self.first, MANIFEST_FILENAME)))
+
+    def test_missing_previous_run(self):
+        incremental = IncrementalStandardizer(self.standardize, previous=os.path.join(self.directory.name, 'none'))
+        list(incremental.run(RECORDS, self.first))
+        self.assertEqual(incremental.standardized, 3)
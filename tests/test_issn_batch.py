@@ -0,0 +1,50 @@
+from scielo_scholarly_data.standardizer import journal_issn
+
+import random
+import unittest
+
+try:
+    import numpy
+    from scielo_scholarly_data.issn_batch import (
+        issn_batch,
+        journal_issn_batch,
+    )
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy não está instalado')
+class TestISSNBatch(unittest.TestCase):
+
+    def test_issn_batch(self):
+        formatted, valid = issn_batch(
+            ['1387666x', '2090-4241', '2090-424X', '0034-8910', '', 'invalid'], use_issn_validator=True,
+        )
+        self.assertEqual(formatted.tolist(), [b'1387-666X', b'', b'2090-424X', b'0034-8910', b'', b''])
+        self.assertEqual(valid.tolist(), [True, False, True, True, False, False])
+
+    def test_issn_batch_bytes(self):
+        formatted, valid = issn_batch(numpy.array([b'1387666X', b'0034-8910'], dtype='S9'))
+        self.assertEqual(formatted.tolist(), [b'1387-666X', b'0034-8910'])
+        self.assertEqual(issn_batch([])[0].tolist(), [])
+
+    def test_journal_issn_batch(self):
+        self.assertEqual(journal_issn_batch(['1387666x', '2090-4241'], use_issn_validator=True), ['1387-666X', None])
+        self.assertEqual(journal_issn_batch(['2090-4241'], use_issn_validator=False), ['2090-4241'])
+
+    def test_default_matches_journal_issn(self):
+        issns = ['1387666x', '2090-4241', 'invalid']
+        self.assertEqual(journal_issn_batch(issns), [journal_issn(i) for i in issns])
+        self.assertEqual(journal_issn_batch(issns), ['1387-666X', '2090-4241', None])
+        self.assertEqual(issn_batch(['2090-4241'])[1].tolist(), [True])
+
+    def test_journal_issn_batch_matches_journal_issn(self):
+        rng = random.Random(1)
+        issns = [''.join(rng.choice('0123456789xX-ã') for _ in range(rng.randint(7, 10))) for _ in range(5000)]
+        issns += [f'{rng.randrange(10 ** 7):07d}{rng.choice("0123456789X")}' for _ in range(5000)]
+        issns += ['1387-666X\n', '1387666x\n', '1387-666x\n', '0034-8910\n']
+        for use_issn_validator in (True, False):
+            self.assertEqual(
+                journal_issn_batch(issns, use_issn_validator),
+                [journal_issn(i, use_issn_validator) for i in issns],
+            )
@@ -0,0 +1,80 @@
+from scielo_scholarly_data.issn_index import (
+    build_issn_index,
+    InvalidISSNIndexFileError,
+    ISSNIndex,
+    load_issn_index,
+    read_issn_l_table,
+    read_journal_list_csv,
+)
+
+import os
+import tempfile
+import unittest
+
+
+ISSN_L_TABLE = '''ISSN\tISSN-L
+0102-311X\t0102-311X
+1678-4464\t0102-311X
+0034-8910\t0034-8910
+1518-8787\t0034-8910
+1234-5679\t1234-5679
+'''
+
+JOURNAL_LIST_CSV = '''Cadernos de Saúde Pública;1678-4464;0102-311X
+Revista de Saúde Pública;0034-8910
+Ciência & Saúde Coletiva;1413-8123;1678-4561
+Cad. Saúde Pública;0102311x
+'''
+
+
+class TestISSNIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        issn_l_path = os.path.join(self.directory.name, 'issn_l.txt')
+        journals_path = os.path.join(self.directory.name, 'journals.csv')
+        with open(issn_l_path, 'w', encoding='utf-8') as fp:
+            fp.write(ISSN_L_TABLE)
+        with open(journals_path, 'w', encoding='utf-8') as fp:
+            fp.write(JOURNAL_LIST_CSV)
+        self.path = os.path.join(self.directory.name, 'issn.bin')
+        self.size = build_issn_index(read_issn_l_table(issn_l_path), read_journal_list_csv(journals_path), self.path)
+        self.index = load_issn_index(self.path)
+
+    def tearDown(self):
+        self.index.close()
+        self.directory.cleanup()
+
+    def test_build_issn_index(self):
+        self.assertEqual(self.size, 7)
+        self.assertEqual(len(self.index), 7)
+
+    def test_issn_l(self):
+        self.assertEqual(self.index.issn_l('1678-4464'), '0102-311X')
+        self.assertEqual(self.index.issn_l('0102311x'), '0102-311X')
+        self.assertEqual(self.index.issn_l('1518-8787'), '0034-8910')
+        self.assertEqual(self.index.issn_l('1678-4561'), '1413-8123')
+        self.assertIsNone(self.index.issn_l('1678-4465'))
+        self.assertIsNone(self.index.issn_l('2090-424X'))
+        self.assertIsNone(self.index.issn_l(''))
+
+    def test_title(self):
+        self.assertEqual(self.index.title('0102-311X'), 'Cadernos de Saúde Pública')
+        self.assertEqual(self.index.title('1518-8787'), 'Revista de Saúde Pública')
+        self.assertIsNone(self.index.title('1234-5679'))
+
+    def test_lookup(self):
+        self.assertEqual(self.index.lookup('1678-4561'), ('1413-8123', 'Ciência & Saúde Coletiva'))
+        self.assertEqual(self.index.lookup('1234-5679'), ('1234-5679', None))
+        self.assertIsNone(self.index.lookup('2090-424X'))
+
+    def test_issn_index_from_bytes(self):
+        with open(self.path, 'rb') as fp:
+            with ISSNIndex(fp.read()) as index:
+                self.assertEqual(index.issn_l('1678-4464'), '0102-311X')
+
+    def test_load_issn_index_invalid_file(self):
+        path = os.path.join(self.directory.name, 'invalid.bin')
+        with open(path, 'wb') as fp:
+            fp.write(b'not an issn index')
+        self.assertRaises(InvalidISSNIndexFileError, load_issn_index, path)
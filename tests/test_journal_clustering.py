@@ -0,0 +1,58 @@
+from scielo_scholarly_data.journal_clustering import (
+    journal_title_similarity,
+    journal_title_tokens,
+    JournalTitleClusterer,
+)
+
+import unittest
+
+
+class TestJournalClustering(unittest.TestCase):
+
+    def test_journal_title_tokens(self):
+        self.assertEqual(journal_title_tokens('Revista de Saúde Pública (Online)'), ('revista', 'saude', 'publica'))
+        self.assertEqual(journal_title_tokens('Rev. Saude Publ.'), ('rev', 'saude', 'publ'))
+
+    def test_journal_title_similarity(self):
+        self.assertEqual(journal_title_similarity(('rev', 'saude', 'publ'), ('revista', 'saude', 'publica')), 1.0)
+        self.assertAlmostEqual(journal_title_similarity(('cad', 'saude', 'publica'), ('revista', 'saude', 'publica')), 2 / 3)
+        self.assertEqual(journal_title_similarity(('re', 'saude'), ('revista', 'saude')), 0.5)
+        self.assertEqual(journal_title_similarity((), ('revista',)), 0.0)
+
+    def test_journal_title_clusterer(self):
+        clusterer = JournalTitleClusterer()
+        titles = [
+            'Rev. Saude Publica',
+            'Revista de Saúde Pública (Online)',
+            'Rev Saude Publ',
+            'Cadernos de Saúde Pública',
+            'Cad. Saúde Pública',
+            'Ciência Rural',
+        ]
+        for title in titles:
+            clusterer.add(title)
+        self.assertEqual(list(clusterer.assignments()), [0, 0, 0, 1, 1, 2])
+        self.assertEqual(len(clusterer), 6)
+
+    def test_journal_title_clusterer_issn_link(self):
+        clusterer = JournalTitleClusterer()
+        first = clusterer.add('Revista de Saúde Pública', issn='0034-8910')
+        second = clusterer.add('RSP', issn='00348910')
+        third = clusterer.add('RSP')
+        fourth = clusterer.add('Agrociencia', issn='invalid')
+        self.assertEqual(clusterer.cluster(first), clusterer.cluster(second))
+        self.assertEqual(clusterer.cluster(first), clusterer.cluster(third))
+        self.assertNotEqual(clusterer.cluster(first), clusterer.cluster(fourth))
+
+    def test_journal_title_clusterer_empty_titles_are_not_grouped(self):
+        clusterer = JournalTitleClusterer()
+        clusterer.add('(Online)')
+        clusterer.add('(Print)')
+        self.assertEqual(list(clusterer.assignments()), [0, 1])
+
+    def test_journal_title_clusterer_max_posting_size(self):
+        clusterer = JournalTitleClusterer(max_posting_size=2)
+        for title in ['Revista Alfa', 'Revista Beta', 'Revista Gama', 'Revista Delta', 'Rev Delta']:
+            clusterer.add(title)
+        self.assertEqual(list(clusterer.assignments()), [0, 1, 2, 3, 3])
+        self.assertIn('rev', clusterer._stop_grams)
@@ -0,0 +1,101 @@
+from scielo_scholarly_data.journal_clustering import JournalTitleClusterer
+from scielo_scholarly_data.ltwa import (
+    compile_ltwa,
+    InvalidLTWAFileError,
+    journal_title_abbreviation_key,
+    load_ltwa,
+    LTWA_FORMAT_VERSION,
+    LTWA_PICKLE_PROTOCOL,
+)
+
+import os
+import pickle
+import tempfile
+import unittest
+
+
+LTWA_CSV = '''WORDS;ABBREVIATIONS;LANGUAGES
+revista;rev.;por, spa
+review;rev.;eng
+public-;publ.;eng, fre, por
+saúde;n.a.;por
+brasil-;bras.;por
+medic-;med.;eng, por
+medicina;med.;por
+-ology;-ol.;eng
+journal;j.;eng
+united states;u. s.;eng
+'''
+
+
+class TestLTWA(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, 'ltwa.csv')
+        with open(path, 'w', encoding='utf-8') as fp:
+            fp.write(LTWA_CSV)
+        self.ltwa = compile_ltwa(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_compile_ltwa(self):
+        self.assertEqual(self.ltwa.words['revista'], 'rev')
+        self.assertEqual(self.ltwa.words['saude'], 'saude')
+        self.assertEqual(self.ltwa.stems['public'], 'publ')
+        self.assertEqual(self.ltwa.suffixes['ology'], 'ol')
+        self.assertEqual(len(self.ltwa), 9)
+
+    def test_abbreviate_word(self):
+        self.assertEqual(self.ltwa.abbreviate_word('revista'), 'rev')
+        self.assertEqual(self.ltwa.abbreviate_word('publica'), 'publ')
+        self.assertEqual(self.ltwa.abbreviate_word('publication'), 'publ')
+        self.assertEqual(self.ltwa.abbreviate_word('medicina'), 'med')
+        self.assertEqual(self.ltwa.abbreviate_word('brasileira'), 'bras')
+        self.assertEqual(self.ltwa.abbreviate_word('biology'), 'biol')
+        self.assertEqual(self.ltwa.abbreviate_word('agrociencia'), 'agrociencia')
+
+    def test_journal_title_abbreviation_key(self):
+        expected = 'rev saude publ'
+        for title in ['Revista de Saúde Pública', 'Rev. Saúde Públ.', 'Rev Saude Publica (Online)']:
+            self.assertEqual(journal_title_abbreviation_key(title, self.ltwa), expected)
+        self.assertEqual(
+            journal_title_abbreviation_key('Revista Brasileira de Medicina', self.ltwa),
+            journal_title_abbreviation_key('Rev. Bras. Med.', self.ltwa),
+        )
+
+    def test_save_and_load_ltwa(self):
+        path = os.path.join(self.directory.name, 'ltwa.bin')
+        self.ltwa.save(path)
+        loaded = load_ltwa(path)
+        self.assertEqual(loaded.words, self.ltwa.words)
+        self.assertEqual(loaded.stems, self.ltwa.stems)
+        self.assertEqual(loaded.abbreviate_word('publicacao'), 'publ')
+
+    def test_saved_ltwa_uses_fixed_pickle_protocol(self):
+        path = os.path.join(self.directory.name, 'ltwa.bin')
+        self.ltwa.save(path)
+        with open(path, 'rb') as fp:
+            data = fp.read()
+        self.assertEqual(data[:2], bytes([0x80, LTWA_PICKLE_PROTOCOL]))
+        self.assertEqual(pickle.loads(data)[0], LTWA_FORMAT_VERSION)
+
+    def test_load_ltwa_unsupported_version(self):
+        path = os.path.join(self.directory.name, 'ltwa.bin')
+        with open(path, 'wb') as fp:
+            pickle.dump((LTWA_FORMAT_VERSION - 1, {}, {}, {}), fp, protocol=LTWA_PICKLE_PROTOCOL)
+        self.assertRaises(InvalidLTWAFileError, load_ltwa, path)
+
+    def test_load_ltwa_invalid_file(self):
+        path = os.path.join(self.directory.name, 'ltwa.bin')
+        with open(path, 'wb') as fp:
+            fp.write(b'not a ltwa')
+        self.assertRaises(InvalidLTWAFileError, load_ltwa, path)
+
+    def test_journal_title_clusterer_with_ltwa(self):
+        clusterer = JournalTitleClusterer(ltwa=self.ltwa)
+        clusterer.add('Revista Brasileira de Medicina')
+        clusterer.add('Rev. Bras. Med.')
+        clusterer.add('Journal of Medicine')
+        self.assertEqual(list(clusterer.assignments()), [0, 0, 1])
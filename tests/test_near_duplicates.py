@@ -0,0 +1,73 @@
+from scielo_scholarly_data.near_duplicates import (
+    NearDuplicateDetector,
+    word_shingles,
+)
+
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+TITLE = 'Innovación tecnológica en la resolución de problemáticas ambientales en Brasil'
+
+
+@unittest.skipIf(numpy is None, 'numpy não está instalado')
+class TestNearDuplicates(unittest.TestCase):
+
+    def test_word_shingles(self):
+        self.assertEqual(word_shingles('a b c'), {'a b', 'b c'})
+        self.assertEqual(word_shingles('a'), {'a'})
+        self.assertEqual(word_shingles(''), set())
+
+    def test_signatures_are_deterministic(self):
+        first = NearDuplicateDetector(batch_size=2)
+        second = NearDuplicateDetector(batch_size=100)
+        for detector in (first, second):
+            detector.add(TITLE)
+            detector.add('Another title')
+            detector.add('')
+        self.assertTrue((first.signatures() == second.signatures()).all())
+        self.assertEqual(first.signatures().shape, (3, 64))
+
+    def test_duplicate_pairs(self):
+        detector = NearDuplicateDetector()
+        detector.add(TITLE, year='2020')
+        detector.add(TITLE.upper() + '.', year=2020)
+        detector.add('A completely different title about something else entirely', year=2020)
+        detector.add('')
+        detector.add('')
+        self.assertEqual(list(detector.duplicate_pairs()), [(0, 1, 1.0)])
+
+    def test_duplicate_pairs_differ_by_one_word(self):
+        detector = NearDuplicateDetector(num_perm=128, bands=32, threshold=0.6)
+        detector.add('Avaliação da qualidade da água em reservatórios do semiárido brasileiro durante a seca')
+        detector.add('Avaliação da qualidade da água em reservatórios do semiárido brasileiro durante seca')
+        pairs = list(detector.duplicate_pairs())
+        self.assertEqual([(a, b) for a, b, _ in pairs], [(0, 1)])
+
+    def test_duplicate_pairs_metadata(self):
+        detector = NearDuplicateDetector()
+        detector.add(TITLE, year=2020, first_page='10')
+        detector.add(TITLE, year=2019, first_page='10')
+        detector.add(TITLE, year=2020, first_page='12-20')
+        detector.add(TITLE, doi='https://doi.org/10.1590/ABC')
+        detector.add(TITLE, doi='10.1590/abc')
+        detector.add(TITLE, doi='10.1590/xyz')
+        pairs = {(a, b) for a, b, _ in detector.duplicate_pairs()}
+        self.assertNotIn((0, 1), pairs)
+        self.assertNotIn((0, 2), pairs)
+        self.assertIn((3, 4), pairs)
+        self.assertNotIn((3, 5), pairs)
+        self.assertIn((0, 3), pairs)
+
+    def test_candidate_pairs_are_unique(self):
+        detector = NearDuplicateDetector()
+        for _ in range(3):
+            detector.add(TITLE)
+        self.assertEqual(list(detector.candidate_pairs()), [(0, 1), (0, 2), (1, 2)])
+
+    def test_invalid_bands(self):
+        self.assertRaises(ValueError, NearDuplicateDetector, num_perm=64, bands=10)
@@ -0,0 +1,158 @@
+from scielo_scholarly_data import outcomes
+from scielo_scholarly_data.normalization_cache import NormalizationCache, namespace_key
+from scielo_scholarly_data.standardizer import (
+    document_doi,
+    document_first_page,
+    issue_volume,
+    journal_issn,
+    journal_title_for_deduplication,
+)
+
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import unittest
+
+
+def _standardize_in_worker(arguments):
+    path, values = arguments
+    cache = NormalizationCache(path, readonly=True)
+    results = cache.standardize_many(journal_issn, values, use_issn_validator=True)
+    return results, cache.hits, cache.misses
+
+
+class TestNamespaceKey(unittest.TestCase):
+
+    def test_key_includes_function_options_and_version(self):
+        self.assertEqual(
+            namespace_key(document_doi, {'return_mode': 'path'}, rules_version=3),
+            'scielo_scholarly_data.standardizer.document_doi{"return_mode": "path"}@3',
+        )
+        self.assertNotEqual(namespace_key(document_doi, {}), namespace_key(document_doi, {'return_mode': 'path'}))
+        self.assertNotEqual(namespace_key(document_doi, {}, 1), namespace_key(document_doi, {}, 2))
+
+    def test_set_options_are_ordered(self):
+        self.assertEqual(
+            namespace_key(document_first_page, {'keep_chars': {'-', '_', ':'}}),
+            namespace_key(document_first_page, {'keep_chars': frozenset([':', '_', '-'])}),
+        )
+
+
+class TestNormalizationCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_standardize_many(self):
+        values = ['Agrociencia &amp;   (Uruguay)', 'Revista de Saúde Pública', 'Agrociencia &amp;   (Uruguay)']
+        expected = [journal_title_for_deduplication(v) for v in values]
+        with NormalizationCache(self.path) as cache:
+            self.assertEqual(cache.standardize_many(journal_title_for_deduplication, values), expected)
+            self.assertEqual((cache.hits, cache.misses), (0, 2))
+            self.assertEqual(len(cache), 2)
+
+        calls = []
+
+        def counted(text):
+            calls.append(text)
+            return journal_title_for_deduplication(text)
+        counted.__module__, counted.__qualname__ = journal_title_for_deduplication.__module__, 'journal_title_for_deduplication'
+
+        with NormalizationCache(self.path) as cache:
+            self.assertEqual(cache.standardize_many(counted, values + ['Ciência & Saúde Coletiva']),
+                             expected + [journal_title_for_deduplication('Ciência & Saúde Coletiva')])
+            self.assertEqual(calls, ['Ciência & Saúde Coletiva'])
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_options_are_part_of_the_key(self):
+        with NormalizationCache(self.path) as cache:
+            self.assertEqual(cache.standardize_many(document_doi, ['https://doi.org/10.1590/abc'], return_mode='path'),
+                             ['10.1590/abc'])
+            self.assertEqual(cache.standardize_many(document_doi, ['https://doi.org/10.1590/abc']),
+                             ['http://doi.org/10.1590/abc'])
+            self.assertEqual(cache.standardize_many(document_doi, ['sem doi']), [{'error': 'invalid doi'}])
+            self.assertEqual(cache.get_many(document_doi, ['sem doi']), {'sem doi': ({'error': 'invalid doi'}, None)})
+
+    def test_exceptions_are_cached(self):
+        with NormalizationCache(self.path) as cache:
+            self.assertEqual(cache.standardize_many(issue_volume, ['v. 12', 'abc'], default='?'), ['12', '?'])
+            self.assertEqual(cache.get_many(issue_volume, ['abc']), {'abc': (None, 'ImpossibleConvertionToIntError')})
+            self.assertEqual(cache.standardize_many(issue_volume, ['abc']), [None])
+            self.assertEqual(cache.hits, 1)
+
+    def test_outcomes_are_counted_for_cache_hits(self):
+        values = ['10.1590/abc', 'sem doi', 'sem doi', '10.1590/abc', '10.1590/abc']
+        with NormalizationCache(self.path) as cache:
+            outcomes.reset()
+            cache.standardize_many(document_doi, values)
+            expected = {'standardizer.document_doi': {'ok': 3, 'invalid doi': 2}}
+            self.assertEqual(outcomes.snapshot(), expected)
+            outcomes.reset()
+            cache.standardize_many(document_doi, values)
+            self.assertEqual(outcomes.snapshot(), expected)
+            self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+            outcomes.reset()
+            self.assertEqual(cache.standardize_many(issue_volume, ['abc', 'abc'], default='?'), ['?', '?'])
+            self.assertEqual(cache.standardize_many(issue_volume, ['abc'], default='?'), ['?'])
+            self.assertEqual(outcomes.snapshot(), {'standardizer.issue_volume': {'ImpossibleConvertionToIntError': 3}})
+
+    def test_file_created_without_outcomes_column(self):
+        connection = sqlite3.connect(self.path)
+        with connection:
+            connection.execute('CREATE TABLE namespaces (id INTEGER PRIMARY KEY, key TEXT UNIQUE NOT NULL, '
+                               'rules_version INTEGER NOT NULL)')
+            connection.execute('CREATE TABLE entries (namespace INTEGER NOT NULL, raw TEXT NOT NULL, value TEXT, '
+                               'error TEXT, PRIMARY KEY (namespace, raw)) WITHOUT ROWID')
+        connection.close()
+        with NormalizationCache(self.path, readonly=True) as cache:
+            self.assertEqual(cache.standardize_many(journal_issn, ['1387666x']), ['1387-666X'])
+        with NormalizationCache(self.path) as cache:
+            cache.standardize_many(journal_issn, ['1387666x'])
+            self.assertEqual(cache.standardize_many(journal_issn, ['1387666x']), ['1387-666X'])
+            self.assertEqual(cache.hits, 1)
+
+    def test_readonly_path_with_uri_characters(self):
+        path = os.path.join(self.directory.name, 'cache?mode=rwc#1 %20.sqlite')
+        with NormalizationCache(path) as cache:
+            cache.standardize_many(journal_issn, ['1387666x'])
+        with NormalizationCache(path, readonly=True) as cache:
+            self.assertEqual(cache.standardize_many(journal_issn, ['1387666x', '0034-8910']),
+                             ['1387-666X', '0034-8910'])
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+        # nenhum arquivo foi criado a partir de um caminho truncado em '?' ou '#'
+        self.assertTrue(all(name.startswith('cache?mode=rwc#1 %20.sqlite') for name in os.listdir(self.directory.name)))
+
+    def test_rules_version_invalidates_and_prune(self):
+        with NormalizationCache(self.path, rules_version=1) as cache:
+            cache.standardize_many(journal_issn, ['1387666x', '0034-8910'])
+        with NormalizationCache(self.path, rules_version=2) as cache:
+            self.assertEqual(cache.get_many(journal_issn, ['1387666x']), {})
+            cache.standardize_many(journal_issn, ['1387666x'])
+            self.assertEqual(len(cache), 3)
+            self.assertEqual(cache.prune(), 2)
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(cache.get_many(journal_issn, ['1387666x']), {'1387666x': ('1387-666X', None)})
+
+    def test_batches_larger_than_the_query_limit(self):
+        values = [f'{n:07d}' for n in range(1200)]
+        with NormalizationCache(self.path) as cache:
+            cache.standardize_many(str.upper, values)
+            self.assertEqual(len(cache.get_many(str.upper, values)), 1200)
+
+    def test_shared_by_worker_processes(self):
+        values = ['1387666x', '0034-8910', '1387-6660']
+        with NormalizationCache(self.path) as cache:
+            cache.standardize_many(journal_issn, values[:2], use_issn_validator=True)
+        with multiprocessing.Pool(2) as pool:
+            results = pool.map(_standardize_in_worker, [(self.path, values)] * 2)
+        for standardized, hits, misses in results:
+            self.assertEqual(standardized, ['1387-666X', '0034-8910', None])
+            self.assertEqual((hits, misses), (2, 1))
+        with NormalizationCache(self.path) as cache:
+            self.assertEqual(len(cache), 2)
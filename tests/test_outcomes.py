@@ -0,0 +1,133 @@
+from scielo_scholarly_data import outcomes
+from scielo_scholarly_data.dates import DateDayError, DateMonthError, convert_to_iso_date
+from scielo_scholarly_data.standardizer import (
+    ImpossibleConvertionToIntError,
+    InvalidRomanNumeralError,
+    document_doi,
+    issue_volume,
+    journal_issn,
+    orcid_validator,
+)
+
+from concurrent.futures import ThreadPoolExecutor
+
+import gc
+import multiprocessing
+import threading
+import unittest
+
+
+def _count_in_worker(values):
+    for value in values:
+        journal_issn(value, use_issn_validator=True)
+    return outcomes.drain()
+
+
+class TestOutcomes(unittest.TestCase):
+
+    def setUp(self):
+        outcomes.reset()
+
+    def test_standardizer_outcomes(self):
+        document_doi('10.1590/1678-4766E2016006')
+        document_doi('sem doi')
+        orcid_validator('0000-0002-1825-0097')
+        orcid_validator('0000-0002-1825-0098')
+        orcid_validator('orcid')
+        journal_issn('1387666x', use_issn_validator=True)
+        journal_issn('1387-6660', use_issn_validator=True)
+        journal_issn('ISSN')
+        issue_volume('12')
+        issue_volume('XIV')
+        with self.assertRaises(ImpossibleConvertionToIntError):
+            issue_volume('abc')
+        with self.assertRaises(InvalidRomanNumeralError):
+            issue_volume('IIII')
+        self.assertEqual(outcomes.snapshot(), {
+            'standardizer.document_doi': {'ok': 1, 'invalid doi': 1},
+            'standardizer.orcid_validator': {'ok': 1, 'invalid checksum': 1, 'invalid format': 1},
+            'standardizer.journal_issn': {'ok': 1, 'none': 2},
+            'standardizer.issue_volume': {'ok': 2, 'ImpossibleConvertionToIntError': 1,
+                                          'InvalidRomanNumeralError': 1},
+        })
+
+    def test_date_outcomes(self):
+        convert_to_iso_date('15/03/2021')
+        with self.assertRaises(DateDayError):
+            convert_to_iso_date('32/03/2021')
+        with self.assertRaises(DateMonthError):
+            convert_to_iso_date('2021-13-01')
+        self.assertEqual(outcomes.snapshot()['dates.convert_to_iso_date'],
+                         {'ok': 1, 'DateDayError': 1, 'DateMonthError': 1})
+
+    def test_rates_and_prometheus(self):
+        counts = {'standardizer.document_doi': {'ok': 3, 'invalid doi': 1}}
+        self.assertEqual(outcomes.rates(counts), {'standardizer.document_doi': {'ok': 0.75, 'invalid doi': 0.25}})
+        text = outcomes.to_prometheus(counts)
+        self.assertIn('# TYPE scielo_scholarly_data_outcomes_total counter', text)
+        self.assertIn('scielo_scholarly_data_outcomes_total{function="standardizer.document_doi",outcome="invalid doi"} 1',
+                      text)
+
+    def test_threads(self):
+        def work():
+            for _ in range(1000):
+                document_doi('10.1590/abc')
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(outcomes.snapshot(), {'standardizer.document_doi': {'ok': 8000}})
+        outcomes.reset()
+        self.assertEqual(outcomes.snapshot(), {})
+
+    def test_tables_of_finished_threads_are_released(self):
+        tables = len(outcomes._tables)
+        document_doi('sem doi')
+        self.assertEqual(outcomes.drain(), {'standardizer.document_doi': {'invalid doi': 1}})
+        for _ in range(20):
+            # executores de curta duração, com threads novas a cada lote
+            with ThreadPoolExecutor(4) as executor:
+                list(executor.map(document_doi, ['10.1590/abc'] * 20))
+        gc.collect()
+        self.assertLessEqual(len(outcomes._tables), tables + 1)
+        self.assertEqual(outcomes.snapshot(), {'standardizer.document_doi': {'ok': 400, 'invalid doi': 1}})
+        self.assertEqual(outcomes.drain(), {'standardizer.document_doi': {'ok': 400}})
+        self.assertEqual(outcomes.drain(), {})
+        outcomes.reset()
+        self.assertEqual(outcomes.snapshot(), {})
+
+    def test_drain(self):
+        document_doi('10.1590/abc')
+        document_doi('sem doi')
+        self.assertEqual(outcomes.drain(), {'standardizer.document_doi': {'ok': 1, 'invalid doi': 1}})
+        self.assertEqual(outcomes.drain(), {})
+        document_doi('10.1590/abc')
+        self.assertEqual(outcomes.drain(), {'standardizer.document_doi': {'ok': 1}})
+        self.assertEqual(outcomes.snapshot(), {'standardizer.document_doi': {'ok': 2, 'invalid doi': 1}})
+
+    def test_record(self):
+        document_doi('sem doi')
+        with outcomes.record() as counts:
+            document_doi('10.1590/abc')
+            document_doi('sem doi')
+        self.assertEqual(counts, {'standardizer.document_doi': {'ok': 1, 'invalid doi': 1}})
+        self.assertEqual(outcomes.snapshot(), {'standardizer.document_doi': {'ok': 1, 'invalid doi': 2}})
+        with outcomes.record() as counts:
+            pass
+        self.assertEqual(counts, {})
+
+    def test_merge_process_counts(self):
+        document_doi('sem doi')
+        chunks = [['1387666x'] * 3, ['1387-6660'] * 2, ['2090-4241']]
+        with multiprocessing.Pool(2) as pool:
+            counts = pool.map(_count_in_worker, chunks)
+        self.assertEqual(outcomes.combine(counts), {'standardizer.journal_issn': {'ok': 3, 'none': 3}})
+        for chunk_counts in counts:
+            self.assertNotIn('standardizer.document_doi', chunk_counts)
+
+        outcomes.merge(outcomes.combine(counts))
+        self.assertEqual(outcomes.snapshot(), {
+            'standardizer.document_doi': {'invalid doi': 1},
+            'standardizer.journal_issn': {'ok': 3, 'none': 3},
+        })
@@ -0,0 +1,207 @@
+from scielo_scholarly_data import pipeline as pipeline_module
+from scielo_scholarly_data import standardizer
+from scielo_scholarly_data.pipeline import (
+    compile_pipeline,
+    register_step,
+    UnknownStepError,
+)
+
+from scielo_scholarly_data.values import (
+    JOURNAL_TITLE_SPECIAL_CHARS,
+    JOURNAL_TITLE_SPECIAL_WORDS,
+    PUNCTUATION_TO_DEFINE_PAGE_RANGE,
+    PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_VISUALIZATION,
+)
+
+from itertools import product
+from unittest import mock
+
+import random
+import unittest
+
+
+SPECS = [
+    ['unescape', 'remove_non_printable_chars', 'remove_accents',
+     ('keep_alpha_num_space', {'keep_chars': JOURNAL_TITLE_SPECIAL_CHARS}), 'remove_double_spaces',
+     ('remove_words', {'words_to_remove': JOURNAL_TITLE_SPECIAL_WORDS}), 'lower'],
+    ['unescape', 'remove_non_printable_chars', 'remove_parenthesis', 'remove_accents',
+     'keep_alpha_num_space', 'remove_double_spaces', ('remove_chars', {'chars_to_remove': ['a', 'b']}), 'lower'],
+    ['unescape', 'keep_alpha_num_space', 'remove_non_printable_chars', 'remove_double_spaces',
+     'remove_end_punctuation_chars', 'strip', 'remove_accents', 'lower'],
+    ['unescape', 'remove_non_printable_chars', ('keep_alpha_num_space', {'keep_chars': PUNCTUATION_TO_DEFINE_PAGE_RANGE}),
+     'remove_double_spaces', 'remove_end_punctuation_chars', 'remove_spaces'],
+    ['remove_non_printable_chars', ('keep_alpha_space', {'keep_chars': PUNCTUATION_TO_KEEP_IN_PERSONS_NAME_VISUALIZATION}),
+     'remove_double_spaces', 'strip', 'remove_accents', 'lower', 'order_name_and_surname'],
+    ['remove_non_printable_chars', ('keep_alpha_num_space', {'replace_with': ''}), 'strip'],
+    ['remove_double_spaces', 'remove_double_spaces', ('remove_end_punctuation_chars',
+     {'end_punctuation_chars_to_remove': ['.']}), 'strip'],
+]
+
+# funções do standardizer e valores de cada opção; são testadas todas as combinações
+STANDARDIZER_OPTIONS = [
+    (standardizer.journal_title_for_deduplication, {
+        'words_to_remove': [JOURNAL_TITLE_SPECIAL_WORDS, []],
+        'keep_parenthesis_content': [True, False],
+        'chars_to_remove': [[], ['a', '-']],
+    }),
+    (standardizer.journal_title_for_visualization, {}),
+    (standardizer.journal_issn, {'use_issn_validator': [False, True]}),
+    (standardizer.issue_volume, {'force_integer': [True, False]}),
+    (standardizer.issue_number, {}),
+    (standardizer.document_doi, {'return_mode': ['uri', 'path']}),
+    (standardizer.document_title_for_deduplication, {
+        'remove_special_char': [True, False],
+        'chars_to_remove': [[], ['a', '-']],
+    }),
+    (standardizer.document_title_for_visualization, {'remove_special_char': [True, False]}),
+    (standardizer.document_first_page, {'keep_chars': [PUNCTUATION_TO_DEFINE_PAGE_RANGE, ['-']]}),
+    (standardizer.document_last_page, {'keep_chars': [PUNCTUATION_TO_DEFINE_PAGE_RANGE, ['-']]}),
+    (standardizer.document_elocation, {}),
+    (standardizer.document_publication_date, {'only_year': [False, True]}),
+    (standardizer.document_author_for_visualization, {'surname_first': [True, False]}),
+    (standardizer.document_author_for_deduplication, {
+        'surname_first': [True, False],
+        'chars_to_remove': [[], ['a', '-']],
+    }),
+    (standardizer.book_title_for_deduplication, {
+        'keep_alpha_num_space_chars_only': [True, False],
+        'chars_to_remove': [[], ['a', '-']],
+    }),
+    (standardizer.book_title_for_visualization, {
+        'keep_alpha_num_space_chars_only': [True, False],
+        'chars_to_remove': [[], ['a', '-']],
+    }),
+    (standardizer.book_editor_name_for_visualization, {'keep_alpha_num_space_only': [True, False]}),
+    (standardizer.book_editor_name_for_deduplication, {'keep_alpha_num_space_only': [True, False]}),
+    (standardizer.orcid_validator, {'return_mode': ['uri', 'path']}),
+    (standardizer.document_sponsors, {'remove_special_char': [True, False]}),
+    (standardizer.book_title, {}),
+    (standardizer.book_editor_address, {}),
+    (standardizer.chapter_title, {}),
+]
+
+
+def standardizer_calls():
+    for function, options in STANDARDIZER_OPTIONS:
+        names = list(options)
+        for values in product(*(options[name] for name in names)):
+            yield function, dict(zip(names, values))
+
+
+def call(function, text, options):
+    try:
+        return function(text, **options)
+    except Exception as exc:
+        return type(exc)
+
+
+ALPHABET = 'aAbBçÇéÉãõñü ¨\xa0\t\n\x7f\x01-.,;:()&@+$°´' + 'Ñandú'
+
+
+def random_texts(size=500, seed=0):
+    rnd = random.Random(seed)
+    texts = ['', ' ', '&amp;', 'Agrociencia &amp; (Uruguay) online', 'Silva, João']
+    for _ in range(size):
+        texts.append(''.join(rnd.choice(ALPHABET) for _ in range(rnd.randint(0, 30))))
+    return texts
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_compile_pipeline_merges_adjacent_char_filters(self):
+        pipeline = compile_pipeline(['unescape', 'remove_non_printable_chars', 'remove_accents', 'keep_alpha_num_space', 'lower'])
+        self.assertEqual(
+            pipeline.steps,
+            ('unescape', 'remove_non_printable_chars+remove_accents+keep_alpha_num_space', 'lower')
+        )
+
+    def test_compile_pipeline_drops_redundant_steps(self):
+        pipeline = compile_pipeline(['remove_parenthesis', 'remove_double_spaces', 'lower', 'strip'])
+        self.assertEqual(pipeline.steps, ('remove_parenthesis', 'lower'))
+
+    def test_compile_pipeline_keeps_steps_after_char_filter(self):
+        pipeline = compile_pipeline(['remove_double_spaces', 'remove_accents', 'remove_double_spaces'])
+        self.assertEqual(pipeline.steps, ('remove_double_spaces', 'remove_accents', 'remove_double_spaces'))
+
+    def test_compile_pipeline_keeps_strip_when_end_punctuation_may_leave_spaces(self):
+        pipeline = compile_pipeline([
+            'remove_double_spaces',
+            ('remove_end_punctuation_chars', {'end_punctuation_chars_to_remove': ['.']}),
+            'strip',
+        ])
+        self.assertEqual(pipeline.steps, ('remove_double_spaces', 'remove_end_punctuation_chars', 'strip'))
+        self.assertEqual(pipeline('a .'), 'a')
+
+    def test_compile_pipeline_matches_unoptimized_pipeline(self):
+        texts = random_texts()
+        for spec in SPECS:
+            optimized = compile_pipeline(spec)
+            reference = compile_pipeline(spec, optimize=False)
+            for text in texts:
+                self.assertEqual(optimized(text), reference(text), (spec, text))
+
+    def test_is_canonical_agrees_with_unoptimized_pipeline(self):
+        texts = random_texts(seed=1)
+        for spec in SPECS:
+            optimized = compile_pipeline(spec)
+            reference = compile_pipeline(spec, optimize=False)
+            canonical = 0
+            for text in texts + [reference(t) for t in texts]:
+                if optimized.is_canonical(text):
+                    canonical += 1
+                    self.assertEqual(reference(text), text, (spec, text))
+            self.assertGreater(canonical, 0, spec)
+
+    def test_canonical_shortcut_does_not_change_standardizer_results(self):
+        texts = random_texts(size=200, seed=2) + [
+            'Kennedy, John Fitzgerald', 'kennedy, john fitzgerald', '120-130', 'xiv', '15', '2021-03-15',
+            '1387-666X', '10.1590/abc', '0000-0002-1825-0097', 'Revista de Saude Publica', 'sao paulo',
+        ]
+        for function, options in standardizer_calls():
+            # as saídas do próprio padronizador são incluídas, pois são as entradas que usam o atalho
+            inputs = texts + [r for r in (call(function, t, options) for t in texts) if isinstance(r, str)]
+            shortcut = [call(function, text, options) for text in inputs]
+            with mock.patch.object(pipeline_module.Pipeline, 'is_canonical', return_value=False):
+                reference = [call(function, text, options) for text in inputs]
+            for text, result, expected in zip(inputs, shortcut, reference):
+                self.assertEqual(result, expected, (function.__name__, options, text))
+
+    def test_is_canonical_clean_deduplication_key(self):
+        pipeline = compile_pipeline(SPECS[2])
+        self.assertTrue(pipeline.is_canonical('innovacion tecnologica en la resolucion de problematicas'))
+        self.assertFalse(pipeline.is_canonical('innovacion  tecnologica'))
+        self.assertFalse(pipeline.is_canonical('Innovacion tecnologica'))
+        self.assertFalse(pipeline.is_canonical('innovación tecnologica'))
+        self.assertFalse(pipeline.is_canonical('innovacion tecnologica.'))
+
+    def test_is_canonical_ordered_name(self):
+        pipeline = compile_pipeline(SPECS[4])
+        self.assertTrue(pipeline.is_canonical('kennedy, john fitzgerald'))
+        self.assertFalse(pipeline.is_canonical('john fitzgerald kennedy'))
+        self.assertFalse(pipeline.is_canonical('kennedy,john'))
+
+    def register_temporary_step(self, name, function):
+        # remove a etapa do registro global (e os pipelines compilados com ela) ao final do teste
+        self.assertNotIn(name, pipeline_module.STEPS)
+        register_step(name, function)
+        self.addCleanup(pipeline_module._compile.cache_clear)
+        self.addCleanup(pipeline_module.STEPS.pop, name)
+
+    def test_is_canonical_unknown_check(self):
+        self.register_temporary_step('reverse', lambda text: text[::-1])
+        self.assertFalse(compile_pipeline(['lower', 'reverse']).is_canonical('aba'))
+
+    def test_compile_pipeline_is_cached(self):
+        self.assertIs(compile_pipeline(['unescape', 'lower']), compile_pipeline(['unescape', 'lower']))
+
+    def test_compile_pipeline_custom_field(self):
+        affiliation = compile_pipeline(['unescape', 'remove_parenthesis', 'remove_accents', 'keep_alpha_num_space',
+                                        'remove_double_spaces', 'lower'])
+        self.assertEqual(affiliation('Universidade de São Paulo (USP) &amp; Faculdade'), 'universidade de sao paulo faculdade')
+
+    def test_compile_pipeline_unknown_step(self):
+        self.assertRaises(UnknownStepError, compile_pipeline, ['unescape', 'remove_everything'])
+
+    def test_register_step(self):
+        self.register_temporary_step('upper', str.upper)
+        self.assertEqual(compile_pipeline(['remove_accents', 'upper'])('ação'), 'ACAO')
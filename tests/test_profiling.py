@@ -0,0 +1,123 @@
+from scielo_scholarly_data import profiling
+from scielo_scholarly_data.pipeline import Pipeline, compile_pipeline
+from scielo_scholarly_data.standardizer import (
+    document_doi,
+    document_publication_date,
+    document_title_for_deduplication,
+    issue_volume,
+    journal_issn,
+    journal_title_for_deduplication,
+    orcid_validator,
+)
+
+import os
+import subprocess
+import sys
+import unittest
+
+
+class TestProfiling(unittest.TestCase):
+
+    def tearDown(self):
+        profiling.disable()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(profiling.active_profiler())
+        self.assertIs(Pipeline.__call__, Pipeline._call)
+
+    def test_profile_records_steps_per_function(self):
+        with profiling.profile() as profiler:
+            self.assertIs(Pipeline.__call__, Pipeline._profiled_call)
+            document_title_for_deduplication(' Zoology &amp; (of) the Amazon!! ')
+            document_title_for_deduplication('zoology of the amazon')
+            journal_title_for_deduplication('Agrociencia &amp;   (Uruguay)')
+        self.assertIs(Pipeline.__call__, Pipeline._call)
+
+        data = profiler.to_dict()
+        self.assertEqual(set(data), {
+            'standardizer.document_title_for_deduplication',
+            'standardizer.journal_title_for_deduplication',
+        })
+        title = data['standardizer.document_title_for_deduplication']
+        self.assertEqual(title[profiling.CANONICAL_CHECK_STEP]['calls'], 2)
+        self.assertEqual(title['unescape']['calls'], 1)
+        self.assertEqual(title['unescape']['input_length_sum'], len(' Zoology &amp; (of) the Amazon!! '))
+        self.assertEqual(title['unescape']['input_length_histogram']['32'], 0)
+        self.assertEqual(title['unescape']['input_length_histogram']['64'], 1)
+        self.assertGreaterEqual(title['unescape']['seconds'], 0)
+
+    def test_profile_records_date_parsing(self):
+        with profiling.profile() as profiler:
+            document_publication_date('15 de março de 2021')
+            with self.assertRaises(Exception):
+                document_publication_date('sem data')
+        steps = profiler.to_dict()['standardizer.document_publication_date']
+        self.assertEqual(steps['convert_to_iso_date']['calls'], 2)
+        self.assertEqual(steps[profiling.FUNCTION_STEP]['calls'], 2)
+        self.assertEqual(profiler.to_dict()['dates.convert_to_iso_date'][profiling.FUNCTION_STEP]['calls'], 2)
+
+    def test_profile_records_functions_without_pipelines(self):
+        with profiling.profile() as profiler:
+            journal_issn('1387666x', use_issn_validator=True)
+            document_doi('10.1590/1678-4766E2016006')
+            orcid_validator('0000-0002-1825-0097')
+            self.assertEqual(issue_volume('XIV'), '14')
+        data = profiler.to_dict()
+        for function in ('standardizer.journal_issn', 'standardizer.document_doi', 'standardizer.orcid_validator',
+                         'standardizer.issue_volume', 'core.roman_to_int'):
+            self.assertEqual(data[function][profiling.FUNCTION_STEP]['calls'], 1)
+        self.assertEqual(data['standardizer.journal_issn'][profiling.FUNCTION_STEP]['input_length_sum'], 8)
+        self.assertEqual(profiling.current_function(), profiling.UNNAMED_FUNCTION)
+
+    def test_decorated_function_keeps_its_label_on_errors(self):
+        with profiling.profile() as profiler:
+            with self.assertRaises(Exception):
+                issue_volume('IIII')
+            compile_pipeline(['lower'])('ABC')
+        data = profiler.to_dict()
+        self.assertEqual(data['standardizer.issue_volume'][profiling.FUNCTION_STEP]['calls'], 1)
+        self.assertEqual(data[profiling.UNNAMED_FUNCTION]['lower']['calls'], 1)
+
+    def test_nested_profile_restores_previous(self):
+        outer = profiling.enable()
+        with profiling.profile() as inner:
+            compile_pipeline(['lower'])('ABC')
+        self.assertIs(profiling.active_profiler(), outer)
+        self.assertIs(Pipeline.__call__, Pipeline._profiled_call)
+        self.assertEqual(inner.to_dict()[profiling.UNNAMED_FUNCTION]['lower']['calls'], 1)
+        self.assertEqual(outer.to_dict(), {})
+
+    def test_results_are_unchanged(self):
+        texts = [' Zoology &amp; (of) the Amazon!! ', 'zoology', '']
+        expected = [document_title_for_deduplication(t) for t in texts]
+        with profiling.profile():
+            self.assertEqual([document_title_for_deduplication(t) for t in texts], expected)
+
+    def test_to_prometheus(self):
+        profiler = profiling.Profiler(buckets=(4, 8))
+        profiler.record('standardizer.x', 'lower', 3, 1000)
+        profiler.record('standardizer.x', 'lower', 6, 2000)
+        profiler.record('standardizer.x', 'lower', 60, 3000)
+        text = profiler.to_prometheus()
+        labels = 'function="standardizer.x",step="lower"'
+        self.assertIn('# TYPE scielo_scholarly_data_step_calls_total counter', text)
+        self.assertIn(f'scielo_scholarly_data_step_calls_total{{{labels}}} 3', text)
+        self.assertIn(f'scielo_scholarly_data_step_seconds_total{{{labels}}} 0.000006000', text)
+        self.assertIn(f'scielo_scholarly_data_step_input_length_bucket{{{labels},le="4"}} 1', text)
+        self.assertIn(f'scielo_scholarly_data_step_input_length_bucket{{{labels},le="8"}} 2', text)
+        self.assertIn(f'scielo_scholarly_data_step_input_length_bucket{{{labels},le="+Inf"}} 3', text)
+        self.assertIn(f'scielo_scholarly_data_step_input_length_sum{{{labels}}} 69', text)
+        self.assertIn(f'scielo_scholarly_data_step_input_length_count{{{labels}}} 3', text)
+
+        profiler.reset()
+        self.assertEqual(profiler.to_dict(), {})
+
+    def test_enabled_by_environment(self):
+        code = (
+            'from scielo_scholarly_data import profiling, standardizer;'
+            'standardizer.document_sponsors("CNPq");'
+            'print(profiling.active_profiler().to_dict()["standardizer.document_sponsors"]["is_canonical"]["calls"])'
+        )
+        env = dict(os.environ, **{profiling.PROFILE_ENVIRONMENT_VARIABLE: '1'})
+        output = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), '1')
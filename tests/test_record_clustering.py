@@ -0,0 +1,63 @@
+from scielo_scholarly_data.fingerprint import document_fingerprint
+from scielo_scholarly_data.record_clustering import (
+    doi_key,
+    DuplicateClusterer,
+    key_edges,
+    orcid_key,
+    read_binary_edges,
+    read_edges,
+    write_binary_edges,
+)
+from scielo_scholarly_data.sorted_neighborhood import write_pairs
+
+import os
+import tempfile
+import unittest
+
+
+RECORDS = [
+    {'doi': 'https://doi.org/10.1590/ABC', 'orcid': None, 'title': 'A title', 'year': 2020},
+    {'doi': '10.1590/abc', 'orcid': None, 'title': 'A title.', 'year': 2020},
+    {'doi': None, 'orcid': None, 'title': 'A TITLE', 'year': '2021'},
+    {'doi': None, 'orcid': '0000-0002-1694-233X', 'title': 'Another title', 'year': 2019},
+    {'doi': None, 'orcid': 'https://orcid.org/0000-0002-1694-233X', 'title': 'Other', 'year': 2001},
+    {'doi': 'invalid', 'orcid': None, 'title': 'Unrelated', 'year': 2001},
+]
+
+
+class TestRecordClustering(unittest.TestCase):
+
+    def test_keys(self):
+        self.assertEqual(doi_key('https://doi.org/10.1590/ABC'), '10.1590/abc')
+        self.assertIsNone(doi_key('invalid'))
+        self.assertIsNone(doi_key(None))
+        self.assertEqual(orcid_key('https://orcid.org/0000-0002-1694-233X'), '0000-0002-1694-233X')
+        self.assertIsNone(orcid_key('0000-0002-1694-2331'))
+
+    def test_key_edges(self):
+        self.assertEqual(list(key_edges(['a', None, 'b', 'a', '', 'a', 7, 7])), [(0, 3), (0, 5), (6, 7)])
+
+    def test_duplicate_clusterer(self):
+        clusterer = DuplicateClusterer(len(RECORDS))
+        self.assertEqual(clusterer.add_keys(doi_key(r['doi']) for r in RECORDS), 1)
+        self.assertEqual(clusterer.add_keys(orcid_key(r['orcid']) for r in RECORDS), 1)
+        clusterer.add_keys(document_fingerprint(title=r['title'], year=r['year']) for r in RECORDS)
+        self.assertEqual(list(clusterer.labels()), [0, 0, 1, 2, 2, 3])
+        self.assertEqual(clusterer.add_edges([(1, 2, 0.9)]), 1)
+        self.assertEqual(list(clusterer.labels()), [0, 0, 0, 1, 1, 2])
+        self.assertEqual(clusterer.cluster(2), clusterer.cluster(0))
+
+    def test_edges_from_disk(self):
+        edges = [(0, 1), (2, 3), (5, 8)]
+        with tempfile.TemporaryDirectory() as directory:
+            text_path = os.path.join(directory, 'edges.tsv')
+            binary_path = os.path.join(directory, 'edges.bin')
+            write_pairs(edges, text_path)
+            self.assertEqual(write_binary_edges(edges, binary_path), 3)
+            self.assertEqual(list(read_edges(text_path)), edges)
+            self.assertEqual(list(read_binary_edges(binary_path, chunk_size=2)), edges)
+
+            clusterer = DuplicateClusterer()
+            clusterer.add_edges(read_binary_edges(binary_path))
+            self.assertEqual(len(clusterer), 9)
+            self.assertEqual(list(clusterer.labels()), [0, 0, 1, 1, 2, 3, 4, 5, 3])
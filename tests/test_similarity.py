@@ -0,0 +1,62 @@
+from scielo_scholarly_data.similarity import (
+    jaccard_similarity,
+    levenshtein_distance,
+    levenshtein_similarity,
+    match_candidates,
+    token_set_similarity,
+)
+
+import random
+import unittest
+
+
+def _dynamic_programming_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+class TestSimilarity(unittest.TestCase):
+
+    def test_levenshtein_distance(self):
+        self.assertEqual(levenshtein_distance('revista', 'revsita'), 2)
+        self.assertEqual(levenshtein_distance('kitten', 'sitting'), 3)
+        self.assertEqual(levenshtein_distance('', 'abc'), 3)
+        self.assertEqual(levenshtein_distance('abc', ''), 3)
+        self.assertEqual(levenshtein_distance('', ''), 0)
+
+    def test_levenshtein_distance_random(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            a = ''.join(rng.choice('abc ') for _ in range(rng.randint(0, 80)))
+            b = ''.join(rng.choice('abc ') for _ in range(rng.randint(0, 80)))
+            expected = _dynamic_programming_distance(a, b)
+            self.assertEqual(levenshtein_distance(a, b), expected)
+            self.assertEqual(levenshtein_distance(a, b, max_distance=5), min(expected, 6))
+
+    def test_levenshtein_similarity(self):
+        self.assertAlmostEqual(levenshtein_similarity('revista', 'revsita'), 5 / 7)
+        self.assertEqual(levenshtein_similarity('revista', 'revsita', threshold=0.8), 0.0)
+        self.assertEqual(levenshtein_similarity('', ''), 1.0)
+
+    def test_jaccard_similarity(self):
+        self.assertEqual(jaccard_similarity('silva joao', 'joao silva'), 1.0)
+        self.assertAlmostEqual(jaccard_similarity('a b c', 'a b d'), 0.5)
+        self.assertEqual(jaccard_similarity('', ''), 1.0)
+
+    def test_token_set_similarity(self):
+        self.assertEqual(token_set_similarity('silva joao', 'joao da silva'), 1.0)
+        self.assertAlmostEqual(token_set_similarity('joao silva', 'maria silva'), levenshtein_similarity('silva joao', 'silva maria'))
+        self.assertEqual(token_set_similarity('abc', 'xyz', threshold=0.5), 0.0)
+
+    def test_match_candidates(self):
+        self.assertEqual(
+            match_candidates('revista', ['revsita', 'revista', 'journal', ''], threshold=0.7),
+            [(1, 1.0), (0, 5 / 7)],
+        )
+        self.assertEqual(match_candidates('revista', ['revsita', 'revista'], threshold=0.7, limit=1), [(1, 1.0)])
+        self.assertEqual(match_candidates('', ['', 'a']), [(0, 1.0)])
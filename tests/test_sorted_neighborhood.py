@@ -0,0 +1,60 @@
+from scielo_scholarly_data.sorted_neighborhood import (
+    sorted_neighborhood_pairs,
+    title_year_key,
+    write_pairs,
+)
+
+import os
+import tempfile
+import unittest
+
+
+TITLES = [
+    ('Zoology of the Amazon', 2019),
+    ('Avaliação da qualidade da água', 2020),
+    ('Another paper', 2001),
+    ('AVALIAÇÃO DA QUALIDADE DA ÁGUA.', '2020-05'),
+    ('', 2020),
+    ('Zoology of the Amazon', 2019),
+]
+
+
+class TestSortedNeighborhood(unittest.TestCase):
+
+    def test_title_year_key(self):
+        self.assertEqual(title_year_key('A Title.', 'March 2020'), 'a title 2020')
+        self.assertEqual(title_year_key('A Title.'), 'a title')
+        self.assertEqual(title_year_key(None, 2020), '')
+
+    def test_sorted_neighborhood_pairs(self):
+        keys = [title_year_key(t, y) for t, y in TITLES]
+        expected = [(1, 2), (1, 3), (0, 3), (0, 5)]
+        for chunk_size, fan_in in [(100, 128), (1, 2), (2, 2)]:
+            pairs = list(sorted_neighborhood_pairs(iter(keys), window=2, chunk_size=chunk_size, fan_in=fan_in))
+            self.assertEqual(pairs, expected)
+
+    def test_sorted_neighborhood_pairs_compare(self):
+        keys = [title_year_key(t, y) for t, y in TITLES]
+        pairs = set(sorted_neighborhood_pairs(keys, window=3, chunk_size=2))
+        self.assertIn((2, 3), pairs)
+        pairs = list(sorted_neighborhood_pairs(keys, window=3, chunk_size=2, compare=lambda a, b: a == b))
+        self.assertEqual(pairs, [(1, 3), (0, 5)])
+
+    def test_sorted_neighborhood_pairs_line_separators_in_keys(self):
+        keys = ['abc', 'ab\rd', 'abe', 'ab\x85f', 'ab\u2028g', 'ab\nh']
+        for chunk_size, fan_in in [(100, 128), (2, 2)]:
+            pairs = set(sorted_neighborhood_pairs(keys, window=3, chunk_size=chunk_size, fan_in=fan_in))
+            self.assertEqual(len(pairs), 2 * len(keys) - 3)
+        seen = set()
+        list(sorted_neighborhood_pairs(keys, window=2, compare=lambda a, b: seen.update((a, b))))
+        self.assertEqual(seen, set(keys[:-1]) | {'ab h'})
+
+    def test_sorted_neighborhood_pairs_invalid_window(self):
+        self.assertRaises(ValueError, list, sorted_neighborhood_pairs([], window=1))
+
+    def test_write_pairs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'pairs.tsv')
+            self.assertEqual(write_pairs(iter([(1, 3), (0, 5)]), path), 2)
+            with open(path) as fp:
+                self.assertEqual(fp.read(), '1\t3\n0\t5\n')
@@ -1,8 +1,11 @@
 from scielo_scholarly_data.standardizer import (
+    book_editor_address,
     book_editor_name_for_visualization,
     book_editor_name_for_deduplication,
     book_title_for_deduplication,
+    book_title,
     book_title_for_visualization,
+    chapter_title,
     document_author_for_visualization,
     document_author_for_deduplication,
     document_doi,
@@ -134,6 +137,10 @@ class TestStandardizer(unittest.TestCase):
 
         self.assertListEqual([None for x in range(len(wrong_issns))], obtained_values)
 
+    def test_journal_issn_trailing_newline(self):
+        for issn in ['1387-666X\n', '1387-666x\n', '1387666x\n']:
+            self.assertIsNone(journal_issn(issn))
+
     def test_journal_issn_with_char(self):
         issns = {
             '1585x6280': None,
@@ -983,3 +990,31 @@ class TestStandardizer(unittest.TestCase):
             document_title_for_deduplication('Fundação de Amparo a Pesquisa do Estado de São Paulo Biota Program'),
             'fundacao de amparo a pesquisa do estado de sao paulo biota program'
         )
+
+    def test_journal_issn_canonical(self):
+        for issn in ['1387-666X', '0034-8910', '2090-424X']:
+            self.assertEqual(journal_issn(issn), issn)
+        self.assertEqual(journal_issn('2090-424X', use_issn_validator=True), '2090-424X')
+        self.assertIsNone(journal_issn('2090-4241', use_issn_validator=True))
+        self.assertEqual(journal_issn('1387-666x'), '1387-666X')
+
+    def test_issue_volume_canonical(self):
+        for volume in ['1', '15', '0012', '2021']:
+            self.assertEqual(issue_volume(volume), volume)
+            self.assertEqual(issue_volume(volume, force_integer=False), volume)
+        self.assertEqual(issue_volume('٣'), '٣')
+
+    def test_document_pages_canonical(self):
+        self.assertEqual(document_first_page('120'), '120')
+        self.assertEqual(document_last_page('130'), '130')
+
+    def test_book_title(self):
+        self.assertEqual(book_title(' Dom  Casmurro: romance. '), 'Dom Casmurro: romance')
+        self.assertEqual(book_title('Sa&uacute;de P&uacute;blica'), 'Saúde Pública')
+
+    def test_book_editor_address(self):
+        self.assertEqual(book_editor_address('[São Paulo] :'), 'São Paulo')
+        self.assertEqual(book_editor_address('Rio de Janeiro,  RJ;'), 'Rio de Janeiro, RJ')
+
+    def test_chapter_title(self):
+        self.assertEqual(chapter_title('Cap&iacute;tulo  1: Introdu\u00e7\u00e3o.'), 'Capítulo 1: Introdução')
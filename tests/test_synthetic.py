@@ -0,0 +1,62 @@
+from scielo_scholarly_data.standardizer import (
+    document_doi,
+    journal_issn,
+    orcid_validator,
+)
+from scielo_scholarly_data.synthetic import (
+    generate_citations,
+    read_jsonl,
+    write_jsonl,
+    write_parquet,
+)
+
+import os
+import tempfile
+import unittest
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestSynthetic(unittest.TestCase):
+
+    def test_generate_citations_is_reproducible(self):
+        self.assertEqual(list(generate_citations(50, seed=7)), list(generate_citations(50, seed=7)))
+        self.assertNotEqual(list(generate_citations(50, seed=7)), list(generate_citations(50, seed=8)))
+
+    def test_generate_citations_duplicate_rate(self):
+        records = list(generate_citations(2000, seed=1, duplicate_rate=0.3))
+        duplicates = sum(1 for r in records if r['id'] != r['cluster_id'])
+        self.assertGreater(duplicates, 450)
+        self.assertLess(duplicates, 750)
+        self.assertTrue(all(r['cluster_id'] <= r['id'] for r in records))
+        self.assertFalse(any(r['id'] != r['cluster_id'] for r in generate_citations(200, duplicate_rate=0)))
+
+    def test_generate_citations_values(self):
+        records = list(generate_citations(500, seed=2, journals=10, noise_rate=0.5))
+        self.assertLessEqual(len({journal_issn(r['issn']) for r in records}), 10)
+        for record in records:
+            self.assertIsNotNone(journal_issn(record['issn'], use_issn_validator=True))
+            if record['orcid']:
+                self.assertIsInstance(orcid_validator(record['orcid'].strip(), return_mode='path'), str)
+            if record['doi']:
+                self.assertIsInstance(document_doi(record['doi'], return_mode='path'), str)
+        self.assertTrue(any('&' in r['title'] and ';' in r['title'] for r in records))
+        self.assertTrue(any(not r['title'].isprintable() for r in records))
+        self.assertTrue(any(r['volume'].isalpha() for r in records))
+
+    def test_write_jsonl(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'citations.jsonl')
+            self.assertEqual(write_jsonl(generate_citations(20), path), 20)
+            self.assertEqual(list(read_jsonl(path)), list(generate_citations(20)))
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow não está instalado')
+    def test_write_parquet(self):
+        import pyarrow.parquet as pq
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'citations.parquet')
+            self.assertEqual(write_parquet(generate_citations(25), path, batch_size=10), 25)
+            self.assertEqual(pq.read_table(path).num_rows, 25)
@@ -0,0 +1,85 @@
+from benchmarks import throughput
+from scielo_scholarly_data.synthetic import generate_citations
+
+import unittest
+
+
+class TestThroughput(unittest.TestCase):
+
+    def test_worker_counts(self):
+        self.assertEqual(throughput.worker_counts(1), [1])
+        self.assertEqual(throughput.worker_counts(8), [1, 2, 4, 8])
+        self.assertEqual(throughput.worker_counts(6), [1, 2, 4, 6])
+
+    def test_standardize_record(self):
+        record = {
+            'title': 'Zoology (of) the  Amazon!! ',
+            'authors': 'Silva, João; Souza, Maria',
+            'orcid': 'https://orcid.org/0000-0002-1825-0097',
+            'journal': 'Agrociencia &amp;   (Uruguay)',
+            'issn': '1387666x',
+            'volume': '15',
+            'number': '2',
+            'pages': '120-130',
+            'publication_date': '2021-03-15',
+            'doi': 'https://doi.org/10.1590/ABC',
+            'sponsor': None,
+        }
+        standardized, fingerprint, errors = throughput.standardize_record(record)
+        self.assertEqual(standardized['issn'], '1387-666X')
+        self.assertEqual(standardized['orcid'], '0000-0002-1825-0097')
+        self.assertEqual(standardized['doi'], '10.1590/ABC')
+        self.assertEqual(len(standardized['authors']), 2)
+        self.assertIsNone(standardized['sponsor'])
+        self.assertIsInstance(fingerprint, int)
+        self.assertEqual(errors, 0)
+
+    def test_standardize_record_counts_errors(self):
+        _, _, errors = throughput.standardize_record({'orcid': '0000-0002-1825-0098', 'issn': '1234-5678'})
+        self.assertEqual(errors, 2)
+
+    def test_run_and_format_report(self):
+        report = throughput.run(records=300, workers=[2, 1], chunk_size=50, seed=3)
+        self.assertEqual([r['workers'] for r in report['results']], [1, 2])
+        first, second = report['results']
+        self.assertEqual(first['parallel_efficiency'], 1.0)
+        self.assertAlmostEqual(second['parallel_efficiency'], second['speedup'] / 2)
+        for result in report['results']:
+            self.assertEqual(result['records'], 300)
+            self.assertGreater(result['records_per_second'], 0)
+            self.assertIsNone(result['cache_hit_rate'])
+            self.assertLess(result['distinct_records'], 300)
+            self.assertEqual(sum(result['outcomes']['standardizer.journal_issn'].values()), 300)
+        self.assertEqual(first['distinct_records'], second['distinct_records'])
+
+        ratios = throughput.compare(report, report)
+        self.assertEqual(ratios, {1: 1.0, 2: 1.0})
+        table = throughput.format_report(report, report)
+        self.assertIn('vs baseline', table)
+        self.assertIn('records=300', table)
+
+    def test_value_cache_hit_rate(self):
+        corpus = list(generate_citations(300, seed=3))
+        uncached = throughput.run_workers(corpus, 1, chunk_size=50)
+        cached = throughput.run_workers(corpus, 2, chunk_size=50, cache_capacity=100)
+        self.assertEqual(cached['cache_hits'] + cached['cache_misses'], sum(
+            1 for record in corpus for _, field, _, _ in throughput._RECORD_FIELDS if record.get(field)
+        ))
+        self.assertGreater(cached['cache_hit_rate'], 0.0)
+        self.assertLess(cached['cache_hit_rate'], 1.0)
+        self.assertEqual(cached['distinct_records'], uncached['distinct_records'])
+        self.assertEqual(cached['field_errors'], uncached['field_errors'])
+
+    def test_cached_fields_match_uncached(self):
+        fields = throughput.cached_fields(50)
+        for record in generate_citations(100, seed=7):
+            self.assertEqual(throughput.standardize_record(record, fields), throughput.standardize_record(record))
+        hits, misses = throughput.cache_info(fields)
+        self.assertGreater(hits, 0)
+        self.assertEqual(throughput.cache_info(throughput._RECORD_FIELDS), (0, 0))
+
+    def test_fingerprints_match_serial_run(self):
+        corpus = list(generate_citations(200, seed=5))
+        serial = {throughput.standardize_record(record)[1] for record in corpus} - {None}
+        result = throughput.run_workers(corpus, 2, chunk_size=30)
+        self.assertEqual(result['distinct_records'], len(serial))
@@ -0,0 +1,37 @@
+from scielo_scholarly_data.unionfind import UnionFind
+
+import unittest
+
+
+class TestUnionFind(unittest.TestCase):
+
+    def test_union_find(self):
+        uf = UnionFind(6)
+        uf.union(0, 1)
+        uf.union(2, 3)
+        uf.union(1, 3)
+        self.assertTrue(uf.connected(0, 2))
+        self.assertFalse(uf.connected(0, 4))
+        self.assertEqual(list(uf.labels()), [0, 0, 0, 0, 1, 2])
+
+    def test_union_find_add_and_grow(self):
+        uf = UnionFind()
+        self.assertEqual(uf.add(), 0)
+        self.assertEqual(uf.add(), 1)
+        uf.grow(4)
+        self.assertEqual(len(uf), 4)
+        uf.union(3, 0)
+        self.assertEqual(uf.find(3), uf.find(0))
+        self.assertEqual(list(uf.labels()), [0, 1, 2, 0])
+
+    def test_union_find_long_chain(self):
+        uf = UnionFind(10000)
+        for i in range(1, 10000):
+            uf.union(i - 1, i)
+        self.assertEqual(set(uf.labels()), {0})
+
+    def test_union_find_union_pairs(self):
+        uf = UnionFind(2)
+        self.assertEqual(uf.union_pairs(iter([(0, 1), (3, 2), (1, 0), (2, 5)])), 3)
+        self.assertEqual(len(uf), 6)
+        self.assertEqual(list(uf.labels()), [0, 0, 1, 1, 2, 1])